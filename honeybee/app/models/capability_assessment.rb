@@ -14,6 +14,7 @@ class CapabilityAssessment < ApplicationRecord
 
   validates :person, presence: true
   validates :skill, presence: true
+  validates :skill_id, uniqueness: { scope: [:person_type, :person_id] }
   validates :proficiency, presence: true
   validates :confidence_score, numericality: { greater_than_or_equal_to: 0, less_than_or_equal_to: 1 }, allow_nil: true
 end
@@ -0,0 +1,7 @@
+class AddCandidateEvaluatedAtIndexToSwarmDecisions < ActiveRecord::Migration[8.0]
+  def change
+    # Supports keyset pagination of a candidate's evaluation history
+    add_index :swarm_decisions, [:candidate_id, :evaluated_at, :id],
+              name: "index_swarm_decisions_on_candidate_evaluated_at_id"
+  end
+end
@@ -0,0 +1,21 @@
+class AddUniqueIndexToCapabilityAssessments < ActiveRecord::Migration[8.0]
+  def up
+    # Keep the most recently updated assessment per person and skill
+    execute <<~SQL
+      DELETE FROM capability_assessments a
+      USING capability_assessments b
+      WHERE a.person_type = b.person_type
+        AND a.person_id = b.person_id
+        AND a.skill_id = b.skill_id
+        AND (a.updated_at, a.id) < (b.updated_at, b.id)
+    SQL
+
+    # Conflict target for the AI service's bulk upserts
+    add_index :capability_assessments, [:person_type, :person_id, :skill_id],
+              unique: true, name: "idx_unique_capability_per_person_skill"
+  end
+
+  def down
+    remove_index :capability_assessments, name: "idx_unique_capability_per_person_skill"
+  end
+end
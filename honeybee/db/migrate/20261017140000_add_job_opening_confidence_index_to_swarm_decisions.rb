@@ -0,0 +1,8 @@
+class AddJobOpeningConfidenceIndexToSwarmDecisions < ActiveRecord::Migration[8.0]
+  def change
+    # Supports the AI service's top-candidates ranking for a job opening
+    # (ORDER BY overall_confidence DESC, id DESC)
+    add_index :swarm_decisions, [:job_opening_id, :overall_confidence, :id],
+              name: "index_swarm_decisions_on_job_opening_confidence_id"
+  end
+end
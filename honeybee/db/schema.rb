@@ -10,7 +10,7 @@
 #
 # It's strongly recommended that you check this file into your version control system.
 
-ActiveRecord::Schema[8.0].define(version: 2025_10_22_213539) do
+ActiveRecord::Schema[8.0].define(version: 2026_10_17_140000) do
   # These are extensions that must be enabled in order to support this database
   enable_extension "pg_catalog.plpgsql"
 
@@ -39,6 +39,7 @@ ActiveRecord::Schema[8.0].define(version: 2025_10_22_213539) do
     t.decimal "confidence_score"
     t.datetime "created_at", null: false
     t.datetime "updated_at", null: false
+    t.index ["person_type", "person_id", "skill_id"], name: "idx_unique_capability_per_person_skill", unique: true
     t.index ["person_type", "person_id"], name: "index_capability_assessments_on_person"
     t.index ["skill_id"], name: "index_capability_assessments_on_skill_id"
   end
@@ -104,7 +105,9 @@ ActiveRecord::Schema[8.0].define(version: 2025_10_22_213539) do
     t.datetime "evaluated_at"
     t.datetime "created_at", null: false
     t.datetime "updated_at", null: false
+    t.index ["candidate_id", "evaluated_at", "id"], name: "index_swarm_decisions_on_candidate_evaluated_at_id"
     t.index ["candidate_id"], name: "index_swarm_decisions_on_candidate_id"
+    t.index ["job_opening_id", "overall_confidence", "id"], name: "index_swarm_decisions_on_job_opening_confidence_id"
     t.index ["job_opening_id"], name: "index_swarm_decisions_on_job_opening_id"
   end
 
@@ -3,10 +3,24 @@ Base Agent - Abstract class for all AI agents
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from pydantic import BaseModel
-import openai
+import hashlib
+import json
 import os
+import re
+import time
+
+from app.agents.llm_cache import get_llm_cache
+from app.agents.llm_client import get_llm_client
+from app.metrics import (
+    LLM_COMPLETION_TOKENS,
+    LLM_LATENCY,
+    LLM_PROMPT_TOKENS,
+    LLM_TOKENS,
+    agent_label,
+)
+from app.tracing import record_span
 
 
 class AgentVote(BaseModel):
@@ -26,10 +40,28 @@ class BaseAgent(ABC):
     and returns a vote with score, confidence, and reasoning.
     """
 
+    # Low-confidence vote returned when input is missing or the agent times out
+    fallback_score: float = 0.5
+    fallback_confidence: float = 0.3
+
+    # Bump when scoring logic changes so stored votes are not reused
+    version: str = "0.1.0"
+
+    # Token budget for the prompts this agent builds (see prompt_builder)
+    prompt_token_budget: int = 2000
+
+    # Evaluation inputs the vote depends on (used for fingerprinting)
+    input_fields: Tuple[str, ...] = (
+        "candidate_id",
+        "resume_url",
+        "linkedin_url",
+        "github_url",
+        "job_opening_id",
+    )
+
     def __init__(self, name: str, description: str):
         self.name = name
         self.description = description
-        self.openai_client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
     @abstractmethod
     async def evaluate(
@@ -61,6 +93,10 @@ class BaseAgent(ABC):
         """
         Helper method to call OpenAI LLM
 
+        Uses the process-wide async client, so the event loop keeps
+        serving other requests while the call is in flight. Calls at
+        low temperature are answered from the LLM response cache.
+
         Args:
             prompt: The prompt to send
             temperature: Creativity level (0.0 to 1.0)
@@ -68,8 +104,39 @@ class BaseAgent(ABC):
         Returns:
             LLM response text
         """
-        response = self.openai_client.chat.completions.create(
-            model=os.getenv("OPENAI_MODEL", "gpt-4"),
+        content, _ = await self.call_llm_with_usage(prompt, temperature)
+        return content
+
+    async def call_llm_with_usage(
+        self, prompt: str, temperature: float = 0.3
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Call the LLM like call_llm, also returning the call's token usage
+
+        Returns:
+            LLM response text, and {"prompt_tokens", "completion_tokens",
+            "cached"} (token counts are None for cached responses)
+        """
+        usage: Dict[str, Any] = {
+            "prompt_tokens": None,
+            "completion_tokens": None,
+            "cached": False,
+        }
+        model = os.getenv("OPENAI_MODEL", "gpt-4")
+
+        # Deterministic calls are served from the response cache
+        cache = get_llm_cache()
+        cache_key = None
+        if cache.is_cacheable(temperature):
+            cache_key = cache.make_key(self.name, model, temperature, prompt)
+            cached = await cache.get(cache_key)
+            if cached is not None:
+                usage["cached"] = True
+                return cached, usage
+
+        started = time.perf_counter()
+        response = await get_llm_client().chat.completions.create(
+            model=model,
             messages=[
                 {
                     "role": "system",
@@ -79,7 +146,107 @@ class BaseAgent(ABC):
             ],
             temperature=temperature,
         )
-        return response.choices[0].message.content
+        label = agent_label(self.name)
+        LLM_LATENCY.labels(agent=label, model=model).observe(
+            time.perf_counter() - started
+        )
+        record_span(f"llm:{label}", started)
+        if response.usage is not None:
+            usage["prompt_tokens"] = response.usage.prompt_tokens
+            usage["completion_tokens"] = response.usage.completion_tokens
+            LLM_TOKENS.labels(agent=label, model=model, kind="prompt").inc(
+                response.usage.prompt_tokens
+            )
+            LLM_TOKENS.labels(agent=label, model=model, kind="completion").inc(
+                response.usage.completion_tokens
+            )
+            LLM_PROMPT_TOKENS.labels(agent=label).observe(response.usage.prompt_tokens)
+            LLM_COMPLETION_TOKENS.labels(agent=label).observe(
+                response.usage.completion_tokens
+            )
+        content = response.choices[0].message.content
+
+        if cache_key is not None and content is not None:
+            await cache.set(cache_key, content)
+        return content, usage
+
+    def parse_vote(self, response: Optional[str], **metadata: Any) -> AgentVote:
+        """
+        Parse an LLM response into a vote
+
+        Expects a JSON object with "score", "confidence" and "reasoning"
+        somewhere in the response. Scores are clamped to 0.0-1.0; a
+        response without a usable object yields the fallback vote.
+
+        Args:
+            response: Raw LLM response text
+            **metadata: Metadata to attach to the vote
+
+        Returns:
+            AgentVote parsed from the response
+        """
+        match = re.search(r"\{.*\}", response or "", re.DOTALL)
+        try:
+            data = json.loads(match.group(0)) if match else None
+            score = float(data["score"])
+            confidence = float(data["confidence"])
+        except (TypeError, ValueError, KeyError):
+            return self.fallback_vote(
+                f"{self.name} could not parse the LLM response", **metadata
+            )
+
+        return AgentVote(
+            score=min(max(score, 0.0), 1.0),
+            confidence=min(max(confidence, 0.0), 1.0),
+            reasoning=str(data.get("reasoning", "")),
+            metadata=metadata,
+        )
+
+    async def fingerprint_inputs(self, **inputs: Any) -> Dict[str, Any]:
+        """
+        Extra state this agent's vote depends on, beyond the request inputs
+
+        Merged into the inputs passed to fingerprint(); agents whose vote
+        depends on data other than the request (e.g. a trained model)
+        override this and list the keys in input_fields.
+        """
+        return {}
+
+    def fingerprint(self, **inputs: Any) -> str:
+        """
+        Fingerprint of the inputs this agent's vote depends on
+
+        Two evaluations with the same fingerprint would get the same vote,
+        so a stored vote can be reused instead of re-running the agent.
+
+        Args:
+            **inputs: Evaluation inputs (extra keys are ignored)
+
+        Returns:
+            Hex digest over agent name, version and its input_fields
+        """
+        payload = {field: inputs.get(field) for field in self.input_fields}
+        payload["__agent__"] = [self.name, self.version]
+        encoded = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def fallback_vote(self, reasoning: str, **metadata: Any) -> AgentVote:
+        """
+        Build the low-confidence vote used when the agent cannot evaluate
+
+        Args:
+            reasoning: Why the agent fell back
+            **metadata: Extra metadata to attach to the vote
+
+        Returns:
+            AgentVote with the agent's fallback score and confidence
+        """
+        return AgentVote(
+            score=self.fallback_score,
+            confidence=self.fallback_confidence,
+            reasoning=reasoning,
+            metadata=metadata,
+        )
 
     def get_status(self) -> Dict[str, Any]:
         """Get agent status"""
@@ -87,5 +254,5 @@ class BaseAgent(ABC):
             "name": self.name,
             "description": self.description,
             "status": "ready",
-            "version": "0.1.0",
+            "version": self.version,
         }
@@ -3,7 +3,37 @@ Bias Detection Agent - EEOC compliance monitoring
 """
 
 from typing import Optional, List, Dict, Any
+import json
+import os
+
 from app.agents.base_agent import BaseAgent, AgentVote
+from app.agents.bias_scanner import scan_votes
+from app.agents.prompt_builder import Section, build_prompt
+
+# Token budget for the review prompt; high-severity flags are kept first
+BIAS_PROMPT_TOKEN_BUDGET = int(os.getenv("BIAS_PROMPT_TOKEN_BUDGET", "1500"))
+
+PROMPT_TEMPLATE = """Audit this automated candidate evaluation for EEOC compliance.
+
+A keyword scan found the protected-characteristic terms below in the
+evaluating agents' output. Decide whether any of them influenced the
+evaluation (bias), or are incidental (e.g. quoting a job title or a
+technology name).
+
+Respond with a JSON object:
+{{"score": <0.0-1.0>, "confidence": <0.0-1.0>, "reasoning": "<one paragraph>"}}
+where score 1.0 means no bias.
+
+Flagged terms:
+{flags}
+"""
+
+# Score when the scanner finds nothing (high score means LOW bias detected)
+CLEAN_SCORE = 0.95
+CLEAN_CONFIDENCE = 0.9
+
+# Minimum score for an evaluation to count as EEOC compliant
+COMPLIANT_SCORE = 0.7
 
 
 class BiasDetectionAgent(BaseAgent):
@@ -23,6 +53,8 @@ class BiasDetectionAgent(BaseAgent):
     - Job fit (not demographics)
     """
 
+    prompt_token_budget = BIAS_PROMPT_TOKEN_BUDGET
+
     def __init__(self):
         super().__init__(
             name="Bias Detection Agent",
@@ -45,25 +77,54 @@ class BiasDetectionAgent(BaseAgent):
         to detect potential bias.
 
         Args:
-            kwargs should include 'other_agent_votes' for analysis
+            kwargs should include 'other_agent_votes' for analysis, and
+            may include 'scan_flags' if the votes were already scanned
 
-        TODO: Implement actual bias detection algorithms
+        A single-pass keyword scan covers every agent's reasoning and
+        metadata; the LLM only reviews evaluations the scan flags. Flags
+        are reported in bias_flags (stored, counted and used to exclude
+        candidates) only when the review confirms bias; flags it finds
+        incidental are kept as dismissed_flags.
         """
         other_votes = kwargs.get("other_agent_votes", {})
-        bias_flags: List[Dict[str, Any]] = []
-
-        # TODO: Analyze other agent reasoning for bias indicators
-        # TODO: Check for protected characteristic mentions
-        # TODO: Ensure evaluation based on skills, not demographics
-        # TODO: Flag any EEOC violations
-
-        # Mock implementation
-        score = 0.92  # High score means LOW bias detected
-        confidence = 1.0
-
-        return AgentVote(
-            score=score,
-            confidence=confidence,
-            reasoning=f"No bias flags detected. Evaluation appears EEOC compliant. {len(bias_flags)} concerns.",
-            metadata={"bias_flags": bias_flags, "eeoc_compliant": True},
+        bias_flags: List[Dict[str, Any]] = kwargs.get("scan_flags")
+        if bias_flags is None:
+            bias_flags = scan_votes(other_votes)
+
+        if not bias_flags:
+            return AgentVote(
+                score=CLEAN_SCORE,
+                confidence=CLEAN_CONFIDENCE,
+                reasoning="No bias flags detected. Evaluation appears EEOC compliant.",
+                metadata={
+                    "bias_flags": bias_flags,
+                    "eeoc_compliant": True,
+                    "llm_reviewed": False,
+                },
+            )
+
+        prompt = build_prompt(
+            PROMPT_TEMPLATE,
+            self.prompt_token_budget,
+            {
+                "flags": [
+                    Section(
+                        flag["category"],
+                        json.dumps(flag),
+                        priority=1.0 if flag["severity"] == "high" else 0.0,
+                    )
+                    for flag in bias_flags
+                ]
+            },
+        )
+        response, usage = await self.call_llm_with_usage(prompt.text, temperature=0.0)
+        vote = self.parse_vote(
+            response,
+            llm_reviewed=True,
+            prompt={**prompt.metadata(), **usage},
         )
+        compliant = vote.score >= COMPLIANT_SCORE
+        vote.metadata["eeoc_compliant"] = compliant
+        vote.metadata["bias_flags"] = [] if compliant else bias_flags
+        vote.metadata["dismissed_flags"] = bias_flags if compliant else []
+        return vote
@@ -0,0 +1,157 @@
+"""
+Bias Scanner - Single-pass scan for protected-characteristic terms
+
+All terms and proxies compile into one regular expression with a named
+group per category, and every agent's reasoning and metadata are joined
+into one document, so a whole evaluation is checked in one pass without
+any LLM call. The BiasDetectionAgent only asks the LLM to review
+evaluations the scanner flags.
+
+Categories follow EEOC protected characteristics. Proxies (e.g. graduation
+years for age) are reported with "medium" severity.
+"""
+
+from bisect import bisect_right
+from typing import Any, Dict, Iterator, List, Tuple
+import re
+
+# category -> (severity, pattern); patterns are matched case-insensitively
+BIAS_PATTERNS: Dict[str, Tuple[str, str]] = {
+    "age": (
+        "high",
+        r"years? old|too old|older workers?|(?:too )?young(?:er)?|youthful|elderly"
+        r"|near(?:ing)? retirement|retirees?|\d{2}-year-old|aged? \d{2}"
+        r"|at (?:the )?age of|(?:his|her|their|candidate'?s|applicant'?s) age",
+    ),
+    "age_proxy": (
+        "medium",
+        r"(?:class of|graduated(?: in)?|born in) (?:19|20)\d\d|digital native"
+        r"|over-?qualified|recent (?:college )?grad(?:uate)?s?|energetic",
+    ),
+    "gender": (
+        "high",
+        r"(?:fe)?males|(?:fe)?male (?:candidate|applicant|engineer|developer"
+        r"|employee|worker|hire|colleague)s?|wom[ae]n|gender|girls?|guys|ladies"
+        r"|gentlemen|maternity"
+        r"|paternity|(?:his|her) wife|(?:his|her) husband|transgender",
+    ),
+    "race_ethnicity": (
+        "high",
+        r"racial(?:ly)?|(?:his|her|their|candidate'?s|applicant'?s) race"
+        r"|race(?:,| or| and|/) ?(?:ethnicity|colou?r|religion|gender|sex)"
+        r"|ethnic(?:ity|ities)?|hispanic|latin[oax]|asians?"
+        r"|african[- ]americans?|caucasians?|skin colou?r",
+    ),
+    "national_origin": (
+        "high",
+        r"nationality|national origin|immigrants?|foreigners?|foreign-born"
+        r"|(?:heavy |thick |foreign )?accent|native (?:english )?speakers?",
+    ),
+    "religion": (
+        "high",
+        r"religio(?:n|us)|church|mosque|synagogue|christians?|muslims?|jewish"
+        r"|hindus?|buddhists?|sikhs?",
+    ),
+    "disability": (
+        "high",
+        r"disab(?:led|ility|ilities)|handicap(?:ped)?|wheelchair|medical condition"
+        r"|mental (?:health|illness)|chronic(?:ally)? ill(?:ness)?",
+    ),
+    "family_status": (
+        "high",
+        r"married|marital|pregnan(?:t|cy)|single (?:mother|father|parent)"
+        r"|has (?:young )?(?:kids|children)|childcare|family plans",
+    ),
+    "sexual_orientation": (
+        "high",
+        r"sexual orientation|gay|lesbian|bisexual|lgbtq?\+?|homosexual",
+    ),
+    "location_proxy": (
+        "medium",
+        r"zip ?code|neighbou?rhood|lives in|commute from",
+    ),
+}
+
+BIAS_REGEX = re.compile(
+    "|".join(
+        rf"\b(?P<{category}>{pattern})\b"
+        for category, (_, pattern) in BIAS_PATTERNS.items()
+    ),
+    re.IGNORECASE,
+)
+
+# Context kept around each match for the LLM review
+SNIPPET_CHARS = 80
+
+# Metadata keys that are inputs, not evaluation text (URLs, hashes, counts)
+SKIPPED_METADATA_KEYS = {"content_hash", "fingerprint", "format", "bias_flags"}
+
+
+def _metadata_strings(value: Any) -> Iterator[str]:
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            if key not in SKIPPED_METADATA_KEYS:
+                yield from _metadata_strings(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _metadata_strings(item)
+
+
+def scan_votes(votes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Flag protected-characteristic terms in agents' reasoning and metadata
+
+    Args:
+        votes: agent key -> AgentVote (or any object with reasoning/metadata)
+
+    Returns:
+        One flag per distinct (agent, field, category, term), in text order
+    """
+    parts: List[str] = []
+    sources: List[Tuple[str, str]] = []
+    offsets: List[int] = []
+    position = 0
+    for agent, vote in votes.items():
+        fields = (
+            ("reasoning", [vote.reasoning or ""]),
+            ("metadata", list(_metadata_strings(vote.metadata or {}))),
+        )
+        for field, texts in fields:
+            text = "\n".join(texts)
+            if not text:
+                continue
+            offsets.append(position)
+            sources.append((agent, field))
+            parts.append(text)
+            position += len(text) + 1
+
+    document = "\n".join(parts)
+    flags = []
+    seen = set()
+    for match in BIAS_REGEX.finditer(document):
+        category = match.lastgroup
+        part = bisect_right(offsets, match.start()) - 1
+        agent, field = sources[part]
+        part_start = offsets[part]
+        part_end = part_start + len(parts[part])
+        term = match.group().lower()
+        if (agent, field, category, term) in seen:
+            continue
+        seen.add((agent, field, category, term))
+        flags.append(
+            {
+                "agent": agent,
+                "field": field,
+                "category": category,
+                "term": term,
+                "severity": BIAS_PATTERNS[category][0],
+                "context": document[
+                    max(match.start() - SNIPPET_CHARS, part_start) : min(
+                        match.end() + SNIPPET_CHARS, part_end
+                    )
+                ].strip(),
+            }
+        )
+    return flags
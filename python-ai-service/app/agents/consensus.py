@@ -5,7 +5,9 @@ This is not an "agent" that evaluates candidates, but rather
 orchestrates the voting and consensus-building among the other agents.
 """
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Sequence, Tuple
+import numpy as np
+
 from app.agents.base_agent import AgentVote
 
 
@@ -18,9 +20,22 @@ class ConsensusBuilder:
     - Majority Voting: Agents vote yes/no, majority wins
     - Unanimous: All agents must agree above threshold
     - Ranked Choice: Agents rank candidates, aggregate rankings
+
+    build_consensus handles one candidate; build_batch_consensus scores a
+    whole candidate slate (candidates x agents arrays) in one NumPy pass.
     """
 
+    MECHANISMS = ("weighted_average", "majority", "unanimous", "ranked_choice")
+
+    # Score at or above which an agent counts as voting "yes"
+    vote_threshold = 0.7
+
+    # Agents within this distance of the mean score are "in consensus"
+    consensus_band = 0.15
+
     def __init__(self, mechanism: str = "weighted_average"):
+        if mechanism not in self.MECHANISMS:
+            raise ValueError(f"Unknown consensus mechanism: {mechanism}")
         self.mechanism = mechanism
 
     def build_consensus(
@@ -39,6 +54,10 @@ class ConsensusBuilder:
             return self._weighted_average_consensus(agent_votes)
         elif self.mechanism == "majority":
             return self._majority_consensus(agent_votes)
+        elif self.mechanism == "unanimous":
+            return self._unanimous_consensus(agent_votes)
+        elif self.mechanism == "ranked_choice":
+            return self._ranked_choice_consensus(agent_votes)
         else:
             raise ValueError(f"Unknown consensus mechanism: {self.mechanism}")
 
@@ -74,7 +93,7 @@ class ConsensusBuilder:
 
         # Count agents in consensus (within 0.15 of average)
         agents_in_consensus = sum(
-            1 for score in scores if abs(score - avg_score) <= 0.15
+            1 for score in scores if abs(score - avg_score) <= self.consensus_band
         )
 
         return {
@@ -94,7 +113,7 @@ class ConsensusBuilder:
 
         Returns whether majority voted yes
         """
-        threshold = 0.7
+        threshold = self.vote_threshold
         yes_votes = sum(1 for vote in agent_votes.values() if vote.score >= threshold)
         no_votes = len(agent_votes) - yes_votes
 
@@ -106,3 +125,218 @@ class ConsensusBuilder:
             "agents_total": len(agent_votes),
             "threshold": threshold,
         }
+
+    def _unanimous_consensus(
+        self, agent_votes: Dict[str, AgentVote]
+    ) -> Dict[str, Any]:
+        """
+        Unanimous: every agent must vote yes (score >= threshold)
+
+        Returns whether all agents voted yes
+        """
+        threshold = self.vote_threshold
+        scores = [vote.score for vote in agent_votes.values()]
+        unanimous = bool(scores) and all(score >= threshold for score in scores)
+
+        return {
+            "mechanism": "unanimous",
+            "overall_score": 1.0 if unanimous else 0.0,
+            "min_score": round(min(scores), 4) if scores else 0.0,
+            "agents_total": len(agent_votes),
+            "threshold": threshold,
+        }
+
+    def _ranked_choice_consensus(
+        self, agent_votes: Dict[str, AgentVote]
+    ) -> Dict[str, Any]:
+        """
+        Ranked choice for a single candidate: a slate of one
+
+        Every agent ranks the lone candidate first, so it earns full Borda
+        points from any agent with non-zero confidence. Rank a whole slate
+        with build_batch_consensus.
+        """
+        confidence_sum = sum(vote.confidence for vote in agent_votes.values())
+
+        return {
+            "mechanism": "ranked_choice",
+            "overall_score": 1.0 if confidence_sum > 0 else 0.0,
+            "rank": 1,
+            "agents_total": len(agent_votes),
+        }
+
+    def build_batch_consensus(
+        self,
+        scores: np.ndarray,
+        confidences: np.ndarray,
+        mask: Optional[np.ndarray] = None,
+    ) -> Dict[str, Any]:
+        """
+        Aggregate votes for a whole candidate slate in one vectorized pass
+
+        Args:
+            scores: (candidates, agents) array of agent scores
+            confidences: (candidates, agents) array of agent confidences
+            mask: Optional (candidates, agents) boolean array, False where
+                an agent did not vote for a candidate
+
+        Returns:
+            Dict with "mechanism" and per-candidate arrays of length
+            candidates (e.g. "overall_score", "agreement_score")
+        """
+        scores = np.asarray(scores, dtype=np.float64)
+        confidences = np.asarray(confidences, dtype=np.float64)
+        if scores.ndim != 2 or scores.shape != confidences.shape:
+            raise ValueError("scores and confidences must be 2-D arrays of equal shape")
+        if mask is None:
+            mask = np.ones(scores.shape, dtype=bool)
+        else:
+            mask = np.asarray(mask, dtype=bool)
+
+        if self.mechanism == "weighted_average":
+            return self._batch_weighted_average(scores, confidences, mask)
+        elif self.mechanism == "majority":
+            return self._batch_majority(scores, mask)
+        elif self.mechanism == "unanimous":
+            return self._batch_unanimous(scores, mask)
+        else:
+            return self._batch_ranked_choice(scores, confidences, mask)
+
+    def _batch_weighted_average(
+        self, scores: np.ndarray, confidences: np.ndarray, mask: np.ndarray
+    ) -> Dict[str, Any]:
+        """Vectorized _weighted_average_consensus"""
+        weights = np.where(mask, confidences, 0.0)
+        weight_sums = weights.sum(axis=1)
+        overall = np.divide(
+            (scores * weights).sum(axis=1),
+            weight_sums,
+            out=np.zeros(len(scores)),
+            where=weight_sums > 0,
+        )
+
+        agents_total = mask.sum(axis=1)
+        counts = np.maximum(agents_total, 1)
+        means = np.where(mask, scores, 0.0).sum(axis=1) / counts
+        deviations = np.where(mask, scores - means[:, None], 0.0)
+        variance = (deviations**2).sum(axis=1) / counts
+        agreement = np.where(agents_total > 0, 1.0 - np.minimum(variance, 1.0), 0.0)
+        in_consensus = (mask & (np.abs(deviations) <= self.consensus_band)).sum(axis=1)
+
+        return {
+            "mechanism": "weighted_average",
+            "overall_score": overall.round(4),
+            "agreement_score": agreement.round(4),
+            "agents_in_consensus": in_consensus,
+            "agents_total": agents_total,
+            "score_variance": variance.round(4),
+        }
+
+    def _batch_majority(self, scores: np.ndarray, mask: np.ndarray) -> Dict[str, Any]:
+        """Vectorized _majority_consensus"""
+        agents_total = mask.sum(axis=1)
+        yes_votes = (mask & (scores >= self.vote_threshold)).sum(axis=1)
+        no_votes = agents_total - yes_votes
+
+        return {
+            "mechanism": "majority",
+            "overall_score": (yes_votes > no_votes).astype(np.float64),
+            "yes_votes": yes_votes,
+            "no_votes": no_votes,
+            "agents_total": agents_total,
+            "threshold": self.vote_threshold,
+        }
+
+    def _batch_unanimous(self, scores: np.ndarray, mask: np.ndarray) -> Dict[str, Any]:
+        """Vectorized _unanimous_consensus"""
+        agents_total = mask.sum(axis=1)
+        unanimous = (~mask | (scores >= self.vote_threshold)).all(axis=1)
+        unanimous &= agents_total > 0
+        min_scores = np.where(mask, scores, np.inf).min(axis=1)
+
+        return {
+            "mechanism": "unanimous",
+            "overall_score": unanimous.astype(np.float64),
+            "min_score": np.where(agents_total > 0, min_scores, 0.0).round(4),
+            "agents_total": agents_total,
+            "threshold": self.vote_threshold,
+        }
+
+    def _batch_ranked_choice(
+        self, scores: np.ndarray, confidences: np.ndarray, mask: np.ndarray
+    ) -> Dict[str, Any]:
+        """
+        Ranked choice: each agent ranks the slate, rankings are aggregated
+
+        Uses a confidence-weighted Borda count. Each agent awards a
+        candidate (ranked - 1 - position) / (ranked - 1) points, from 1.0
+        for its top pick to 0.0 for its last; ties keep slate order.
+        overall_score is the confidence-weighted mean of those points and
+        rank is the candidate's 1-based position in the aggregate ranking.
+        """
+        n_candidates, n_agents = scores.shape
+        order = np.argsort(np.where(mask, -scores, np.inf), axis=0, kind="stable")
+        positions = np.empty_like(order)
+        positions[order, np.arange(n_agents)] = np.arange(n_candidates)[:, None]
+
+        ranked = mask.sum(axis=0)
+        points = np.divide(
+            (ranked - 1) - positions,
+            ranked - 1,
+            out=np.ones(scores.shape),
+            where=ranked > 1,
+        )
+
+        weights = np.where(mask, confidences, 0.0)
+        weight_sums = weights.sum(axis=1)
+        borda = np.divide(
+            (points * weights).sum(axis=1),
+            weight_sums,
+            out=np.zeros(n_candidates),
+            where=weight_sums > 0,
+        )
+        rank = np.empty(n_candidates, dtype=np.int64)
+        rank[np.argsort(-borda, kind="stable")] = np.arange(1, n_candidates + 1)
+
+        return {
+            "mechanism": "ranked_choice",
+            "overall_score": borda.round(4),
+            "rank": rank,
+            "agents_total": mask.sum(axis=1),
+        }
+
+
+def votes_to_arrays(
+    agent_votes: Sequence[Dict[str, Dict[str, Any]]],
+    agent_names: Optional[List[str]] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]:
+    """
+    Convert stored SwarmDecision.agent_votes dicts into consensus arrays
+
+    Args:
+        agent_votes: One agent_name -> {"score", "confidence", ...} dict
+            per candidate
+        agent_names: Agent column order (default: sorted union of names)
+
+    Returns:
+        Tuple of (scores, confidences, mask, agent_names) ready for
+        ConsensusBuilder.build_batch_consensus
+    """
+    if agent_names is None:
+        agent_names = sorted({name for votes in agent_votes for name in votes})
+    columns = {name: i for i, name in enumerate(agent_names)}
+
+    shape = (len(agent_votes), len(agent_names))
+    scores = np.zeros(shape)
+    confidences = np.zeros(shape)
+    mask = np.zeros(shape, dtype=bool)
+    for row, votes in enumerate(agent_votes):
+        for name, vote in votes.items():
+            column = columns.get(name)
+            if column is None:
+                continue
+            scores[row, column] = vote.get("score", 0.0)
+            confidences[row, column] = vote.get("confidence", 0.0)
+            mask[row, column] = True
+
+    return scores, confidences, mask, agent_names
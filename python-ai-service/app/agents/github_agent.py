@@ -3,7 +3,44 @@ GitHub Agent - Analyzes code contributions
 """
 
 from typing import Optional
+import os
+
 from app.agents.base_agent import BaseAgent, AgentVote
+from app.agents.prompt_builder import (
+    build_prompt,
+    get_job_context,
+    job_sections,
+    record_sections,
+)
+from app.agents.skill_matcher import get_skill_matcher
+from app.tracing import span
+from app.sources.github import (
+    GitHubFetchError,
+    GitHubNotFoundError,
+    get_github_fetcher,
+)
+
+# Token budget for the profile prompt (job context included)
+GITHUB_PROMPT_TOKEN_BUDGET = int(os.getenv("GITHUB_PROMPT_TOKEN_BUDGET", "1500"))
+
+# Free text and handles that can identify the candidate stay out of the
+# prompt; the bio is still used for skill matching
+PROMPT_OMITTED_FIELDS = ("username", "bio")
+
+PROMPT_TEMPLATE = """Evaluate this candidate's GitHub activity for the role below.
+
+Assess code contributions, repository activity, programming languages,
+open source involvement and collaboration patterns. Judge only technical
+work, never demographics.
+
+Respond with a JSON object:
+{{"score": <0.0-1.0>, "confidence": <0.0-1.0>, "reasoning": "<one paragraph>"}}
+
+{job}
+
+GitHub profile summary:
+{profile}
+"""
 
 
 class GitHubAgent(BaseAgent):
@@ -18,6 +55,12 @@ class GitHubAgent(BaseAgent):
     - Collaboration patterns
     """
 
+    # job_context: digest of the job title, skills and description in the prompt
+    input_fields = ("candidate_id", "github_url", "job_opening_id", "job_context")
+
+    version = "0.2.0"
+    prompt_token_budget = GITHUB_PROMPT_TOKEN_BUDGET
+
     def __init__(self):
         super().__init__(
             name="GitHub Agent",
@@ -36,23 +79,54 @@ class GitHubAgent(BaseAgent):
         """
         Evaluate candidate based on GitHub activity
 
-        TODO: Implement actual GitHub API integration
+        Fetches the profile, repositories and recent events through the
+        shared GitHub fetcher, then asks the LLM to score the summary.
         """
         if not github_url:
-            return AgentVote(
-                score=0.5,
-                confidence=0.3,
-                reasoning="No GitHub profile provided",
-                metadata={"has_profile": False},
+            return self.fallback_vote("No GitHub profile provided", has_profile=False)
+
+        try:
+            with span("fetch:github"):
+                profile = await get_github_fetcher().fetch_profile(github_url)
+        except GitHubNotFoundError:
+            return self.fallback_vote("GitHub profile not found", has_profile=False)
+        except GitHubFetchError as exc:
+            return self.fallback_vote(
+                f"Could not fetch GitHub profile: {exc}", has_profile=True
             )
 
-        # TODO: Use GitHub API to fetch profile, repos, contributions
-        # TODO: Analyze code quality, languages, activity
-        # TODO: Use LLM to evaluate technical fit
+        job = await get_job_context(job_opening_id)
+        prompt_profile = {
+            key: value
+            for key, value in profile.items()
+            if key not in PROMPT_OMITTED_FIELDS
+        }
+        prompt = build_prompt(
+            PROMPT_TEMPLATE,
+            self.prompt_token_budget,
+            {
+                "job": job_sections(job),
+                "profile": record_sections(prompt_profile, "profile"),
+            },
+            required_skills=job.required_skills if job else (),
+        )
+        response, usage = await self.call_llm_with_usage(prompt.text, temperature=0.2)
+
+        skills_matched = get_skill_matcher().skills_matched(
+            profile["bio"],
+            ", ".join(profile["languages"]),
+            ", ".join(profile["topics"]),
+            *(repo["description"] for repo in profile["top_repos"]),
+        )
 
-        return AgentVote(
-            score=0.75,
-            confidence=0.8,
-            reasoning="Active contributor with relevant technical projects",
-            metadata={"has_profile": True, "public_repos": 25, "contributions": 450},
+        return self.parse_vote(
+            response,
+            has_profile=True,
+            public_repos=profile["public_repos"],
+            total_stars=profile["total_stars"],
+            recently_active_repos=profile["recently_active_repos"],
+            recent_push_events=profile["recent_push_events"],
+            languages=profile["languages"],
+            skills_matched=skills_matched,
+            prompt={**prompt.metadata(), **usage},
         )
@@ -3,7 +3,36 @@ LinkedIn Agent - Analyzes professional profile
 """
 
 from typing import Optional
+import os
+
 from app.agents.base_agent import BaseAgent, AgentVote
+from app.agents.prompt_builder import (
+    build_prompt,
+    get_job_context,
+    job_sections,
+    record_sections,
+)
+from app.agents.skill_matcher import get_skill_matcher
+from app.tracing import span
+from app.sources.linkedin import LinkedInFetchError, get_linkedin_store
+
+# Token budget for the profile prompt (job context included)
+LINKEDIN_PROMPT_TOKEN_BUDGET = int(os.getenv("LINKEDIN_PROMPT_TOKEN_BUDGET", "1500"))
+
+PROMPT_TEMPLATE = """Evaluate this candidate's professional profile for the role below.
+
+Assess work experience relevance, career progression, skills,
+certifications and recommendations. Judge only professional history,
+never demographics.
+
+Respond with a JSON object:
+{{"score": <0.0-1.0>, "confidence": <0.0-1.0>, "reasoning": "<one paragraph>"}}
+
+{job}
+
+LinkedIn profile summary:
+{profile}
+"""
 
 
 class LinkedInAgent(BaseAgent):
@@ -18,6 +47,12 @@ class LinkedInAgent(BaseAgent):
     - Industry connections
     """
 
+    # job_context: digest of the job title, skills and description in the prompt
+    input_fields = ("candidate_id", "linkedin_url", "job_opening_id", "job_context")
+
+    version = "0.2.0"
+    prompt_token_budget = LINKEDIN_PROMPT_TOKEN_BUDGET
+
     def __init__(self):
         super().__init__(
             name="LinkedIn Agent",
@@ -36,24 +71,45 @@ class LinkedInAgent(BaseAgent):
         """
         Evaluate candidate based on LinkedIn profile
 
-        TODO: Implement actual LinkedIn scraping/API integration
+        Reads the compact enriched profile from the shared profile store,
+        then asks the LLM to score it.
         """
-        # Mock implementation
         if not linkedin_url:
-            return AgentVote(
-                score=0.5,
-                confidence=0.3,
-                reasoning="No LinkedIn profile provided",
-                metadata={"has_profile": False},
+            return self.fallback_vote(
+                "No LinkedIn profile provided", has_profile=False
+            )
+
+        try:
+            with span("fetch:linkedin"):
+                profile = await get_linkedin_store().get_profile(linkedin_url)
+        except LinkedInFetchError as exc:
+            return self.fallback_vote(
+                f"Could not enrich LinkedIn profile: {exc}", has_profile=True
             )
 
-        # TODO: Scrape LinkedIn or use API
-        # TODO: Use LLM to analyze profile
-        # TODO: Compare against job requirements
+        job = await get_job_context(job_opening_id)
+        prompt = build_prompt(
+            PROMPT_TEMPLATE,
+            self.prompt_token_budget,
+            {"job": job_sections(job), "profile": record_sections(profile, "profile")},
+            required_skills=job.required_skills if job else (),
+        )
+        response, usage = await self.call_llm_with_usage(prompt.text, temperature=0.2)
+
+        skills_matched = get_skill_matcher().skills_matched(
+            profile["headline"],
+            profile["summary"],
+            ", ".join(profile["skills"]),
+            *(position["title"] for position in profile["positions"]),
+            *(position["description"] for position in profile["positions"]),
+        )
 
-        return AgentVote(
-            score=0.85,
-            confidence=0.9,
-            reasoning="Strong professional experience with relevant background",
-            metadata={"has_profile": True, "years_experience": 5},
+        return self.parse_vote(
+            response,
+            has_profile=True,
+            years_experience=profile["years_experience"],
+            positions=len(profile["positions"]),
+            skills=len(profile["skills"]),
+            skills_matched=skills_matched,
+            prompt={**prompt.metadata(), **usage},
         )
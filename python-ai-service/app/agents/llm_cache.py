@@ -0,0 +1,185 @@
+"""
+LLM Cache - Content-addressed cache for LLM responses
+
+Re-evaluating the same candidate for the same job sends identical prompts,
+so deterministic (low temperature) responses are cached by a hash of
+agent name, model, temperature and prompt.
+
+Tiers:
+- Memory: bounded LRU with TTL, per worker
+- Persistent: optional Redis tier, shared across workers and restarts
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+import hashlib
+import logging
+import os
+import time
+
+from app.metrics import LLM_CACHE_LOOKUPS
+
+logger = logging.getLogger(__name__)
+
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "10000"))
+LLM_CACHE_TTL_SECONDS = float(os.getenv("LLM_CACHE_TTL_SECONDS", "86400"))
+LLM_CACHE_MAX_TEMPERATURE = float(os.getenv("LLM_CACHE_MAX_TEMPERATURE", "0.3"))
+
+# Persistent tier is off unless a Redis URL is configured
+LLM_CACHE_REDIS_URL = os.getenv("LLM_CACHE_REDIS_URL")
+
+
+class LRUCache:
+    """
+    Bounded in-memory LRU cache with a per-entry TTL
+
+    Not thread-safe; meant to be used from a single event loop.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None):
+        """Store a value, evicting the least recently used entry if full"""
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class LLMCache:
+    """
+    Two-tier cache for LLM responses
+
+    Only calls at or below max_temperature are cached; anything more
+    creative is expected to differ between calls.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = LLM_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = LLM_CACHE_TTL_SECONDS,
+        max_temperature: float = LLM_CACHE_MAX_TEMPERATURE,
+        redis_url: Optional[str] = LLM_CACHE_REDIS_URL,
+        key_prefix: str = "honeybee:llm:",
+    ):
+        self.memory = LRUCache(max_entries, ttl_seconds)
+        self.ttl_seconds = ttl_seconds
+        self.max_temperature = max_temperature
+        self.key_prefix = key_prefix
+        self.redis = None
+        if redis_url:
+            import redis.asyncio as aioredis
+
+            self.redis = aioredis.from_url(redis_url, decode_responses=True)
+
+        self.memory_hits = 0
+        self.persistent_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(agent_name: str, model: str, temperature: float, prompt: str) -> str:
+        """Content-addressed key for an LLM call"""
+        prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        return f"{agent_name}:{model}:{temperature:.2f}:{prompt_hash}"
+
+    def is_cacheable(self, temperature: float) -> bool:
+        """Whether a call at this temperature is deterministic enough to cache"""
+        return temperature <= self.max_temperature
+
+    async def get(self, key: str) -> Optional[str]:
+        """Look up a response in memory, then in the persistent tier"""
+        value = self.memory.get(key)
+        if value is not None:
+            self.memory_hits += 1
+            LLM_CACHE_LOOKUPS.labels(result="memory_hit").inc()
+            return value
+
+        if self.redis is not None:
+            try:
+                value = await self.redis.get(self.key_prefix + key)
+            except Exception as exc:
+                logger.warning("LLM cache persistent tier unavailable: %s", exc)
+                value = None
+            if value is not None:
+                self.persistent_hits += 1
+                LLM_CACHE_LOOKUPS.labels(result="persistent_hit").inc()
+                self.memory.set(key, value)
+                return value
+
+        self.misses += 1
+        LLM_CACHE_LOOKUPS.labels(result="miss").inc()
+        return None
+
+    async def set(self, key: str, value: str):
+        """Store a response in both tiers"""
+        self.memory.set(key, value)
+        if self.redis is not None:
+            try:
+                await self.redis.set(
+                    self.key_prefix + key, value, ex=int(self.ttl_seconds)
+                )
+            except Exception as exc:
+                logger.warning("LLM cache persistent tier unavailable: %s", exc)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit and miss counters"""
+        hits = self.memory_hits + self.persistent_hits
+        lookups = hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "persistent_hits": self.persistent_hits,
+            "misses": self.misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "memory_entries": len(self.memory),
+            "persistent_tier": self.redis is not None,
+        }
+
+    async def close(self):
+        if self.redis is not None:
+            await self.redis.aclose()
+
+
+_cache: Optional[LLMCache] = None
+
+
+def init_llm_cache() -> LLMCache:
+    """Create the shared LLM cache (idempotent)"""
+    global _cache
+    if _cache is None:
+        _cache = LLMCache()
+    return _cache
+
+
+def get_llm_cache() -> LLMCache:
+    """Get the shared LLM cache, creating it outside the app lifespan"""
+    return _cache or init_llm_cache()
+
+
+async def close_llm_cache():
+    """Close the persistent tier connection"""
+    global _cache
+    if _cache is not None:
+        await _cache.close()
+        _cache = None
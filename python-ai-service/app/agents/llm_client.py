@@ -0,0 +1,64 @@
+"""
+LLM Client - Process-wide async OpenAI client
+
+Every agent shares one AsyncOpenAI client so LLM calls never block the
+event loop and all go through a single keep-alive HTTP/2 connection pool.
+The client is created in the FastAPI lifespan hook (app/main.py).
+"""
+
+from typing import Optional
+import os
+
+import httpx
+import openai
+
+# Connection pool limits for the shared client
+LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "100"))
+LLM_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("LLM_MAX_KEEPALIVE_CONNECTIONS", "20"))
+LLM_KEEPALIVE_EXPIRY_SECONDS = float(os.getenv("LLM_KEEPALIVE_EXPIRY_SECONDS", "30"))
+LLM_HTTP2 = os.getenv("LLM_HTTP2", "true").lower() == "true"
+
+# Per-request timeout and retries
+LLM_TIMEOUT_SECONDS = float(os.getenv("LLM_TIMEOUT_SECONDS", "30"))
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "2"))
+
+_client: Optional[openai.AsyncOpenAI] = None
+
+
+def init_llm_client() -> openai.AsyncOpenAI:
+    """
+    Create the shared LLM client (idempotent)
+
+    With HTTP/2 a handful of connections multiplex hundreds of
+    concurrent requests, so one worker can keep many calls in flight.
+    """
+    global _client
+    if _client is None:
+        http_client = httpx.AsyncClient(
+            http2=LLM_HTTP2,
+            limits=httpx.Limits(
+                max_connections=LLM_MAX_CONNECTIONS,
+                max_keepalive_connections=LLM_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=LLM_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+            timeout=httpx.Timeout(LLM_TIMEOUT_SECONDS, connect=5.0),
+        )
+        _client = openai.AsyncOpenAI(
+            api_key=os.getenv("OPENAI_API_KEY"),
+            http_client=http_client,
+            max_retries=LLM_MAX_RETRIES,
+        )
+    return _client
+
+
+def get_llm_client() -> openai.AsyncOpenAI:
+    """Get the shared LLM client, creating it outside the app lifespan"""
+    return _client or init_llm_client()
+
+
+async def close_llm_client():
+    """Close the shared client and its connection pool"""
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
@@ -5,7 +5,10 @@ This is the main entry point for candidate evaluation.
 It orchestrates the 6 specialized agents and builds consensus.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple, AsyncIterator, TYPE_CHECKING
+import asyncio
+import logging
+import os
 import time
 from datetime import datetime
 
@@ -13,9 +16,38 @@ from app.agents.linkedin_agent import LinkedInAgent
 from app.agents.github_agent import GitHubAgent
 from app.agents.resume_agent import ResumeAgent
 from app.agents.bias_detection_agent import BiasDetectionAgent
+from app.agents.bias_scanner import scan_votes
 from app.agents.predictive_agent import PredictiveAgent
 from app.agents.consensus import ConsensusBuilder
-from app.agents.base_agent import AgentVote
+from app.agents.base_agent import BaseAgent, AgentVote
+from app.agents.prompt_builder import get_job_context
+from app.agents.singleflight import SingleFlight
+from app.metrics import (
+    AGENT_LATENCY,
+    AGENT_RUNS,
+    EVALUATIONS_IN_FLIGHT,
+    agent_label,
+    record_evaluation,
+    snapshot,
+)
+from app.tracing import child_trace, record_span, span
+
+if TYPE_CHECKING:
+    from app.db.writer import DecisionWriter
+
+# Deadline budget (seconds) for a whole evaluation; Rails times out at 30s
+SWARM_DEADLINE_SECONDS = float(os.getenv("SWARM_DEADLINE_SECONDS", "25"))
+
+# Per-agent timeout (seconds) for the independent agents
+AGENT_TIMEOUT_SECONDS = float(os.getenv("AGENT_TIMEOUT_SECONDS", "15"))
+
+# Part of the deadline budget held back for the bias review
+BIAS_REVIEW_RESERVE_SECONDS = float(os.getenv("BIAS_REVIEW_RESERVE_SECONDS", "5"))
+
+# How long shutdown waits for in-flight evaluations
+SHUTDOWN_DRAIN_SECONDS = float(os.getenv("SHUTDOWN_DRAIN_SECONDS", "30"))
+
+logger = logging.getLogger(__name__)
 
 
 class SwarmOrchestrator:
@@ -24,13 +56,24 @@ class SwarmOrchestrator:
 
     Workflow:
     1. Instantiate all 6 agents
-    2. Run evaluations in parallel (when possible)
+    2. Run the independent agents concurrently, each under its own timeout
     3. Bias detection agent reviews other agents' votes
     4. Consensus builder aggregates all votes
-    5. Return comprehensive evaluation result
+    5. Queue the result for persistence (if a DecisionWriter is attached)
+    6. Return comprehensive evaluation result
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        deadline_seconds: float = SWARM_DEADLINE_SECONDS,
+        agent_timeout_seconds: float = AGENT_TIMEOUT_SECONDS,
+        bias_reserve_seconds: float = BIAS_REVIEW_RESERVE_SECONDS,
+        decision_writer: Optional["DecisionWriter"] = None,
+    ):
+        self.deadline_seconds = deadline_seconds
+        self.agent_timeout_seconds = agent_timeout_seconds
+        self.bias_reserve_seconds = bias_reserve_seconds
+
         # Initialize all agents
         self.linkedin_agent = LinkedInAgent()
         self.github_agent = GitHubAgent()
@@ -41,6 +84,12 @@ class SwarmOrchestrator:
         # Initialize consensus builder
         self.consensus_builder = ConsensusBuilder(mechanism="weighted_average")
 
+        # Concurrent identical evaluations share one run
+        self.singleflight = SingleFlight()
+
+        # Write-behind persistence of results to swarm_decisions
+        self.decision_writer = decision_writer
+
     async def evaluate_candidate(
         self,
         candidate_id: int,
@@ -48,6 +97,7 @@ class SwarmOrchestrator:
         linkedin_url: Optional[str] = None,
         github_url: Optional[str] = None,
         job_opening_id: Optional[int] = None,
+        previous_votes: Optional[Dict[str, Dict[str, Any]]] = None,
     ) -> Dict[str, Any]:
         """
         Run full swarm evaluation on a candidate
@@ -58,81 +108,363 @@ class SwarmOrchestrator:
             linkedin_url: LinkedIn profile URL
             github_url: GitHub profile URL
             job_opening_id: Job opening being evaluated for
+            previous_votes: agent_votes of the latest stored decision; votes
+                whose input fingerprint is unchanged are reused
 
         Returns:
             Complete evaluation with all agent votes and consensus
-        """
-        start_time = time.time()
-
-        # Step 1: Run initial agents in parallel
-        # TODO: Actually run these in parallel using asyncio.gather()
-        linkedin_vote = await self.linkedin_agent.evaluate(
-            candidate_id, resume_url, linkedin_url, github_url, job_opening_id
-        )
-
-        github_vote = await self.github_agent.evaluate(
-            candidate_id, resume_url, linkedin_url, github_url, job_opening_id
-        )
 
-        resume_vote = await self.resume_agent.evaluate(
-            candidate_id, resume_url, linkedin_url, github_url, job_opening_id
-        )
-
-        predictive_vote = await self.predictive_agent.evaluate(
-            candidate_id, resume_url, linkedin_url, github_url, job_opening_id
+        Concurrent calls with identical arguments are coalesced into a
+        single evaluation whose result every caller receives.
+        """
+        key = (candidate_id, job_opening_id, resume_url, linkedin_url, github_url)
+        result = await self.singleflight.do(
+            key,
+            lambda: self._evaluate(
+                candidate_id,
+                resume_url,
+                linkedin_url,
+                github_url,
+                job_opening_id,
+                previous_votes,
+            ),
         )
+        return dict(result)
 
-        # Step 2: Bias detection agent reviews other agents' votes
-        other_votes = {
-            "linkedin": linkedin_vote,
-            "github": github_vote,
-            "resume": resume_vote,
-            "predictive": predictive_vote,
-        }
-
-        bias_vote = await self.bias_agent.evaluate(
+    async def _evaluate(
+        self,
+        candidate_id: int,
+        resume_url: Optional[str] = None,
+        linkedin_url: Optional[str] = None,
+        github_url: Optional[str] = None,
+        job_opening_id: Optional[int] = None,
+        previous_votes: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
+        """Run the swarm to completion and return the consensus result"""
+        result: Dict[str, Any] = {}
+        async for event, data in self.iter_evaluation(
             candidate_id,
             resume_url,
             linkedin_url,
             github_url,
             job_opening_id,
-            other_agent_votes=other_votes,
-        )
+            previous_votes,
+        ):
+            if event == "consensus":
+                result = data
+        return result
 
-        # Step 3: Build consensus
-        all_votes = {
-            "linkedin_agent": linkedin_vote,
-            "github_agent": github_vote,
-            "resume_agent": resume_vote,
-            "bias_detection_agent": bias_vote,
-            "predictive_agent": predictive_vote,
-        }
+    async def iter_evaluation(
+        self,
+        candidate_id: int,
+        resume_url: Optional[str] = None,
+        linkedin_url: Optional[str] = None,
+        github_url: Optional[str] = None,
+        job_opening_id: Optional[int] = None,
+        previous_votes: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Run full swarm evaluation, yielding progress as it happens
+
+        Yields (event, data) tuples:
+        - ("agent_vote", vote): once per independent agent, as it finishes
+        - ("bias_review", vote): after the bias agent reviews the others
+        - ("consensus", result): the complete evaluation result
+
+        Vote dicts have the same shape as entries in result["agent_votes"],
+        plus "agent", "timed_out" and "reused" keys.
 
-        consensus = self.consensus_builder.build_consensus(all_votes)
+        Each vote carries a fingerprint of the inputs it used, including
+        the job opening as the prompts see it. An agent whose fingerprint
+        matches its vote in previous_votes is not re-run; the stored vote
+        is reused. Bias review and consensus always re-run.
+        """
+        # Own trace, so batch and coalesced evaluations report their own spans
+        with child_trace(f"candidate:{candidate_id}") as trace:
+            EVALUATIONS_IN_FLIGHT.inc()
+            try:
+                start_time = time.time()
+                deadline = time.monotonic() + self.deadline_seconds
+
+                inputs = {
+                    "candidate_id": candidate_id,
+                    "resume_url": resume_url,
+                    "linkedin_url": linkedin_url,
+                    "github_url": github_url,
+                    "job_opening_id": job_opening_id,
+                }
+                # Step 1: Run the independent agents concurrently
+                initial_agents = {
+                    "linkedin": self.linkedin_agent,
+                    "github": self.github_agent,
+                    "resume": self.resume_agent,
+                    "predictive": self.predictive_agent,
+                }
+                agent_inputs: Dict[str, Dict[str, Any]] = {}
+                try:
+                    # Cached; the agents load the same context for their prompts
+                    job = await get_job_context(job_opening_id)
+                    inputs["job_context"] = job.digest() if job is not None else None
+                    for key, agent in initial_agents.items():
+                        agent_inputs[key] = await agent.fingerprint_inputs(**inputs)
+                except Exception as exc:
+                    # Unknown inputs: re-run every agent rather than reuse
+                    logger.warning("Could not load fingerprint inputs: %s", exc)
+                    previous_votes = None
+
+                fingerprints = {
+                    f"{key}_agent": agent.fingerprint(
+                        **inputs, **agent_inputs.get(key, {})
+                    )
+                    for key, agent in initial_agents.items()
+                }
+                fingerprints["bias_detection_agent"] = self.bias_agent.fingerprint(
+                    **inputs
+                )
+
+                other_votes: Dict[str, AgentVote] = {}
+                timed_out_agents = []
+                reused_agents = []
+                for key in list(initial_agents):
+                    name = f"{key}_agent"
+                    vote = self._reusable_vote(previous_votes, name, fingerprints[name])
+                    if vote is None:
+                        continue
+                    del initial_agents[key]
+                    other_votes[key] = vote
+                    reused_agents.append(name)
+                    AGENT_RUNS.labels(agent=name, outcome="reused").inc()
+                    yield "agent_vote", self._serialize_vote(
+                        name, vote, fingerprints[name], timed_out=False, reused=True
+                    )
+
+                agent_timeout = min(
+                    self.agent_timeout_seconds,
+                    self.deadline_seconds - self.bias_reserve_seconds,
+                )
+
+                async def run_initial(key: str, agent: BaseAgent):
+                    vote, timed_out = await self._run_agent(
+                        agent,
+                        agent_timeout,
+                        candidate_id,
+                        resume_url,
+                        linkedin_url,
+                        github_url,
+                        job_opening_id,
+                    )
+                    return key, vote, timed_out
+
+                tasks = [
+                    asyncio.create_task(run_initial(key, agent))
+                    for key, agent in initial_agents.items()
+                ]
+                try:
+                    for next_done in asyncio.as_completed(tasks):
+                        key, vote, timed_out = await next_done
+                        other_votes[key] = vote
+                        if timed_out:
+                            timed_out_agents.append(f"{key}_agent")
+                        name = f"{key}_agent"
+                        yield "agent_vote", self._serialize_vote(
+                            name, vote, fingerprints[name], timed_out, reused=False
+                        )
+                finally:
+                    # Consumer stopped early (e.g. client disconnected)
+                    for task in tasks:
+                        task.cancel()
 
-        # Step 4: Compile result
-        processing_time_ms = (time.time() - start_time) * 1000
+                # Step 2: Bias detection agent reviews other agents' votes
+                # using whatever is left of the deadline budget. The keyword
+                # scan runs first, so its flags are still reported (as
+                # unreviewed) if the review times out or fails.
+                with span("bias_scan"):
+                    scan_flags = scan_votes(other_votes)
+                bias_vote, bias_timed_out = await self._run_agent(
+                    self.bias_agent,
+                    deadline - time.monotonic(),
+                    candidate_id,
+                    resume_url,
+                    linkedin_url,
+                    github_url,
+                    job_opening_id,
+                    other_agent_votes=other_votes,
+                    scan_flags=scan_flags,
+                )
+                if bias_timed_out:
+                    timed_out_agents.append("bias_detection_agent")
+                review_failed = bias_timed_out or bias_vote.metadata.get("error")
+                unreviewed_flags = scan_flags if review_failed else []
+                if unreviewed_flags:
+                    bias_vote.metadata["unreviewed_bias_flags"] = unreviewed_flags
+                yield "bias_review", self._serialize_vote(
+                    "bias_detection_agent",
+                    bias_vote,
+                    fingerprints["bias_detection_agent"],
+                    bias_timed_out,
+                    reused=False,
+                )
 
-        result = {
-            "candidate_id": candidate_id,
-            "job_opening_id": job_opening_id,
-            "agent_votes": {
-                name: {
-                    "score": vote.score,
-                    "confidence": vote.confidence,
-                    "reasoning": vote.reasoning,
-                    "metadata": vote.metadata,
+                # Step 3: Build consensus
+                all_votes = {
+                    "linkedin_agent": other_votes["linkedin"],
+                    "github_agent": other_votes["github"],
+                    "resume_agent": other_votes["resume"],
+                    "bias_detection_agent": bias_vote,
+                    "predictive_agent": other_votes["predictive"],
                 }
-                for name, vote in all_votes.items()
-            },
-            "consensus_details": consensus,
-            "overall_confidence": consensus["overall_score"],
-            "bias_flags": bias_vote.metadata.get("bias_flags", []),
-            "evaluated_at": datetime.utcnow(),
-            "processing_time_ms": round(processing_time_ms, 2),
+
+                with span("consensus"):
+                    consensus = self.consensus_builder.build_consensus(all_votes)
+
+                # Step 4: Compile result
+                processing_time_ms = (time.time() - start_time) * 1000
+
+                result = {
+                    "candidate_id": candidate_id,
+                    "job_opening_id": job_opening_id,
+                    "agent_votes": {
+                        name: self._vote_dict(vote, fingerprints[name])
+                        for name, vote in all_votes.items()
+                    },
+                    "consensus_details": consensus,
+                    "overall_confidence": consensus["overall_score"],
+                    "bias_flags": bias_vote.metadata.get("bias_flags", []),
+                    "unreviewed_bias_flags": unreviewed_flags,
+                    "timed_out_agents": timed_out_agents,
+                    "reused_agents": reused_agents,
+                    "evaluated_at": datetime.utcnow(),
+                    "processing_time_ms": round(processing_time_ms, 2),
+                }
+
+                record_evaluation(result)
+                if trace is not None:
+                    result["timings"] = trace.breakdown()
+
+                # Step 5: Persist once per evaluation (coalesced callers share it)
+                if self.decision_writer is not None:
+                    with span("persist"):
+                        await self.decision_writer.submit(result)
+
+                yield "consensus", result
+            finally:
+                EVALUATIONS_IN_FLIGHT.dec()
+
+    @staticmethod
+    def _vote_dict(vote: AgentVote, fingerprint: str) -> Dict[str, Any]:
+        """Vote as stored in result["agent_votes"]"""
+        return {
+            "score": vote.score,
+            "confidence": vote.confidence,
+            "reasoning": vote.reasoning,
+            "metadata": vote.metadata,
+            "fingerprint": fingerprint,
         }
 
-        return result
+    def _serialize_vote(
+        self,
+        name: str,
+        vote: AgentVote,
+        fingerprint: str,
+        timed_out: bool,
+        reused: bool,
+    ) -> Dict[str, Any]:
+        """Vote as streamed to clients (same shape as result["agent_votes"])"""
+        return {
+            "agent": name,
+            **self._vote_dict(vote, fingerprint),
+            "timed_out": timed_out,
+            "reused": reused,
+        }
+
+    @staticmethod
+    def _reusable_vote(
+        previous_votes: Optional[Dict[str, Dict[str, Any]]],
+        name: str,
+        fingerprint: str,
+    ) -> Optional[AgentVote]:
+        """Stored vote for an agent if its inputs are unchanged"""
+        previous = (previous_votes or {}).get(name)
+        if not previous or previous.get("fingerprint") != fingerprint:
+            return None
+        metadata = previous.get("metadata") or {}
+        # Never reuse a fallback vote from an agent that timed out or failed
+        if metadata.get("timed_out") or metadata.get("error"):
+            return None
+        return AgentVote(
+            score=previous["score"],
+            confidence=previous["confidence"],
+            reasoning=previous.get("reasoning", ""),
+            metadata=metadata,
+        )
+
+    async def _run_agent(
+        self,
+        agent: BaseAgent,
+        timeout: float,
+        candidate_id: int,
+        resume_url: Optional[str] = None,
+        linkedin_url: Optional[str] = None,
+        github_url: Optional[str] = None,
+        job_opening_id: Optional[int] = None,
+        **kwargs,
+    ) -> Tuple[AgentVote, bool]:
+        """
+        Run a single agent under a timeout
+
+        An agent that runs past its timeout is cancelled and replaced by
+        its low-confidence fallback vote; so is an agent that fails, so one
+        broken data source never fails the whole evaluation.
+
+        Returns:
+            Tuple of (vote, timed_out)
+        """
+        timeout = max(timeout, 0.0)
+        label = agent_label(agent.name)
+        started = time.perf_counter()
+        try:
+            vote = await asyncio.wait_for(
+                agent.evaluate(
+                    candidate_id,
+                    resume_url,
+                    linkedin_url,
+                    github_url,
+                    job_opening_id,
+                    **kwargs,
+                ),
+                timeout=timeout,
+            )
+            AGENT_RUNS.labels(agent=label, outcome="ok").inc()
+            return vote, False
+        except asyncio.TimeoutError:
+            AGENT_RUNS.labels(agent=label, outcome="timeout").inc()
+            return (
+                agent.fallback_vote(
+                    f"{agent.name} timed out after {timeout:.1f}s",
+                    timed_out=True,
+                ),
+                True,
+            )
+        except Exception as exc:
+            logger.exception("%s failed", agent.name)
+            AGENT_RUNS.labels(agent=label, outcome="error").inc()
+            return (
+                agent.fallback_vote(f"{agent.name} failed: {exc}", error=True),
+                False,
+            )
+        finally:
+            AGENT_LATENCY.labels(agent=label).observe(time.perf_counter() - started)
+            record_span(f"agent:{label}", started)
+
+    async def aclose(self, timeout: float = SHUTDOWN_DRAIN_SECONDS):
+        """Wait for in-flight evaluations to finish before shutdown"""
+        try:
+            await asyncio.wait_for(self.singleflight.drain(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Shutdown drain timed out with %d evaluations in flight",
+                self.singleflight.in_flight,
+            )
 
     def get_agent_status(self) -> list:
         """Get status of all agents"""
@@ -145,10 +477,11 @@ class SwarmOrchestrator:
         ]
 
     def get_metrics(self) -> Dict[str, Any]:
-        """Get swarm metrics"""
-        # TODO: Track actual metrics
+        """Get swarm metrics, aggregated across workers"""
         return {
-            "total_evaluations": 0,
-            "average_confidence": 0.0,
-            "bias_flags_detected": 0,
+            **snapshot(),
+            "coalescing": self.singleflight.stats(),
+            "persistence": (
+                self.decision_writer.stats() if self.decision_writer else None
+            ),
         }
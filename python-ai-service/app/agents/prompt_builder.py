@@ -0,0 +1,511 @@
+"""
+Prompt Builder - Token-budgeted prompts for agent LLM calls
+
+Agents hand their input to the builder as sections (resume sections,
+profile fields, job description paragraphs). The builder:
+- Strips boilerplate (contact details, page footers, separators, repeated
+  lines, "references available upon request"...) and drops whole sections
+  that never help an evaluation (references, hobbies, benefits...)
+- Counts tokens locally, with no tokenizer or API call
+- Fills the agent's token budget with the sections most relevant to the
+  job opening's required skills, trimming the last one line by line, and
+  emits what it kept in original order
+
+Everything is deterministic, so the same inputs produce the same prompt
+and still hit the LLM response cache.
+"""
+
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import hashlib
+import json
+import os
+import re
+
+from app.agents.llm_cache import LRUCache
+from app.agents.singleflight import SingleFlight
+from app.agents.skill_matcher import get_skill_matcher
+from app.db.database import ReadOnlySessionLocal
+from app.db.models import JobOpening
+from app.ml.features import required_skill_names
+
+JOB_CONTEXT_CACHE_SIZE = int(os.getenv("JOB_CONTEXT_CACHE_SIZE", "1000"))
+JOB_CONTEXT_TTL_SECONDS = float(os.getenv("JOB_CONTEXT_TTL_SECONDS", "300"))
+# Missing job openings are remembered briefly, so a bad ID in a batch does
+# not hit the database once per candidate
+JOB_CONTEXT_MISSING_TTL_SECONDS = float(
+    os.getenv("JOB_CONTEXT_MISSING_TTL_SECONDS", "30")
+)
+
+# Sections smaller than this are dropped rather than trimmed
+MIN_SECTION_TOKENS = 24
+
+# Letters, digit runs and single symbols; see count_tokens
+TOKEN_PATTERN = re.compile(r"[A-Za-z]+|\d+|\S")
+
+BOILERPLATE_LINE = re.compile(
+    r"^(?:references (?:are )?(?:available )?(?:up)?on request\.?"
+    r"|page \d+(?: of \d+)?|\d+ ?/ ?\d+|curriculum vitae|r[ée]sum[ée]|cv"
+    r"|confidential|all rights reserved\.?|[-_=*~•·|#.]{3,})$",
+    re.IGNORECASE,
+)
+CONTACT_DETAILS = re.compile(
+    r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+"  # email
+    r"|(?:https?://|www\.)\S+"  # URL
+    r"|(?:\+\d{1,3}[ .-]?)?\(?\d{3}\)?[ .-]?\d{3}[ .-]?\d{4}\b"  # phone number
+)
+
+# Headings of sections that carry no evaluation signal (or only demographics)
+DROPPED_SECTIONS = {
+    "references",
+    "hobbies",
+    "interests",
+    "hobbies and interests",
+    "personal details",
+    "personal information",
+    "about us",
+    "about the company",
+    "benefits",
+    "perks",
+    "perks and benefits",
+    "what we offer",
+    "equal opportunity",
+    "equal opportunity employer",
+    "eeo statement",
+}
+SECTION_HEADINGS = {
+    "summary",
+    "profile",
+    "professional summary",
+    "objective",
+    "experience",
+    "work experience",
+    "professional experience",
+    "employment history",
+    "education",
+    "skills",
+    "technical skills",
+    "projects",
+    "certifications",
+    "publications",
+    "awards",
+    "languages",
+    "volunteer",
+    "volunteering",
+    "responsibilities",
+    "requirements",
+    "qualifications",
+    "nice to have",
+} | DROPPED_SECTIONS
+
+
+def count_tokens(text: str) -> int:
+    """
+    Estimate the BPE token count of text
+
+    Words cost one token per six letters (common words are one token,
+    long or rare ones split), digit runs one per three digits, and every
+    other symbol one token. Typically within 10-15% of the real count,
+    erring high, which is the safe side for a budget.
+    """
+    tokens = 0
+    for piece in TOKEN_PATTERN.findall(text):
+        if piece[0].isalpha():
+            tokens += (len(piece) + 5) // 6
+        elif piece[0].isdigit():
+            tokens += (len(piece) + 2) // 3
+        else:
+            tokens += 1
+    return tokens
+
+
+def strip_boilerplate(text: str) -> str:
+    """
+    Remove text that costs tokens without informing an evaluation
+
+    Drops contact details, footer/separator lines and lines repeated
+    verbatim (page headers and footers of multi-page PDFs), and collapses
+    whitespace.
+    """
+    lines = []
+    seen = set()
+    for raw_line in text.splitlines():
+        line = " ".join(CONTACT_DETAILS.sub(" ", raw_line).split())
+        line = line.strip(" |,;")
+        if not line:
+            if lines and lines[-1]:
+                lines.append("")
+            continue
+        if BOILERPLATE_LINE.match(line):
+            continue
+        key = line.lower()
+        if key in seen and len(line) < 80:
+            continue
+        seen.add(key)
+        lines.append(line)
+    return "\n".join(lines).strip()
+
+
+def _heading(line: str) -> Optional[str]:
+    """Normalized heading if a line looks like a section heading"""
+    candidate = line.strip().rstrip(":").strip()
+    if not candidate or len(candidate) > 40:
+        return None
+    normalized = " ".join(re.sub(r"[^a-z ]", " ", candidate.lower()).split())
+    if normalized in SECTION_HEADINGS:
+        return normalized
+    if candidate.isupper() and len(normalized.split()) <= 4:
+        return normalized
+    return None
+
+
+@dataclass
+class Section:
+    """One unit of prompt context the builder can keep, trim or drop"""
+
+    name: str
+    text: str
+    # Always kept (trimmed if it alone exceeds the budget)
+    required: bool = False
+    # Added to relevance when ranking; orders sections without a job
+    priority: float = 0.0
+
+
+def split_sections(text: str, name: str = "") -> List[Section]:
+    """
+    Split a document into sections at its headings
+
+    Text before the first heading becomes a section of its own. Sections
+    under boilerplate headings (references, benefits...) are dropped.
+    """
+    sections: List[Section] = []
+    current_name, current_lines = name, []
+
+    def close():
+        body = "\n".join(current_lines).strip()
+        if body and current_name not in DROPPED_SECTIONS:
+            sections.append(Section(current_name, body))
+
+    for line in text.splitlines():
+        heading = _heading(line)
+        if heading is None:
+            current_lines.append(line)
+            continue
+        close()
+        current_name, current_lines = heading, [line.strip()]
+    close()
+    return sections
+
+
+def _format_value(value: Any) -> str:
+    if isinstance(value, dict):
+        return ", ".join(f"{key} {item}" for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return ", ".join(_format_value(item) for item in value)
+    return str(value)
+
+
+def record_sections(record: Dict[str, Any], name: str) -> List[Section]:
+    """
+    Sections for a structured record (e.g. a compact source profile)
+
+    Scalar fields and flat lists become one overview section of
+    "field: value" lines, which costs far fewer tokens than JSON. Each
+    object in a list of objects (positions, repositories) becomes its own
+    section, so the least relevant ones can be dropped individually.
+    Empty values are skipped.
+    """
+    overview = []
+    items: List[Section] = []
+    for key, value in record.items():
+        if value is None or value == "" or value == [] or value == {}:
+            continue
+        if isinstance(value, list) and all(isinstance(item, dict) for item in value):
+            for item in value:
+                lines = [
+                    f"{field}: {_format_value(item_value)}"
+                    for field, item_value in item.items()
+                    if item_value not in (None, "", [], {})
+                ]
+                items.append(Section(key, f"{key}:\n" + "\n".join(lines)))
+        else:
+            overview.append(f"{key}: {_format_value(value)}")
+    sections = [Section(name, "\n".join(overview), priority=1.0)] if overview else []
+    return sections + items
+
+
+class SkillRelevance:
+    """
+    Scores text by the job's required skills it mentions
+
+    Required skills the taxonomy knows are matched with the skill
+    matcher, so aliases count ("k8s" for Kubernetes); the rest are matched
+    literally on word boundaries.
+    """
+
+    def __init__(self, required_skills: Iterable[str] = ()):
+        matcher = get_skill_matcher()
+        self.matcher = matcher
+        self.canonical = set()
+        literal = []
+        for name in required_skills:
+            matched = matcher.find(name)
+            if matched:
+                self.canonical.update(matched)
+            else:
+                literal.append(name.lower())
+        self.pattern = (
+            re.compile(
+                r"(?<!\w)(?:"
+                + "|".join(re.escape(term) for term in sorted(literal, key=len)[::-1])
+                + r")(?!\w)",
+                re.IGNORECASE,
+            )
+            if literal
+            else None
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.canonical or self.pattern)
+
+    def score(self, text: str) -> Tuple[int, int]:
+        """(distinct required skills mentioned, total mentions)"""
+        if not self:
+            return 0, 0
+        found: Dict[str, int] = {}
+        if self.canonical:
+            for name, count in self.matcher.find(text).items():
+                if name in self.canonical:
+                    found[name] = count
+        if self.pattern is not None:
+            for match in self.pattern.finditer(text):
+                term = match.group().lower()
+                found[term] = found.get(term, 0) + 1
+        return len(found), sum(found.values())
+
+
+@dataclass
+class BuiltPrompt:
+    """A rendered prompt and how it was fitted to the budget"""
+
+    text: str
+    tokens: int
+    budget: int
+    sections_kept: int
+    sections_dropped: int
+    sections_trimmed: int
+
+    def metadata(self) -> Dict[str, Any]:
+        """Summary attached to the agent's vote"""
+        return {
+            "budget": self.budget,
+            "estimated_tokens": self.tokens,
+            "sections_kept": self.sections_kept,
+            "sections_dropped": self.sections_dropped,
+            "sections_trimmed": self.sections_trimmed,
+        }
+
+
+def _trim(text: str, budget: int, relevance: SkillRelevance) -> str:
+    """Keep the most relevant lines of text (in order) within budget"""
+    lines = text.splitlines()
+    ranked = sorted(
+        range(len(lines)),
+        key=lambda index: (
+            # The first line is usually the heading or the entry's title
+            index != 0,
+            tuple(-value for value in relevance.score(lines[index])),
+            index,
+        ),
+    )
+    kept = set()
+    used = 0
+    for index in ranked:
+        cost = count_tokens(lines[index]) + 1
+        if used + cost <= budget:
+            kept.add(index)
+            used += cost
+    if not kept and lines:
+        # A single over-long line: cut it at a word boundary
+        words = lines[0].split()
+        while words and count_tokens(" ".join(words)) > budget:
+            words = words[: len(words) * 3 // 4]
+        return " ".join(words)
+    return "\n".join(lines[index] for index in sorted(kept))
+
+
+def fit_sections(
+    sections: List[Section], budget: int, relevance: SkillRelevance
+) -> Tuple[Dict[int, str], int]:
+    """
+    Choose and trim sections to fit budget tokens
+
+    Sections are ranked required first, then by priority plus the number
+    of required skills they mention, then in document order. Whole
+    sections are taken in rank order while they fit; the leftover budget
+    then goes to trimmed versions of the rest (lines most relevant to the
+    required skills), skipping any once less than MIN_SECTION_TOKENS
+    remain. Required sections are always kept, trimmed if need be.
+
+    Returns:
+        Index of each kept section -> its (possibly trimmed) text, and
+        the number of sections trimmed
+    """
+    cleaned = []
+    for order, section in enumerate(sections):
+        text = strip_boilerplate(section.text)
+        if text:
+            cleaned.append((order, section, text, count_tokens(text) + 2))
+
+    def rank(item):
+        order, section, text, _ = item
+        distinct, mentions = relevance.score(text)
+        return (not section.required, -(section.priority + distinct), -mentions, order)
+
+    ranked = sorted(cleaned, key=rank)
+    chosen: Dict[int, str] = {}
+    trimmed = 0
+    remaining = budget
+
+    def take_trimmed(order: int, text: str):
+        nonlocal remaining, trimmed
+        text = _trim(text, max(remaining - 2, 0), relevance)
+        if text:
+            chosen[order] = text
+            remaining -= count_tokens(text) + 2
+            trimmed += 1
+
+    for order, section, text, cost in ranked:
+        if cost <= remaining:
+            chosen[order] = text
+            remaining -= cost
+        elif section.required:
+            take_trimmed(order, text)
+
+    for order, section, text, _ in ranked:
+        if order not in chosen and remaining >= MIN_SECTION_TOKENS:
+            take_trimmed(order, text)
+    return chosen, trimmed
+
+
+def build_prompt(
+    template: str,
+    budget: int,
+    slots: Dict[str, List[Section]],
+    required_skills: Iterable[str] = (),
+    **fields: Any,
+) -> BuiltPrompt:
+    """
+    Render template with sections fitted into a token budget
+
+    Args:
+        template: str.format template; each slot is filled with its kept
+            sections, other placeholders from fields (never trimmed)
+        budget: Token budget for the whole rendered prompt
+        slots: Placeholder name -> sections, in document order; all slots
+            share the budget
+        required_skills: Job opening required skills to rank sections by
+        **fields: Other template values
+
+    Returns:
+        BuiltPrompt with the text and how much was kept
+    """
+    empty = {name: "" for name in slots}
+    fixed_tokens = count_tokens(template.format(**empty, **fields))
+    sections = [
+        (name, section) for name, slot in slots.items() for section in slot
+    ]
+    chosen, trimmed = fit_sections(
+        [section for _, section in sections],
+        max(budget - fixed_tokens, MIN_SECTION_TOKENS),
+        SkillRelevance(required_skills),
+    )
+
+    rendered: Dict[str, List[str]] = {name: [] for name in slots}
+    for order in sorted(chosen):
+        rendered[sections[order][0]].append(chosen[order])
+    text = template.format(
+        **{name: "\n\n".join(parts) for name, parts in rendered.items()}, **fields
+    )
+    return BuiltPrompt(
+        text=text,
+        tokens=count_tokens(text),
+        budget=budget,
+        sections_kept=len(chosen),
+        sections_dropped=len(sections) - len(chosen),
+        sections_trimmed=trimmed,
+    )
+
+
+@dataclass
+class JobContext:
+    """What agents tell the LLM about the job opening"""
+
+    title: str
+    required_skills: List[str]
+    description: str
+
+    def digest(self) -> str:
+        """Hash of everything prompts include, for vote fingerprints"""
+        encoded = json.dumps(asdict(self), sort_keys=True)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def job_sections(job: Optional[JobContext]) -> List[Section]:
+    """
+    Prompt sections for the job opening
+
+    Title and required skills are always kept; description sections rank
+    below the candidate's own material and go first when space is short.
+    """
+    if job is None:
+        return [
+            Section(
+                "role",
+                "No job opening specified; assess general strength.",
+                required=True,
+            )
+        ]
+    summary = f"Role: {job.title}"
+    if job.required_skills:
+        summary += f"\nRequired skills: {', '.join(job.required_skills)}"
+    return [Section("role", summary, required=True)] + [
+        Section(section.name, section.text, priority=-1.0)
+        for section in split_sections(job.description)
+    ]
+
+
+_job_contexts = LRUCache(JOB_CONTEXT_CACHE_SIZE, JOB_CONTEXT_TTL_SECONDS)
+_job_loads = SingleFlight()
+
+# Cached in place of a JobContext for job openings that do not exist
+_MISSING_JOB = object()
+
+
+async def get_job_context(job_opening_id: Optional[int]) -> Optional[JobContext]:
+    """Job opening context, cached briefly (None without a job opening)"""
+    if job_opening_id is None:
+        return None
+    context = _job_contexts.get(job_opening_id)
+    if context is _MISSING_JOB:
+        return None
+    if context is not None:
+        return context
+
+    async def load() -> Optional[JobContext]:
+        async with ReadOnlySessionLocal() as session:
+            job = await session.get(JobOpening, job_opening_id)
+        if job is None:
+            _job_contexts.set(
+                job_opening_id, _MISSING_JOB, JOB_CONTEXT_MISSING_TTL_SECONDS
+            )
+            return None
+        loaded = JobContext(
+            title=job.title,
+            required_skills=required_skill_names(job.required_skills),
+            description=job.description or "",
+        )
+        _job_contexts.set(job_opening_id, loaded)
+        return loaded
+
+    return await _job_loads.do(job_opening_id, load)
@@ -3,7 +3,36 @@ Resume Agent - Parses and analyzes resume
 """
 
 from typing import Optional
+import os
+
 from app.agents.base_agent import BaseAgent, AgentVote
+from app.agents.prompt_builder import (
+    build_prompt,
+    get_job_context,
+    job_sections,
+    split_sections,
+)
+from app.agents.skill_matcher import get_skill_matcher
+from app.tracing import span
+from app.sources.resume import ResumeFetchError, get_resume_fetcher
+
+# Token budget for the resume prompt (job context included)
+RESUME_PROMPT_TOKEN_BUDGET = int(os.getenv("RESUME_PROMPT_TOKEN_BUDGET", "3000"))
+
+PROMPT_TEMPLATE = """Evaluate this candidate's resume for the role below.
+
+Assess resume structure and clarity, skills, relevance of experience to the
+role, education, and career gaps or red flags. Judge only qualifications,
+never demographics.
+
+Respond with a JSON object:
+{{"score": <0.0-1.0>, "confidence": <0.0-1.0>, "reasoning": "<one paragraph>"}}
+
+{job}
+
+Resume:
+{resume}
+"""
 
 
 class ResumeAgent(BaseAgent):
@@ -18,6 +47,15 @@ class ResumeAgent(BaseAgent):
     - Career gaps or red flags
     """
 
+    fallback_score = 0.4
+    fallback_confidence = 0.2
+
+    version = "0.2.0"
+    prompt_token_budget = RESUME_PROMPT_TOKEN_BUDGET
+
+    # job_context: digest of the job title, skills and description in the prompt
+    input_fields = ("candidate_id", "resume_url", "job_opening_id", "job_context")
+
     def __init__(self):
         super().__init__(
             name="Resume Agent",
@@ -36,23 +74,41 @@ class ResumeAgent(BaseAgent):
         """
         Evaluate candidate based on resume
 
-        TODO: Implement actual resume parsing and analysis
+        Downloads and parses the resume (PDF/DOCX/text), then asks the LLM
+        to score it against the job opening, with the resume sections most
+        relevant to the required skills fitted into the token budget.
         """
         if not resume_url:
-            return AgentVote(
-                score=0.4,
-                confidence=0.2,
-                reasoning="No resume provided",
-                metadata={"has_resume": False},
+            return self.fallback_vote("No resume provided", has_resume=False)
+
+        try:
+            with span("fetch:resume"):
+                resume = await get_resume_fetcher().fetch(resume_url)
+        except ResumeFetchError as exc:
+            return self.fallback_vote(f"Could not read resume: {exc}", has_resume=False)
+
+        if not resume.text.strip():
+            return self.fallback_vote(
+                "Resume contains no extractable text",
+                has_resume=True,
+                format=resume.format,
             )
 
-        # TODO: Fetch and parse resume (PDF/DOCX)
-        # TODO: Extract skills, experience, education
-        # TODO: Use LLM to evaluate fit against job requirements
+        job = await get_job_context(job_opening_id)
+        prompt = build_prompt(
+            PROMPT_TEMPLATE,
+            self.prompt_token_budget,
+            {"job": job_sections(job), "resume": split_sections(resume.text)},
+            required_skills=job.required_skills if job else (),
+        )
+        response, usage = await self.call_llm_with_usage(prompt.text, temperature=0.2)
 
-        return AgentVote(
-            score=0.88,
-            confidence=0.95,
-            reasoning="Well-structured resume with strong alignment to requirements",
-            metadata={"has_resume": True, "format": "pdf", "skills_matched": 12},
+        return self.parse_vote(
+            response,
+            has_resume=True,
+            format=resume.format,
+            content_hash=resume.content_hash,
+            size_bytes=resume.size_bytes,
+            skills_matched=get_skill_matcher().skills_matched(resume.text),
+            prompt={**prompt.metadata(), **usage},
         )
@@ -0,0 +1,71 @@
+"""
+Single Flight - Coalesces concurrent identical calls
+
+Rails retries and double-clicks send the same evaluation while the first
+one is still running. Concurrent calls with the same key share a single
+running task and all receive its result.
+"""
+
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+import asyncio
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Deduplicates in-flight async calls by key
+
+    The shared task is shielded, so one caller being cancelled (e.g. its
+    client disconnected) does not cancel the work for the others.
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, "asyncio.Task[Any]"] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run fn() for key, or join the call already running for key
+
+        Args:
+            key: Identity of the call
+            fn: Zero-argument coroutine function doing the work
+
+        Returns:
+            Result of the (possibly shared) call
+        """
+        self.calls += 1
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: "asyncio.Task[Any]"):
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Mark the exception retrieved in case every caller went away
+        if not task.cancelled():
+            task.exception()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+    async def drain(self):
+        """Wait for every in-flight call to finish"""
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight.values(), return_exceptions=True)
+
+    def stats(self) -> Dict[str, int]:
+        """Coalescing counters"""
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "in_flight": self.in_flight,
+        }
@@ -0,0 +1,301 @@
+"""
+Skill Matcher - Aho-Corasick matching against the skills taxonomy
+
+Scanning text once per skill is O(skills x text). The matcher compiles
+every Skill.name and alias (Skill.metadata["aliases"]) into a single
+Aho-Corasick automaton, so each text is scanned once however large the
+taxonomy grows.
+
+Rows are loaded incrementally by updated_at, re-reading an overlap window
+so rows committed late with an older timestamp are not missed, and the
+automaton is rebuilt in memory and swapped in atomically when something
+changed. A row count
+check catches deletions, which updated_at cannot show.
+"""
+
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+import asyncio
+import logging
+import os
+
+from sqlalchemy import func, select
+
+from app.db.database import ReadOnlySessionLocal
+from app.db.models import Skill
+
+logger = logging.getLogger(__name__)
+
+SKILL_MATCHER_REFRESH_SECONDS = float(
+    os.getenv("SKILL_MATCHER_REFRESH_SECONDS", "300")
+)
+# Rows re-read before the last seen updated_at on each refresh
+SKILL_MATCHER_REFRESH_OVERLAP_SECONDS = float(
+    os.getenv("SKILL_MATCHER_REFRESH_OVERLAP_SECONDS", "300")
+)
+
+
+def normalize_term(term: str) -> str:
+    """Lowercase and collapse whitespace, as applied to scanned text"""
+    return " ".join(term.lower().split())
+
+
+class Automaton:
+    """
+    Immutable Aho-Corasick automaton over skill terms
+
+    Matches only on word boundaries, so "go" does not match inside "good"
+    while "c++" and "node.js" still match.
+    """
+
+    def __init__(self, terms: Iterable[Tuple[str, str]]):
+        """
+        Args:
+            terms: (term, skill name) pairs
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[str, int]]] = [[]]
+
+        for term, skill_name in terms:
+            term = normalize_term(term)
+            if not term:
+                continue
+            state = 0
+            for char in term:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append((skill_name, len(term)))
+
+        # Breadth-first pass sets failure links and merges their outputs
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state] = (
+                    self._output[next_state] + self._output[self._fail[next_state]]
+                )
+
+    @property
+    def states(self) -> int:
+        return len(self._goto)
+
+    def find(self, text: str) -> Dict[str, int]:
+        """
+        Mention count per skill name found in text
+
+        Overlapping matches resolve to the longest leftmost one, so
+        "React Native" is not also counted as "React", nor "C++" as "C".
+        """
+        text = normalize_term(text)
+        goto, fail, output = self._goto, self._fail, self._output
+        matches = []
+        state = 0
+        for end, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for skill_name, length in output[state]:
+                start = end - length + 1
+                if _on_boundary(text, start, end):
+                    matches.append((start, -length, skill_name))
+
+        counts: Dict[str, int] = {}
+        covered_until = -1
+        for start, negative_length, skill_name in sorted(matches):
+            if start <= covered_until:
+                continue
+            covered_until = start - negative_length - 1
+            counts[skill_name] = counts.get(skill_name, 0) + 1
+        return counts
+
+
+def _on_boundary(text: str, start: int, end: int) -> bool:
+    """True unless a word character continues past either end of the match"""
+    if text[start].isalnum() and start > 0 and text[start - 1].isalnum():
+        return False
+    if text[end].isalnum() and end + 1 < len(text) and text[end + 1].isalnum():
+        return False
+    return True
+
+
+def _skill_entry(name: str, metadata: Optional[dict]) -> Tuple[str, List[str]]:
+    """(name, match terms) for a skills row"""
+    aliases = (metadata or {}).get("aliases") or []
+    return name, [name, *aliases]
+
+
+class SkillMatcher:
+    """
+    Shared skill matcher, refreshed from the skills table
+
+    Usage:
+        matcher = get_skill_matcher()
+        await matcher.refresh()
+        matcher.skills_matched("Built APIs in Python and Go")
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable = ReadOnlySessionLocal,
+        refresh_seconds: float = SKILL_MATCHER_REFRESH_SECONDS,
+        refresh_overlap_seconds: float = SKILL_MATCHER_REFRESH_OVERLAP_SECONDS,
+    ):
+        self.session_factory = session_factory
+        self.refresh_seconds = refresh_seconds
+        self.refresh_overlap = timedelta(seconds=refresh_overlap_seconds)
+        self._skills: Dict[int, Tuple[str, List[str]]] = {}
+        self._automaton = Automaton([])
+        self._ids_by_name: Dict[str, int] = {}
+        self._last_updated_at: Optional[datetime] = None
+        self._task: Optional[asyncio.Task] = None
+        self.rebuilds = 0
+
+    def load(self, skills: Iterable[Tuple[int, str, Optional[dict]]]):
+        """Replace or add (id, name, metadata) rows and rebuild the automaton"""
+        for skill_id, name, metadata in skills:
+            self._skills[skill_id] = _skill_entry(name, metadata)
+        self._rebuild()
+
+    def _rebuild(self):
+        self._automaton = Automaton(
+            (term, name) for name, terms in self._skills.values() for term in terms
+        )
+        self._ids_by_name = {
+            name: skill_id for skill_id, (name, _) in self._skills.items()
+        }
+        self.rebuilds += 1
+
+    def skill_id(self, name: str) -> Optional[int]:
+        """Skill ID for a canonical skill name returned by find()"""
+        return self._ids_by_name.get(name)
+
+    async def refresh(self) -> bool:
+        """
+        Load skill rows changed since the last refresh
+
+        Rows updated within the overlap window before the last seen
+        updated_at are read again; only rows that actually differ from the
+        loaded taxonomy trigger a rebuild.
+
+        Returns:
+            True if the automaton was rebuilt
+        """
+        columns = (Skill.id, Skill.name, Skill.metadata_, Skill.updated_at)
+        async with self.session_factory() as session:
+            query = select(*columns)
+            if self._last_updated_at is not None:
+                since = self._last_updated_at - self.refresh_overlap
+                query = query.where(Skill.updated_at >= since)
+            changed = (await session.execute(query)).all()
+            total = await session.scalar(select(func.count(Skill.id)))
+
+        added = sum(1 for row in changed if row.id not in self._skills)
+        full_reload = len(self._skills) + added != total
+        if full_reload:
+            # Rows were deleted; reload the whole taxonomy
+            async with self.session_factory() as session:
+                changed = (await session.execute(select(*columns))).all()
+
+        self._last_updated_at = max(
+            (row.updated_at for row in changed if row.updated_at),
+            default=self._last_updated_at,
+        )
+        if full_reload:
+            self._skills = {}
+        else:
+            changed = [
+                row
+                for row in changed
+                if self._skills.get(row.id) != _skill_entry(row.name, row.metadata_)
+            ]
+            if not changed:
+                return False
+        self.load((row.id, row.name, row.metadata_) for row in changed)
+        return True
+
+    async def start(self):
+        """Load the taxonomy, then keep refreshing it in the background"""
+        try:
+            await self.refresh()
+        except Exception as exc:
+            logger.warning("Skill taxonomy could not be loaded: %s", exc)
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.refresh_seconds)
+            try:
+                await self.refresh()
+            except Exception as exc:
+                logger.warning("Skill taxonomy refresh failed: %s", exc)
+
+    def find(self, *texts: Optional[str]) -> Dict[str, int]:
+        """Mention count per skill name across texts"""
+        automaton = self._automaton
+        counts: Dict[str, int] = {}
+        for text in texts:
+            if not text:
+                continue
+            for name, count in automaton.find(text).items():
+                counts[name] = counts.get(name, 0) + count
+        return counts
+
+    def skills_matched(self, *texts: Optional[str]) -> List[str]:
+        """Skill names mentioned in texts, most mentioned first"""
+        counts = self.find(*texts)
+        return sorted(counts, key=lambda name: (-counts[name], name))
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "skills": len(self._skills),
+            "states": self._automaton.states,
+            "rebuilds": self.rebuilds,
+        }
+
+
+_matcher: Optional[SkillMatcher] = None
+
+
+def init_skill_matcher() -> SkillMatcher:
+    """Create the shared skill matcher (idempotent)"""
+    global _matcher
+    if _matcher is None:
+        _matcher = SkillMatcher()
+    return _matcher
+
+
+def get_skill_matcher() -> SkillMatcher:
+    """Get the shared skill matcher, creating it outside the app lifespan"""
+    return _matcher or init_skill_matcher()
+
+
+async def close_skill_matcher():
+    """Stop the background refresh"""
+    global _matcher
+    if _matcher is not None:
+        await _matcher.stop()
+        _matcher = None
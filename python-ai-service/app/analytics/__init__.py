@@ -0,0 +1 @@
+"""Compliance analytics over evaluation outcomes"""
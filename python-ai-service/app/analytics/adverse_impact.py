@@ -0,0 +1,233 @@
+"""
+Adverse Impact - Incremental four-fifths-rule selection-rate statistics
+
+Each evaluation that carries a voluntary self-identified EEO group updates
+per-group counters for its job opening and company; reports never scan
+swarm_decisions. A candidate counts as selected when overall_confidence
+reaches ADVERSE_IMPACT_SELECTION_THRESHOLD. A group whose selection rate is
+below 80% of the highest group's rate shows adverse impact (EEOC
+four-fifths rule).
+
+Counters live in Redis when ADVERSE_IMPACT_REDIS_URL is set (shared by all
+workers, updated atomically); otherwise in memory per worker. Re-evaluating
+the same candidate for the same job replaces its earlier outcome instead of
+counting twice. EEO groups are only ever used here, never by agents.
+"""
+
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+import os
+
+from app.agents.llm_cache import LRUCache
+from app.db.database import ReadOnlySessionLocal
+from app.db.models import JobOpening
+
+logger = logging.getLogger(__name__)
+
+ADVERSE_IMPACT_REDIS_URL = os.getenv("ADVERSE_IMPACT_REDIS_URL")
+ADVERSE_IMPACT_SELECTION_THRESHOLD = float(
+    os.getenv("ADVERSE_IMPACT_SELECTION_THRESHOLD", "0.7")
+)
+ADVERSE_IMPACT_MIN_GROUP_SIZE = int(os.getenv("ADVERSE_IMPACT_MIN_GROUP_SIZE", "5"))
+
+FOUR_FIFTHS = 0.8
+MAX_GROUP_LENGTH = 64
+
+# Replace a pair's previous outcome with a new one, atomically
+# KEYS[1] = counters hash, KEYS[2] = outcomes hash
+# ARGV[1] = pair, ARGV[2] = "<group>|<0 or 1>"
+RECORD_SCRIPT = """
+local previous = redis.call('HGET', KEYS[2], ARGV[1])
+if previous == ARGV[2] then return 0 end
+if previous then
+  local group, selected = string.match(previous, '^(.*)|(%d)$')
+  redis.call('HINCRBY', KEYS[1], group .. '|evaluated', -1)
+  if selected == '1' then redis.call('HINCRBY', KEYS[1], group .. '|selected', -1) end
+end
+local group, selected = string.match(ARGV[2], '^(.*)|(%d)$')
+redis.call('HINCRBY', KEYS[1], group .. '|evaluated', 1)
+if selected == '1' then redis.call('HINCRBY', KEYS[1], group .. '|selected', 1) end
+redis.call('HSET', KEYS[2], ARGV[1], ARGV[2])
+return 1
+"""
+
+
+def normalize_group(group: str) -> str:
+    return " ".join(group.lower().split())[:MAX_GROUP_LENGTH].replace("|", "/")
+
+
+class AdverseImpactTracker:
+    """
+    Per-scope ("job:<id>", "company:<id>") selection counters by EEO group
+
+    Usage:
+        tracker = get_adverse_impact_tracker()
+        await tracker.record(candidate_id, job_opening_id, "group a", 0.82)
+        await tracker.report("job:12")
+    """
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = ADVERSE_IMPACT_REDIS_URL,
+        selection_threshold: float = ADVERSE_IMPACT_SELECTION_THRESHOLD,
+        min_group_size: int = ADVERSE_IMPACT_MIN_GROUP_SIZE,
+        key_prefix: str = "honeybee:adverse_impact:",
+    ):
+        self.selection_threshold = selection_threshold
+        self.min_group_size = min_group_size
+        self.key_prefix = key_prefix
+        self.redis = None
+        if redis_url:
+            import redis.asyncio as aioredis
+
+            self.redis = aioredis.from_url(redis_url, decode_responses=True)
+            self._record_script = self.redis.register_script(RECORD_SCRIPT)
+        self._counts: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: defaultdict(int)
+        )
+        self._outcomes: Dict[str, Dict[str, str]] = defaultdict(dict)
+        self._job_companies = LRUCache(10000, 3600)
+
+    async def record(
+        self,
+        candidate_id: int,
+        job_opening_id: int,
+        group: str,
+        overall_confidence: float,
+    ):
+        """Count one evaluation outcome for its job opening and company"""
+        outcome = "{}|{}".format(
+            normalize_group(group),
+            int(overall_confidence >= self.selection_threshold),
+        )
+        pair = f"{candidate_id}:{job_opening_id}"
+        scopes = [f"job:{job_opening_id}"]
+        company_id = await self._company_id(job_opening_id)
+        if company_id is not None:
+            scopes.append(f"company:{company_id}")
+
+        for scope in scopes:
+            if self.redis is not None:
+                await self._record_script(
+                    keys=[
+                        f"{self.key_prefix}{scope}",
+                        f"{self.key_prefix}{scope}:outcomes",
+                    ],
+                    args=[pair, outcome],
+                )
+            else:
+                self._record_memory(scope, pair, outcome)
+
+    def _record_memory(self, scope: str, pair: str, outcome: str):
+        previous = self._outcomes[scope].get(pair)
+        if previous == outcome:
+            return
+        counts = self._counts[scope]
+        for value, step in ((previous, -1), (outcome, 1)):
+            if value is None:
+                continue
+            group, selected = value.rsplit("|", 1)
+            counts[f"{group}|evaluated"] += step
+            if selected == "1":
+                counts[f"{group}|selected"] += step
+        self._outcomes[scope][pair] = outcome
+
+    async def _company_id(self, job_opening_id: int) -> Optional[int]:
+        company_id = self._job_companies.get(job_opening_id)
+        if company_id is None:
+            async with ReadOnlySessionLocal() as session:
+                job = await session.get(JobOpening, job_opening_id)
+            if job is None:
+                return None
+            company_id = job.company_id
+            self._job_companies.set(job_opening_id, company_id)
+        return company_id
+
+    async def counts(self, scope: str) -> Dict[str, Tuple[int, int]]:
+        """group -> (evaluated, selected) for a scope"""
+        if self.redis is not None:
+            raw = await self.redis.hgetall(f"{self.key_prefix}{scope}")
+        else:
+            raw = self._counts.get(scope, {})
+        groups: Dict[str, List[int]] = defaultdict(lambda: [0, 0])
+        for field, value in raw.items():
+            group, kind = field.rsplit("|", 1)
+            groups[group][0 if kind == "evaluated" else 1] = int(value)
+        return {
+            group: (evaluated, selected)
+            for group, (evaluated, selected) in groups.items()
+            if evaluated > 0
+        }
+
+    async def report(self, scope: str) -> Dict[str, Any]:
+        """
+        Selection rates and four-fifths-rule impact ratios for a scope
+
+        Groups smaller than min_group_size are reported but never flagged,
+        since their rates are too noisy to compare.
+        """
+        counts = await self.counts(scope)
+        rates = {
+            group: selected / evaluated
+            for group, (evaluated, selected) in counts.items()
+        }
+        comparable = [
+            rates[group]
+            for group, (evaluated, _) in counts.items()
+            if evaluated >= self.min_group_size
+        ]
+        highest_rate = max(comparable, default=0.0)
+
+        groups = {}
+        for group, (evaluated, selected) in sorted(counts.items()):
+            impact_ratio = rates[group] / highest_rate if highest_rate else None
+            groups[group] = {
+                "evaluated": evaluated,
+                "selected": selected,
+                "selection_rate": round(rates[group], 4),
+                "impact_ratio": (
+                    round(impact_ratio, 4) if impact_ratio is not None else None
+                ),
+                "adverse_impact": (
+                    evaluated >= self.min_group_size
+                    and impact_ratio is not None
+                    and impact_ratio < FOUR_FIFTHS
+                ),
+            }
+        return {
+            "scope": scope,
+            "selection_threshold": self.selection_threshold,
+            "groups": groups,
+            "adverse_impact_groups": [
+                group for group, stats in groups.items() if stats["adverse_impact"]
+            ],
+        }
+
+    async def aclose(self):
+        if self.redis is not None:
+            await self.redis.aclose()
+
+
+_tracker: Optional[AdverseImpactTracker] = None
+
+
+def init_adverse_impact_tracker() -> AdverseImpactTracker:
+    """Create the shared adverse impact tracker (idempotent)"""
+    global _tracker
+    if _tracker is None:
+        _tracker = AdverseImpactTracker()
+    return _tracker
+
+
+def get_adverse_impact_tracker() -> AdverseImpactTracker:
+    """Get the shared tracker, creating it outside the app lifespan"""
+    return _tracker or init_adverse_impact_tracker()
+
+
+async def close_adverse_impact_tracker():
+    """Close the Redis connection"""
+    global _tracker
+    if _tracker is not None:
+        await _tracker.aclose()
+        _tracker = None
@@ -0,0 +1,43 @@
+"""
+Compliance analytics endpoints
+"""
+
+from fastapi import APIRouter, Header, HTTPException, Query
+from typing import Optional
+
+from app.analytics.adverse_impact import get_adverse_impact_tracker
+from app.api.dependencies import verify_api_key
+
+router = APIRouter()
+
+
+@router.get("/analytics/adverse_impact")
+async def get_adverse_impact(
+    job_opening_id: Optional[int] = Query(None, description="Job opening scope"),
+    company_id: Optional[int] = Query(None, description="Company scope"),
+    authorization: Optional[str] = Header(None),
+):
+    """
+    Four-fifths-rule selection rates by self-identified EEO group
+
+    Pass exactly one of job_opening_id or company_id.
+
+    Args:
+        job_opening_id: Rails JobOpening ID
+        company_id: Rails Company ID
+
+    Returns:
+        Per-group evaluated/selected counts, selection rates, impact ratios
+        and the groups showing adverse impact
+    """
+    verify_api_key(authorization)
+
+    if (job_opening_id is None) == (company_id is None):
+        raise HTTPException(
+            status_code=400, detail="Pass exactly one of job_opening_id or company_id"
+        )
+    if job_opening_id is not None:
+        scope = f"job:{job_opening_id}"
+    else:
+        scope = f"company:{company_id}"
+    return await get_adverse_impact_tracker().report(scope)
@@ -0,0 +1,32 @@
+"""
+Shared FastAPI dependencies
+"""
+
+from typing import Optional
+import os
+
+from fastapi import HTTPException, Request
+
+from app.agents.orchestrator import SwarmOrchestrator
+
+# API authentication
+RAILS_API_KEY = os.getenv("AI_SERVICE_API_KEY", "development-key")
+
+
+def verify_api_key(authorization: Optional[str]):
+    """Verify the Rails bearer token (optional in development)"""
+    if authorization:
+        token = authorization.replace("Bearer ", "")
+        if token != RAILS_API_KEY:
+            raise HTTPException(status_code=401, detail="Invalid API key")
+    elif os.getenv("ENV") != "development":
+        raise HTTPException(status_code=401, detail="Missing authorization header")
+
+
+def get_orchestrator(request: Request) -> SwarmOrchestrator:
+    """
+    Dependency that provides the process-wide swarm orchestrator
+
+    The orchestrator (and its agents) is built once in the app lifespan.
+    """
+    return request.app.state.orchestrator
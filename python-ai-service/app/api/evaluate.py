@@ -2,18 +2,32 @@
 Candidate evaluation endpoints
 """
 
-from fastapi import APIRouter, HTTPException, Header
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any, List
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional, Dict, Any, List, AsyncIterator, Tuple
 from datetime import datetime
+import asyncio
+import json
+import logging
 import os
 
-# from app.agents.orchestrator import SwarmOrchestrator
+from app.agents.orchestrator import SwarmOrchestrator
+from app.analytics.adverse_impact import get_adverse_impact_tracker
+from app.api.dependencies import get_orchestrator, verify_api_key
+from app.db.database import ReadOnlySessionLocal, get_read_db
+from app.db.queries import candidate_evaluations, latest_agent_votes
+from app.tracing import span
 
 router = APIRouter()
 
-# API authentication
-RAILS_API_KEY = os.getenv("AI_SERVICE_API_KEY", "development-key")
+logger = logging.getLogger(__name__)
+
+# Max candidates evaluated at once by a single batch request
+BATCH_EVALUATION_CONCURRENCY = int(os.getenv("BATCH_EVALUATION_CONCURRENCY", "8"))
+BATCH_EVALUATION_MAX_SIZE = int(os.getenv("BATCH_EVALUATION_MAX_SIZE", "1000"))
 
 
 class EvaluationRequest(BaseModel):
@@ -26,6 +40,18 @@ class EvaluationRequest(BaseModel):
     job_opening_id: Optional[int] = Field(
         None, description="Rails JobOpening ID for matching"
     )
+    rerun_all_agents: bool = Field(
+        False, description="Re-run every agent instead of reusing unchanged votes"
+    )
+    include_timings: bool = Field(
+        False, description="Return a per-stage timing breakdown"
+    )
+    eeo_group: Optional[str] = Field(
+        None,
+        max_length=64,
+        description="Voluntary self-identified EEO group; only used for "
+        "aggregate adverse impact statistics, never shown to agents",
+    )
 
 
 class EvaluationResponse(BaseModel):
@@ -43,14 +69,40 @@ class EvaluationResponse(BaseModel):
     bias_flags: List[Dict[str, Any]] = Field(
         default_factory=list, description="EEOC compliance issues"
     )
+    unreviewed_bias_flags: List[Dict[str, Any]] = Field(
+        default_factory=list,
+        description="Keyword scan flags the bias review could not check "
+        "(it timed out or failed)",
+    )
+    timed_out_agents: List[str] = Field(
+        default_factory=list, description="Agents that fell back after a timeout"
+    )
+    reused_agents: List[str] = Field(
+        default_factory=list, description="Agents whose stored vote was reused"
+    )
     evaluated_at: datetime
     processing_time_ms: float
+    timings: Optional[Dict[str, Any]] = Field(
+        None, description="Stage spans (when include_timings is set)"
+    )
+
+
+class BatchEvaluationRequest(BaseModel):
+    """Request model for evaluating many candidates at once"""
+
+    evaluations: List[EvaluationRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=BATCH_EVALUATION_MAX_SIZE,
+        description="Candidates to evaluate, possibly for the same job opening",
+    )
 
 
 @router.post("/evaluate", response_model=EvaluationResponse)
 async def evaluate_candidate(
     request: EvaluationRequest,
     authorization: Optional[str] = Header(None),
+    orchestrator: SwarmOrchestrator = Depends(get_orchestrator),
 ):
     """
     Main endpoint: Evaluate a candidate using swarm intelligence
@@ -70,89 +122,266 @@ async def evaluate_candidate(
     Returns:
         EvaluationResponse with agent votes, consensus, and bias flags
     """
-    # Verify API key
-    if authorization:
-        token = authorization.replace("Bearer ", "")
-        if token != RAILS_API_KEY:
-            raise HTTPException(status_code=401, detail="Invalid API key")
-    elif os.getenv("ENV") != "development":
-        raise HTTPException(status_code=401, detail="Missing authorization header")
-
-    # TODO: Implement actual swarm orchestration
-    # orchestrator = SwarmOrchestrator()
-    # result = await orchestrator.evaluate_candidate(
-    #     candidate_id=request.candidate_id,
-    #     resume_url=request.resume_url,
-    #     linkedin_url=request.linkedin_url,
-    #     github_url=request.github_url,
-    #     job_opening_id=request.job_opening_id
-    # )
-
-    # Mock response for now
-    mock_response = {
-        "candidate_id": request.candidate_id,
-        "job_opening_id": request.job_opening_id,
-        "agent_votes": {
-            "linkedin_agent": {
-                "score": 0.85,
-                "confidence": 0.9,
-                "reasoning": "Strong professional experience matching requirements",
-            },
-            "github_agent": {
-                "score": 0.75,
-                "confidence": 0.8,
-                "reasoning": "Active contributor with relevant projects",
-            },
-            "resume_agent": {
-                "score": 0.88,
-                "confidence": 0.95,
-                "reasoning": "Well-structured resume with relevant skills",
-            },
-            "bias_detection_agent": {
-                "score": 0.92,
-                "confidence": 1.0,
-                "reasoning": "No bias flags detected, EEOC compliant",
-            },
-            "predictive_agent": {
-                "score": 0.82,
-                "confidence": 0.85,
-                "reasoning": "High probability of success based on historical data",
-            },
-            "consensus_agent": {
-                "score": 0.84,
-                "confidence": 0.88,
-                "reasoning": "Strong consensus across all agents",
-            },
-        },
-        "consensus_details": {
-            "voting_mechanism": "weighted_average",
-            "agreement_score": 0.88,
-            "agents_in_consensus": 6,
-            "agents_total": 6,
-        },
-        "overall_confidence": 0.84,
-        "bias_flags": [],
-        "evaluated_at": datetime.utcnow(),
-        "processing_time_ms": 1250.5,
-    }
+    verify_api_key(authorization)
+    previous = await _load_previous_votes([request])
+
+    result = await orchestrator.evaluate_candidate(
+        candidate_id=request.candidate_id,
+        resume_url=request.resume_url,
+        linkedin_url=request.linkedin_url,
+        github_url=request.github_url,
+        job_opening_id=request.job_opening_id,
+        previous_votes=previous.get((request.candidate_id, request.job_opening_id)),
+    )
+    await _record_adverse_impact(request, result)
+
+    return _to_response(request, result)
+
+
+@router.post("/evaluate/stream")
+async def evaluate_candidate_stream(
+    request: EvaluationRequest,
+    authorization: Optional[str] = Header(None),
+    orchestrator: SwarmOrchestrator = Depends(get_orchestrator),
+):
+    """
+    Evaluate a candidate, streaming progress as Server-Sent Events
+
+    Events, in order:
+    - agent_vote: one per LinkedIn/GitHub/Resume/Predictive agent, as each
+      finishes (fastest first)
+    - bias_review: the bias detection agent's vote
+    - consensus: the complete EvaluationResponse
+
+    Args:
+        request: Candidate evaluation request
+        authorization: Bearer token for API authentication
+
+    Returns:
+        text/event-stream of evaluation progress
+    """
+    verify_api_key(authorization)
+    previous = await _load_previous_votes([request])
+
+    return StreamingResponse(
+        _stream_events(
+            orchestrator,
+            request,
+            previous.get((request.candidate_id, request.job_opening_id)),
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _stream_events(
+    orchestrator: SwarmOrchestrator,
+    request: EvaluationRequest,
+    previous_votes: Optional[Dict[str, Any]],
+) -> AsyncIterator[str]:
+    """Format orchestrator progress as SSE messages"""
+    events = orchestrator.iter_evaluation(
+        candidate_id=request.candidate_id,
+        resume_url=request.resume_url,
+        linkedin_url=request.linkedin_url,
+        github_url=request.github_url,
+        job_opening_id=request.job_opening_id,
+        previous_votes=previous_votes,
+    )
+    try:
+        async for event, data in events:
+            if event == "consensus":
+                await _record_adverse_impact(request, data)
+                payload = _to_response(request, data).model_dump_json()
+            else:
+                payload = json.dumps(jsonable_encoder(data))
+            yield f"event: {event}\ndata: {payload}\n\n"
+    finally:
+        await events.aclose()
+
+
+@router.post("/evaluate/batch")
+async def evaluate_candidates_batch(
+    batch: BatchEvaluationRequest,
+    authorization: Optional[str] = Header(None),
+    orchestrator: SwarmOrchestrator = Depends(get_orchestrator),
+):
+    """
+    Evaluate many candidates in one request
+
+    Candidates are evaluated with bounded concurrency and each
+    EvaluationResponse is streamed back as one NDJSON line as soon as it
+    is ready, so results arrive in completion order, not request order.
+    A candidate whose evaluation fails yields an error line instead:
+    {"candidate_id": ..., "job_opening_id": ..., "error": "..."}
+
+    Args:
+        batch: Candidates to evaluate
+        authorization: Bearer token for API authentication
+
+    Returns:
+        application/x-ndjson stream of EvaluationResponse objects
+    """
+    verify_api_key(authorization)
+    previous = await _load_previous_votes(batch.evaluations)
+
+    return StreamingResponse(
+        _stream_batch(orchestrator, batch.evaluations, previous),
+        media_type="application/x-ndjson",
+    )
+
+
+async def _stream_batch(
+    orchestrator: SwarmOrchestrator,
+    requests: List[EvaluationRequest],
+    previous: Dict[Tuple[int, int], Dict[str, Any]],
+) -> AsyncIterator[str]:
+    """Evaluate requests concurrently and yield NDJSON lines as they finish"""
+    semaphore = asyncio.Semaphore(BATCH_EVALUATION_CONCURRENCY)
+
+    async def evaluate_one(request: EvaluationRequest) -> str:
+        async with semaphore:
+            try:
+                result = await orchestrator.evaluate_candidate(
+                    candidate_id=request.candidate_id,
+                    resume_url=request.resume_url,
+                    linkedin_url=request.linkedin_url,
+                    github_url=request.github_url,
+                    job_opening_id=request.job_opening_id,
+                    previous_votes=previous.get(
+                        (request.candidate_id, request.job_opening_id)
+                    ),
+                )
+                await _record_adverse_impact(request, result)
+                return _to_response(request, result).model_dump_json()
+            except Exception as exc:
+                # One failed candidate yields an error line, not a broken stream
+                return json.dumps(
+                    {
+                        "candidate_id": request.candidate_id,
+                        "job_opening_id": request.job_opening_id,
+                        "error": str(exc),
+                    }
+                )
 
-    return EvaluationResponse(**mock_response)
+    tasks = [asyncio.create_task(evaluate_one(request)) for request in requests]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            line = await next_done
+            yield line + "\n"
+    finally:
+        # Client disconnected or stream finished: stop any leftover work
+        for task in tasks:
+            task.cancel()
+
+
+def _to_response(
+    request: EvaluationRequest, result: Dict[str, Any]
+) -> EvaluationResponse:
+    """Build the response, keeping timings only if they were requested"""
+    with span("serialize"):
+        response = EvaluationResponse(**result)
+        if not request.include_timings:
+            response.timings = None
+        return response
+
+
+async def _record_adverse_impact(request: EvaluationRequest, result: Dict[str, Any]):
+    """
+    Count the outcome toward adverse impact statistics, if the candidate
+    self-identified; analytics failures never fail the evaluation
+    """
+    if not request.eeo_group or request.job_opening_id is None:
+        return
+    try:
+        await get_adverse_impact_tracker().record(
+            request.candidate_id,
+            request.job_opening_id,
+            request.eeo_group,
+            result["overall_confidence"],
+        )
+    except Exception as exc:
+        logger.warning("Could not record adverse impact outcome: %s", exc)
+
+
+async def _load_previous_votes(
+    requests: List[EvaluationRequest],
+) -> Dict[Tuple[int, int], Dict[str, Any]]:
+    """
+    Latest stored agent_votes for each request, for incremental re-evaluation
+
+    Uses its own short-lived session rather than a request-scoped one, so
+    no pooled connection sits idle in a transaction while the swarm runs
+    or the response streams. Reuse is only an optimization: if the lookup
+    fails, every agent runs.
+    """
+    pairs = [
+        (request.candidate_id, request.job_opening_id)
+        for request in requests
+        if request.job_opening_id is not None and not request.rerun_all_agents
+    ]
+    if not pairs:
+        return {}
+    try:
+        with span("load_previous_votes"):
+            async with ReadOnlySessionLocal() as session:
+                return await latest_agent_votes(session, pairs)
+    except Exception as exc:
+        logger.warning("Could not load previous votes, running full swarm: %s", exc)
+        return {}
 
 
 @router.get("/evaluations/{candidate_id}")
-async def get_candidate_evaluations(candidate_id: int):
+async def get_candidate_evaluations(
+    candidate_id: int,
+    limit: int = Query(20, ge=1, le=200, description="Page size"),
+    cursor: Optional[str] = Query(None, description="next_cursor of previous page"),
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated columns, e.g. "
+        "'overall_confidence,consensus_details,agent_votes'",
+    ),
+    job_opening_id: Optional[int] = Query(None, description="Filter by job opening"),
+    db: AsyncSession = Depends(get_read_db),
+    authorization: Optional[str] = Header(None),
+):
     """
-    Get all evaluations for a specific candidate
+    Get evaluations for a specific candidate, newest first
+
+    Uses keyset pagination: pass the returned next_cursor to get the next
+    page. The large agent_votes and consensus_details columns are only
+    returned when listed in fields.
 
     Args:
         candidate_id: Rails Candidate ID
+        limit: Page size
+        cursor: Cursor from the previous page
+        fields: Columns to return
+        job_opening_id: Only evaluations for this job opening
+        authorization: Bearer token for API authentication
 
     Returns:
-        List of evaluations for the candidate
+        Page of evaluations for the candidate
     """
-    # TODO: Query database for evaluations
+    verify_api_key(authorization)
+
+    try:
+        evaluations, next_cursor = await candidate_evaluations(
+            db,
+            candidate_id,
+            limit=limit,
+            cursor=cursor,
+            fields=fields.split(",") if fields else None,
+            job_opening_id=job_opening_id,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    finally:
+        await db.close()
+
     return {
         "candidate_id": candidate_id,
-        "evaluations": [],
-        "total_count": 0,
+        "evaluations": evaluations,
+        "count": len(evaluations),
+        "next_cursor": next_cursor,
     }
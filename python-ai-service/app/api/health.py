@@ -2,9 +2,17 @@
 Health check endpoints
 """
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 from datetime import datetime
 
+from app.agents.llm_cache import get_llm_cache
+from app.agents.orchestrator import SwarmOrchestrator
+from app.api.dependencies import get_orchestrator
+from app.sources.github import get_github_fetcher
+from app.sources.linkedin import get_linkedin_store
+from app.agents.skill_matcher import get_skill_matcher
+from app.ml.vector_index import get_vector_index
+
 router = APIRouter()
 
 
@@ -19,27 +27,22 @@ async def health_check():
 
 
 @router.get("/agents/status")
-async def agent_status():
+async def agent_status(orchestrator: SwarmOrchestrator = Depends(get_orchestrator)):
     """
     Check status of all AI agents
 
     Returns:
-        dict: Status of each agent and swarm metrics
+        dict: Status and version of each agent, the consensus mechanism,
+        and swarm metrics
     """
-    # TODO: Implement actual agent status checking
     return {
-        "active_agents": [
-            {"name": "linkedin_agent", "status": "ready", "version": "0.1.0"},
-            {"name": "github_agent", "status": "ready", "version": "0.1.0"},
-            {"name": "resume_agent", "status": "ready", "version": "0.1.0"},
-            {"name": "bias_detection_agent", "status": "ready", "version": "0.1.0"},
-            {"name": "predictive_agent", "status": "ready", "version": "0.1.0"},
-            {"name": "consensus_agent", "status": "ready", "version": "0.1.0"},
-        ],
-        "swarm_metrics": {
-            "total_evaluations": 0,
-            "average_confidence": 0.0,
-            "bias_flags_detected": 0,
-        },
+        "active_agents": orchestrator.get_agent_status(),
+        "consensus": {"mechanism": orchestrator.consensus_builder.mechanism},
+        "swarm_metrics": orchestrator.get_metrics(),
+        "llm_cache": get_llm_cache().stats(),
+        "github": get_github_fetcher().stats(),
+        "linkedin": get_linkedin_store().stats(),
+        "skill_matcher": get_skill_matcher().stats(),
+        "vector_index": get_vector_index().stats(),
         "timestamp": datetime.utcnow().isoformat(),
     }
@@ -0,0 +1,128 @@
+"""
+Candidate ranking endpoints
+"""
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+
+from app.api.dependencies import verify_api_key
+from app.db.database import get_read_db
+from app.db.models import JobOpening
+from app.db.queries import top_candidates
+from app.ml.features import job_vector
+from app.ml.predictive import get_predictive_model, interaction_features
+from app.ml.vector_index import get_vector_index
+
+router = APIRouter()
+
+
+@router.get("/job_openings/{job_opening_id}/top_candidates")
+async def get_top_candidates(
+    job_opening_id: int,
+    limit: int = Query(20, ge=1, le=500, description="Number of candidates"),
+    exclude_bias_flagged: bool = Query(
+        False, description="Skip decisions with bias flags"
+    ),
+    min_agreement: Optional[float] = Query(
+        None, ge=0.0, le=1.0, description="Minimum consensus agreement score"
+    ),
+    include_votes: bool = Query(False, description="Include agent_votes JSONB"),
+    authorization: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Best candidates for a job opening, ordered by overall_confidence
+
+    Args:
+        job_opening_id: Rails JobOpening ID
+        limit: Number of candidates to return
+        exclude_bias_flagged: Skip decisions with any bias flags
+        min_agreement: Minimum consensus agreement_score
+        include_votes: Include individual agent votes (large)
+
+    Returns:
+        Top-k swarm decisions, one per candidate
+    """
+    verify_api_key(authorization)
+
+    decisions = await top_candidates(
+        db,
+        job_opening_id,
+        limit=limit,
+        exclude_bias_flagged=exclude_bias_flagged,
+        min_agreement=min_agreement,
+        include_votes=include_votes,
+    )
+    await db.close()
+
+    return {
+        "job_opening_id": job_opening_id,
+        "candidates": decisions,
+        "count": len(decisions),
+    }
+
+
+@router.get("/job_openings/{job_opening_id}/similar_candidates")
+async def get_similar_candidates(
+    job_opening_id: int,
+    limit: int = Query(20, ge=1, le=1000, description="Number of candidates"),
+    candidate_ids: Optional[str] = Query(
+        None, description="Comma-separated candidate IDs to score instead"
+    ),
+    authorization: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Candidates most similar to a job opening, by vector cosine fit
+
+    A cheap pre-screen that needs no LLM calls: the job is vectorized from
+    its required skills and description and scored against every indexed
+    candidate of the same company.
+
+    Args:
+        job_opening_id: Rails JobOpening ID
+        limit: Number of candidates to return
+        candidate_ids: Only score these candidates (fit_score is null for
+            candidates not yet indexed)
+
+    Returns:
+        Candidates with fit_score in [-1, 1], best first, plus
+        hire_probability once a predictive model has been trained
+    """
+    verify_api_key(authorization)
+
+    job = await db.get(JobOpening, job_opening_id)
+    await db.close()
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job opening not found")
+    query = job_vector(job.required_skills, job.description, job.title)
+    index = get_vector_index()
+
+    if candidate_ids:
+        try:
+            ids = [int(value) for value in candidate_ids.split(",") if value.strip()]
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid candidate_ids")
+        scores = index.fit_scores(query, ids)
+        candidates = [
+            {"candidate_id": candidate_id, "fit_score": score}
+            for candidate_id, score in scores.items()
+        ]
+    else:
+        candidates = index.similar(query, company_id=job.company_id, limit=limit)
+
+    model = get_predictive_model()
+    if model is not None and candidates:
+        vectors = await index.candidate_vectors(
+            [candidate["candidate_id"] for candidate in candidates]
+        )
+        probabilities = model.predict(interaction_features(vectors, query[None, :]))
+        for candidate, probability in zip(candidates, probabilities):
+            candidate["hire_probability"] = round(float(probability), 4)
+
+    return {
+        "job_opening_id": job_opening_id,
+        "candidates": candidates,
+        "count": len(candidates),
+    }
@@ -0,0 +1,132 @@
+"""
+Capability Assessments - Bulk upsert of skills found by agents
+
+Skills that agents report in vote metadata (skills_matched) become
+capability_assessments rows for the candidate. Rows are merged per
+(person_type, person_id, skill_id) and written with multi-row
+INSERT ... ON CONFLICT DO UPDATE statements against the
+idx_unique_capability_per_person_skill unique index, so an evaluation with
+dozens of skills costs one statement instead of one merge per row.
+"""
+
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from sqlalchemy import or_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import CapabilityAssessment
+
+# Rows per statement, well below PostgreSQL's bind parameter limit
+ASSESSMENT_CHUNK_SIZE = 1000
+
+# Agents whose skills_matched become assessments, keyed as in
+# result["agent_votes"], by verification source (values follow the Rails
+# CapabilityAssessment verification sources)
+AGENT_SOURCES = {
+    "resume_agent": "resume",
+    "github_agent": "github",
+    "linkedin_agent": "linkedin",
+}
+MULTIPLE_SOURCES = "ai_agent"
+MANUAL_SOURCE = "manual"
+
+
+def assessments_from_result(
+    result: Dict[str, Any], skill_id: Callable[[str], Optional[int]]
+) -> List[Dict[str, Any]]:
+    """
+    Capability assessment rows for the skills agents found in an evaluation
+
+    Each skill's confidence combines the confidences of the agents that
+    found it (noisy-or), and proficiency grows with the number of
+    independent sources: one source is beginner, three are advanced.
+
+    Args:
+        result: Orchestrator result
+        skill_id: Skill name -> skills.id lookup (see SkillMatcher.skill_id)
+    """
+    sources: Dict[int, Dict[str, float]] = {}
+    for agent_key, source in AGENT_SOURCES.items():
+        vote = result["agent_votes"].get(agent_key)
+        if not vote:
+            continue
+        for name in vote["metadata"].get("skills_matched") or []:
+            found_id = skill_id(name)
+            if found_id is not None:
+                sources.setdefault(found_id, {})[source] = vote["confidence"]
+
+    now = datetime.utcnow()
+    rows = []
+    for found_id, confidences in sources.items():
+        missing = 1.0
+        for confidence in confidences.values():
+            missing *= 1.0 - confidence
+        rows.append(
+            {
+                "person_type": "Candidate",
+                "person_id": result["candidate_id"],
+                "skill_id": found_id,
+                "proficiency": min(len(confidences) - 1, 2),
+                "verified_by": (
+                    next(iter(confidences))
+                    if len(confidences) == 1
+                    else MULTIPLE_SOURCES
+                ),
+                "evidence": {
+                    "sources": sorted(confidences),
+                    "job_opening_id": result.get("job_opening_id"),
+                },
+                "confidence_score": round(min(1.0 - missing, 0.9999), 4),
+                "created_at": now,
+                "updated_at": now,
+            }
+        )
+    return rows
+
+
+def merge_assessments(rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    One row per (person_type, person_id, skill_id), latest wins
+
+    ON CONFLICT cannot touch the same row twice in one statement. Sorting
+    by key also makes concurrent upserts lock rows in the same order.
+    """
+    merged = {}
+    for row in rows:
+        merged[(row["person_type"], row["person_id"], row["skill_id"])] = row
+    return [merged[key] for key in sorted(merged)]
+
+
+async def upsert_capability_assessments(
+    session: AsyncSession, rows: Iterable[Dict[str, Any]]
+) -> int:
+    """
+    Insert or update assessments in chunks (caller commits)
+
+    Assessments verified manually are never overwritten.
+
+    Returns:
+        Number of distinct rows submitted
+    """
+    rows = merge_assessments(rows)
+    table = CapabilityAssessment.__table__
+    for start in range(0, len(rows), ASSESSMENT_CHUNK_SIZE):
+        statement = pg_insert(table).values(rows[start : start + ASSESSMENT_CHUNK_SIZE])
+        excluded = statement.excluded
+        statement = statement.on_conflict_do_update(
+            index_elements=["person_type", "person_id", "skill_id"],
+            set_={
+                "proficiency": excluded.proficiency,
+                "verified_by": excluded.verified_by,
+                "evidence": excluded.evidence,
+                "confidence_score": excluded.confidence_score,
+                "updated_at": excluded.updated_at,
+            },
+            where=or_(
+                table.c.verified_by.is_(None), table.c.verified_by != MANUAL_SOURCE
+            ),
+        )
+        await session.execute(statement)
+    return len(rows)
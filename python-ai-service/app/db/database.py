@@ -4,7 +4,6 @@ Database connection configuration
 Shares the same PostgreSQL database with Rails using SQLAlchemy.
 """
 
-from sqlalchemy import create_engine
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
@@ -15,28 +14,68 @@ DATABASE_URL = os.getenv(
     "DATABASE_URL", "postgresql://localhost/honeybee_development"
 )
 
-# Convert to async URL for asyncpg
-if DATABASE_URL.startswith("postgresql://"):
-    ASYNC_DATABASE_URL = DATABASE_URL.replace(
-        "postgresql://", "postgresql+asyncpg://", 1
+# Optional read replica for read-only sessions (defaults to the primary)
+DATABASE_REPLICA_URL = os.getenv("DATABASE_REPLICA_URL")
+
+# Connection pool settings; the database is shared with Rails, so keep
+# pool_size + max_overflow per worker well under Postgres max_connections
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "5"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+
+# asyncpg prepared statement cache; set to 0 behind PgBouncer
+# in transaction pooling mode
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "100"))
+
+
+def to_async_url(url: str) -> str:
+    """Convert a postgresql:// URL to use the asyncpg driver"""
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    return url
+
+
+def make_engine(url: str):
+    """Create an async engine with the configured pool settings"""
+    return create_async_engine(
+        to_async_url(url),
+        echo=os.getenv("SQL_ECHO", "false").lower() == "true",
+        future=True,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=DB_POOL_PRE_PING,
+        connect_args={"statement_cache_size": DB_STATEMENT_CACHE_SIZE},
     )
-else:
-    ASYNC_DATABASE_URL = DATABASE_URL
-
-# Create async engine
-engine = create_async_engine(
-    ASYNC_DATABASE_URL,
-    echo=os.getenv("SQL_ECHO", "false").lower() == "true",
-    future=True,
-)
 
-# Create async session factory
+
+ASYNC_DATABASE_URL = to_async_url(DATABASE_URL)
+
+# Create async engines
+engine = make_engine(DATABASE_URL)
+replica_engine = make_engine(DATABASE_REPLICA_URL) if DATABASE_REPLICA_URL else engine
+
+# Create async session factories
 AsyncSessionLocal = sessionmaker(
     engine,
     class_=AsyncSession,
     expire_on_commit=False,
 )
 
+# Read-only sessions go to the replica when one is configured, and their
+# transactions are READ ONLY, so a stray write fails instead of landing on
+# the primary
+read_only_engine = replica_engine.execution_options(postgresql_readonly=True)
+ReadOnlySessionLocal = sessionmaker(
+    read_only_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False,
+)
+
 # Base class for models
 Base = declarative_base()
 
@@ -50,6 +89,13 @@ async def init_db():
         pass
 
 
+async def close_db():
+    """Close all pooled database connections"""
+    await engine.dispose()
+    if replica_engine is not engine:
+        await replica_engine.dispose()
+
+
 async def get_db():
     """
     Dependency for FastAPI routes to get database session
@@ -68,3 +114,23 @@ async def get_db():
             raise
         finally:
             await session.close()
+
+
+async def get_read_db():
+    """
+    Dependency for short read-only routes
+
+    Uses the replica when DATABASE_REPLICA_URL is set, in a READ ONLY
+    transaction that is never committed. Routes should close the session
+    once their queries are done, so the connection goes back to the pool
+    before the response is serialized and sent; long-running routes (e.g.
+    evaluations) should open a ReadOnlySessionLocal() just for their
+    queries instead.
+
+    Usage:
+        @router.get("/items")
+        async def get_items(db: AsyncSession = Depends(get_read_db)):
+            ...
+    """
+    async with ReadOnlySessionLocal() as session:
+        yield session
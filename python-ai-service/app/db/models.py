@@ -63,6 +63,20 @@ class Candidate(Base):
     swarm_decisions = relationship("SwarmDecision", back_populates="candidate")
 
 
+class Employee(Base):
+    """Internal employee (matches Rails Employee model)"""
+
+    __tablename__ = "employees"
+
+    id = Column(Integer, primary_key=True, index=True)
+    company_id = Column(Integer, ForeignKey("companies.id"), nullable=False)
+    name = Column(String)
+    email = Column(String, index=True)
+    internal_profile = Column(JSONB, default={})
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
 class JobOpening(Base):
     """Job opening (matches Rails JobOpening model)"""
 
@@ -108,6 +122,18 @@ class SwarmDecision(Base):
     __table_args__ = (
         Index("index_swarm_decisions_on_evaluated_at", "evaluated_at"),
         Index("index_swarm_decisions_on_overall_confidence", "overall_confidence"),
+        Index(
+            "index_swarm_decisions_on_job_opening_confidence_id",
+            "job_opening_id",
+            "overall_confidence",
+            "id",
+        ),
+        Index(
+            "index_swarm_decisions_on_candidate_evaluated_at_id",
+            "candidate_id",
+            "evaluated_at",
+            "id",
+        ),
     )
 
 
@@ -119,7 +145,8 @@ class Skill(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False, index=True, unique=True)
     category = Column(String)  # technical, soft, domain
-    metadata = Column(JSONB, default={})
+    # "metadata" is reserved on declarative classes, so map it under another name
+    metadata_ = Column("metadata", JSONB, default={})
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -0,0 +1,255 @@
+"""
+Read queries against Rails-managed tables
+
+Queries select only the columns callers need; the large agent_votes
+JSONB column is left out unless explicitly requested.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+import base64
+import json
+
+from sqlalchemy import Float, literal_column, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import SwarmDecision
+
+# Summary columns returned for every decision
+DECISION_SUMMARY_COLUMNS = (
+    SwarmDecision.id,
+    SwarmDecision.candidate_id,
+    SwarmDecision.job_opening_id,
+    SwarmDecision.decision_type,
+    SwarmDecision.overall_confidence,
+    SwarmDecision.consensus_details,
+    SwarmDecision.bias_flags,
+    SwarmDecision.evaluated_at,
+)
+
+# Columns callers may project with `fields`; id and evaluated_at are
+# always returned because the pagination cursor needs them
+DECISION_FIELDS = {
+    column.key: column
+    for column in (
+        *DECISION_SUMMARY_COLUMNS,
+        SwarmDecision.agent_votes,
+    )
+}
+DEFAULT_EVALUATION_FIELDS = (
+    "id",
+    "candidate_id",
+    "job_opening_id",
+    "decision_type",
+    "overall_confidence",
+    "bias_flags",
+    "evaluated_at",
+)
+
+
+def encode_cursor(evaluated_at: datetime, decision_id: int) -> str:
+    """Opaque keyset cursor for (evaluated_at, id)"""
+    raw = json.dumps([evaluated_at.isoformat(), decision_id])
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a cursor from encode_cursor
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        evaluated_at, decision_id = json.loads(base64.urlsafe_b64decode(cursor))
+        return datetime.fromisoformat(evaluated_at), int(decision_id)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"Invalid cursor: {cursor}") from exc
+
+
+def decision_to_dict(row: Any) -> Dict[str, Any]:
+    """Convert a projected SwarmDecision row into a JSON-friendly dict"""
+    decision = dict(row._mapping)
+    if decision.get("overall_confidence") is not None:
+        decision["overall_confidence"] = float(decision["overall_confidence"])
+    return decision
+
+
+async def top_candidates(
+    session: AsyncSession,
+    job_opening_id: int,
+    limit: int = 20,
+    exclude_bias_flagged: bool = False,
+    min_agreement: Optional[float] = None,
+    include_votes: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Top candidates for a job opening by overall_confidence
+
+    Each candidate appears once, represented by their highest-confidence
+    decision. Rows are read in descending overall_confidence order so
+    Postgres walks index_swarm_decisions_on_job_opening_confidence_id
+    (job_opening_id, overall_confidence, id) backwards and stops early;
+    pages continue from the last (confidence, id) seen until `limit`
+    distinct candidates are found.
+
+    Args:
+        session: Database session
+        job_opening_id: Rails JobOpening ID
+        limit: Number of candidates to return
+        exclude_bias_flagged: Skip decisions with any bias flags
+        min_agreement: Minimum consensus agreement_score
+        include_votes: Include the agent_votes JSONB column
+
+    Returns:
+        Decisions ordered best first
+    """
+    columns = list(DECISION_SUMMARY_COLUMNS)
+    if include_votes:
+        columns.append(SwarmDecision.agent_votes)
+
+    stmt = select(*columns).where(
+        SwarmDecision.job_opening_id == job_opening_id,
+        # Served by a backward scan of (job_opening_id, overall_confidence, id)
+        SwarmDecision.overall_confidence.isnot(None),
+    )
+    if exclude_bias_flagged:
+        stmt = stmt.where(
+            SwarmDecision.bias_flags.is_(None)
+            | (SwarmDecision.bias_flags == literal_column("'[]'::jsonb"))
+        )
+    if min_agreement is not None:
+        agreement = SwarmDecision.consensus_details["agreement_score"].astext
+        stmt = stmt.where(agreement.cast(Float) >= min_agreement)
+    stmt = stmt.order_by(
+        SwarmDecision.overall_confidence.desc(), SwarmDecision.id.desc()
+    )
+
+    results: List[Dict[str, Any]] = []
+    seen_candidates = set()
+    page_size = limit * 2
+    page_stmt = stmt
+    while len(results) < limit:
+        rows = (await session.execute(page_stmt.limit(page_size))).all()
+        for row in rows:
+            if row.candidate_id in seen_candidates:
+                continue
+            seen_candidates.add(row.candidate_id)
+            results.append(decision_to_dict(row))
+            if len(results) == limit:
+                break
+        if len(rows) < page_size:
+            break
+
+        last = rows[-1]
+        page_stmt = stmt.where(
+            (SwarmDecision.overall_confidence < last.overall_confidence)
+            | (
+                (SwarmDecision.overall_confidence == last.overall_confidence)
+                & (SwarmDecision.id < last.id)
+            )
+        )
+
+    return results
+
+
+async def latest_agent_votes(
+    session: AsyncSession, pairs: Iterable[Tuple[int, int]]
+) -> Dict[Tuple[int, int], Dict[str, Any]]:
+    """
+    agent_votes of the most recent decision for each (candidate, job) pair
+
+    Args:
+        session: Database session
+        pairs: (candidate_id, job_opening_id) pairs
+
+    Returns:
+        Mapping of pair -> agent_votes for pairs that have a decision
+    """
+    pairs = list(set(pairs))
+    if not pairs:
+        return {}
+
+    stmt = (
+        select(
+            SwarmDecision.candidate_id,
+            SwarmDecision.job_opening_id,
+            SwarmDecision.agent_votes,
+        )
+        .where(
+            tuple_(SwarmDecision.candidate_id, SwarmDecision.job_opening_id).in_(pairs)
+        )
+        .distinct(SwarmDecision.candidate_id, SwarmDecision.job_opening_id)
+        .order_by(
+            SwarmDecision.candidate_id,
+            SwarmDecision.job_opening_id,
+            SwarmDecision.evaluated_at.desc().nulls_last(),
+            SwarmDecision.id.desc(),
+        )
+    )
+    rows = (await session.execute(stmt)).all()
+    return {
+        (row.candidate_id, row.job_opening_id): row.agent_votes or {} for row in rows
+    }
+
+
+async def candidate_evaluations(
+    session: AsyncSession,
+    candidate_id: int,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
+    job_opening_id: Optional[int] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    A candidate's evaluations, newest first, one keyset page at a time
+
+    Pages continue from the (evaluated_at, id) of the previous page's last
+    row, so deep pages cost the same as the first one.
+
+    Args:
+        session: Database session
+        candidate_id: Rails Candidate ID
+        limit: Page size
+        cursor: next_cursor from the previous page
+        fields: Columns to return (default DEFAULT_EVALUATION_FIELDS)
+        job_opening_id: Only evaluations for this job opening
+
+    Returns:
+        Tuple of (evaluations, next_cursor); next_cursor is None on the
+        last page
+
+    Raises:
+        ValueError: If the cursor or a field name is invalid
+    """
+    fields = list(fields or DEFAULT_EVALUATION_FIELDS)
+    unknown = [field for field in fields if field not in DECISION_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    for required in ("evaluated_at", "id"):
+        if required not in fields:
+            fields.append(required)
+
+    stmt = select(*(DECISION_FIELDS[field] for field in fields)).where(
+        SwarmDecision.candidate_id == candidate_id,
+        SwarmDecision.evaluated_at.isnot(None),
+    )
+    if job_opening_id is not None:
+        stmt = stmt.where(SwarmDecision.job_opening_id == job_opening_id)
+    if cursor is not None:
+        evaluated_at, decision_id = decode_cursor(cursor)
+        stmt = stmt.where(
+            tuple_(SwarmDecision.evaluated_at, SwarmDecision.id)
+            < tuple_(evaluated_at, decision_id)
+        )
+    stmt = stmt.order_by(
+        SwarmDecision.evaluated_at.desc(), SwarmDecision.id.desc()
+    ).limit(limit + 1)
+
+    rows = (await session.execute(stmt)).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].evaluated_at, rows[-1].id)
+
+    return [decision_to_dict(row) for row in rows], next_cursor
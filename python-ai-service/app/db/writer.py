@@ -0,0 +1,289 @@
+"""
+Decision Writer - Write-behind batching for SwarmDecision rows
+
+Evaluations hand their results to an in-process queue instead of writing
+one row per transaction. A background task flushes the queue in batches of
+up to DECISION_WRITER_BATCH_SIZE rows, or every
+DECISION_WRITER_FLUSH_INTERVAL_MS, as a single multi-row INSERT. Skills the
+agents found are upserted into capability_assessments in a savepoint of
+the same transaction (see app.db.assessments), so a failed upsert drops
+only the assessments, never the batch of decisions.
+
+A flush that fails on a transient database error (connection lost,
+timeout) is retried up to DECISION_WRITER_MAX_RETRIES times with
+exponential backoff. A batch rejected for bad data (e.g. a foreign key to
+a deleted candidate) is split in halves until only the offending rows are
+dropped. A failed COMMIT is never retried, since the server may already
+have committed it and a retry would store the decisions twice.
+
+Decision rows are off by default: Rails' RequestAiEvaluationJob stores a
+SwarmDecision from the response itself, so set DECISION_WRITER_ENABLED
+only for deployments whose callers do not (e.g. batch or streaming
+clients), or every evaluation is stored twice. Capability assessments
+have no other writer, so they are written whenever
+CAPABILITY_ASSESSMENTS_ENABLED is set (the default), with or without
+decision rows.
+"""
+
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import asyncio
+import logging
+import os
+
+from sqlalchemy import insert
+from sqlalchemy.exc import (
+    DataError,
+    DBAPIError,
+    IntegrityError,
+    InterfaceError,
+    OperationalError,
+)
+
+from app.agents.skill_matcher import get_skill_matcher
+from app.db.assessments import (
+    assessments_from_result,
+    upsert_capability_assessments,
+)
+from app.db.database import AsyncSessionLocal
+from app.db.models import SwarmDecision
+
+logger = logging.getLogger(__name__)
+
+DECISION_WRITER_ENABLED = (
+    os.getenv("DECISION_WRITER_ENABLED", "false").lower() == "true"
+)
+CAPABILITY_ASSESSMENTS_ENABLED = (
+    os.getenv("CAPABILITY_ASSESSMENTS_ENABLED", "true").lower() == "true"
+)
+DECISION_WRITER_BATCH_SIZE = int(os.getenv("DECISION_WRITER_BATCH_SIZE", "200"))
+DECISION_WRITER_FLUSH_INTERVAL_MS = float(
+    os.getenv("DECISION_WRITER_FLUSH_INTERVAL_MS", "250")
+)
+DECISION_WRITER_MAX_QUEUE = int(os.getenv("DECISION_WRITER_MAX_QUEUE", "10000"))
+DECISION_WRITER_MAX_RETRIES = int(os.getenv("DECISION_WRITER_MAX_RETRIES", "3"))
+DECISION_WRITER_RETRY_BACKOFF_MS = float(
+    os.getenv("DECISION_WRITER_RETRY_BACKOFF_MS", "500")
+)
+
+# Queue sentinel telling the flush loop to stop
+_STOP = object()
+
+
+class CommitFailedError(Exception):
+    """COMMIT failed; the server may or may not have committed the batch"""
+
+
+class DecisionWriter:
+    """
+    Background batcher that persists evaluation results
+
+    Usage:
+        writer = DecisionWriter()
+        await writer.start()
+        await writer.submit(result)  # returns once queued
+        await writer.stop()  # flushes everything left
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable = AsyncSessionLocal,
+        batch_size: int = DECISION_WRITER_BATCH_SIZE,
+        flush_interval_ms: float = DECISION_WRITER_FLUSH_INTERVAL_MS,
+        max_queue: int = DECISION_WRITER_MAX_QUEUE,
+        max_retries: int = DECISION_WRITER_MAX_RETRIES,
+        retry_backoff_ms: float = DECISION_WRITER_RETRY_BACKOFF_MS,
+        decision_type: str = "initial_screen",
+        skill_id: Optional[Callable[[str], Optional[int]]] = None,
+        write_decisions: bool = DECISION_WRITER_ENABLED,
+        write_assessments: bool = CAPABILITY_ASSESSMENTS_ENABLED,
+    ):
+        self.session_factory = session_factory
+        self.write_decisions = write_decisions
+        self.write_assessments = write_assessments
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff_ms / 1000
+        self.decision_type = decision_type
+        self.skill_id = skill_id or (lambda name: get_skill_matcher().skill_id(name))
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self._task: Optional[asyncio.Task] = None
+
+        self.rows_written = 0
+        self.batches_written = 0
+        self.rows_failed = 0
+        self.retries = 0
+        self.assessments_written = 0
+        self.assessments_failed = 0
+
+    async def start(self):
+        """Start the background flush loop"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Flush every queued row, then stop the flush loop"""
+        if self._task is not None:
+            await self._queue.put(_STOP)
+            await self._task
+            self._task = None
+
+    async def submit(self, result: Dict[str, Any]):
+        """
+        Queue an orchestrator result for persistence
+
+        Waits only if the queue is full (backpressure), never for the write.
+        """
+        row = self._to_row(result) if self.write_decisions else None
+        assessments = (
+            assessments_from_result(result, self.skill_id)
+            if self.write_assessments
+            else []
+        )
+        if row is not None or assessments:
+            await self._queue.put((row, assessments))
+
+    def _to_row(self, result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Map an orchestrator result onto swarm_decisions columns"""
+        if result.get("job_opening_id") is None:
+            # swarm_decisions.job_opening_id is NOT NULL in the Rails schema
+            return None
+        now = datetime.utcnow()
+        return {
+            "candidate_id": result["candidate_id"],
+            "job_opening_id": result["job_opening_id"],
+            "decision_type": self.decision_type,
+            "agent_votes": result["agent_votes"],
+            "consensus_details": result["consensus_details"],
+            "overall_confidence": result["overall_confidence"],
+            "bias_flags": result.get("bias_flags", []),
+            "evaluated_at": result.get("evaluated_at") or now,
+            "created_at": now,
+            "updated_at": now,
+        }
+
+    async def _run(self):
+        """Collect rows into batches by size or age and flush them"""
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            item = await self._queue.get()
+            if item is _STOP:
+                break
+            batch = [item]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[Tuple[Optional[dict], List[dict]]]):
+        """Write a batch of queued results"""
+        rows = [row for row, _ in batch if row is not None]
+        assessments = [
+            assessment for _, assessment_rows in batch for assessment in assessment_rows
+        ]
+        await self._persist(rows, assessments)
+        self.batches_written += 1
+
+    async def _persist(self, rows: List[dict], assessments: List[dict]):
+        """
+        Write rows and assessments, retrying transient database errors
+        with backoff and splitting batches that contain bad rows
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                written = await self._write(rows, assessments)
+                break
+            except Exception as exc:
+                if attempt < self.max_retries and _is_transient(exc):
+                    self.retries += 1
+                    delay = self.retry_backoff * 2**attempt
+                    logger.warning(
+                        "Persisting %d swarm decisions failed (%s); retrying in %.1fs",
+                        len(rows),
+                        exc,
+                        delay,
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+                bad_rows = isinstance(exc, (IntegrityError, DataError)) and rows
+                if bad_rows and (len(rows) > 1 or assessments):
+                    # Bisect so only the offending rows are lost
+                    if len(rows) > 1:
+                        middle = len(rows) // 2
+                        await self._persist(rows[:middle], [])
+                        await self._persist(rows[middle:], [])
+                    else:
+                        await self._persist(rows, [])
+                    if assessments:
+                        await self._persist([], assessments)
+                    return
+                self.rows_failed += len(rows)
+                if isinstance(exc, CommitFailedError):
+                    logger.error(
+                        "Commit of %d swarm decisions failed and may have been "
+                        "applied; not retrying: %s",
+                        len(rows),
+                        exc.__cause__,
+                    )
+                else:
+                    logger.exception("Failed to persist %d swarm decisions", len(rows))
+                return
+        self.rows_written += len(rows)
+        self.assessments_written += written
+
+    async def _write(self, rows: List[dict], assessments: List[dict]) -> int:
+        """One multi-row INSERT plus assessment upserts; assessments written"""
+        async with self.session_factory() as session:
+            if rows:
+                await session.execute(insert(SwarmDecision.__table__).values(rows))
+            written = 0
+            if assessments:
+                try:
+                    async with session.begin_nested():
+                        written = await upsert_capability_assessments(
+                            session, assessments
+                        )
+                except IntegrityError:
+                    # e.g. a skill deleted since the skill cache loaded
+                    self.assessments_failed += len(assessments)
+                    logger.exception(
+                        "Failed to upsert %d capability assessments", len(assessments)
+                    )
+            try:
+                await session.commit()
+            except Exception as exc:
+                raise CommitFailedError(str(exc)) from exc
+        return written
+
+    def stats(self) -> Dict[str, int]:
+        """Write counters"""
+        return {
+            "queued": self._queue.qsize(),
+            "rows_written": self.rows_written,
+            "batches_written": self.batches_written,
+            "rows_failed": self.rows_failed,
+            "retries": self.retries,
+            "assessments_written": self.assessments_written,
+            "assessments_failed": self.assessments_failed,
+        }
+
+
+def _is_transient(exc: Exception) -> bool:
+    """Whether a failed write may succeed if retried (not a bad row)"""
+    if isinstance(exc, (OperationalError, InterfaceError)):
+        return True
+    if isinstance(exc, DBAPIError):
+        return exc.connection_invalidated
+    return isinstance(exc, (OSError, asyncio.TimeoutError))
@@ -7,12 +7,32 @@ Main entry point for the Python AI microservice that orchestrates
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 import os
 from contextlib import asynccontextmanager
 
-from app.api import evaluate, health
-from app.db.database import init_db
+from app.api import analytics, evaluate, health, rankings
+from app.agents.llm_cache import init_llm_cache, close_llm_cache
+from app.analytics.adverse_impact import (
+    init_adverse_impact_tracker,
+    close_adverse_impact_tracker,
+)
+from app.agents.llm_client import init_llm_client, close_llm_client
+from app.agents.orchestrator import SwarmOrchestrator
+from app.agents.skill_matcher import init_skill_matcher, close_skill_matcher
+from app.db.database import init_db, close_db
+from app.metrics import mark_process_dead, render_metrics
+from app.tracing import TracingMiddleware
+from app.ml.predictive import init_predictive_model
+from app.ml.vector_index import init_vector_index, close_vector_index
+from app.sources.github import init_github_fetcher, close_github_fetcher
+from app.sources.linkedin import init_linkedin_store, close_linkedin_store
+from app.sources.resume import init_resume_fetcher, close_resume_fetcher
+from app.db.writer import (
+    CAPABILITY_ASSESSMENTS_ENABLED,
+    DECISION_WRITER_ENABLED,
+    DecisionWriter,
+)
 
 # Environment
 ENV = os.getenv("ENV", "development")
@@ -22,18 +42,58 @@ ENV = os.getenv("ENV", "development")
 async def lifespan(app: FastAPI):
     """
     Lifecycle manager for FastAPI app
-    - Startup: Initialize database connection
-    - Shutdown: Close connections
+    - Startup: Initialize database connection, shared LLM client and cache,
+      the decision writer, and the swarm orchestrator used by every request
+    - Shutdown: Drain in-flight evaluations, flush queued decisions,
+      then close connections
     """
     # Startup
     print("🚀 Starting HoneyBee AI Service...")
     await init_db()
     print("✅ Database connection initialized")
+    init_llm_client()
+    print("✅ LLM client initialized")
+    init_llm_cache()
+    print("✅ LLM response cache initialized")
+    init_resume_fetcher()
+    print("✅ Resume fetcher initialized")
+    init_github_fetcher()
+    print("✅ GitHub fetcher initialized")
+    init_linkedin_store()
+    print("✅ LinkedIn profile store initialized")
+    await init_skill_matcher().start()
+    print("✅ Skill matcher initialized")
+    await init_vector_index().start()
+    print("✅ Candidate vector index initialized")
+    if init_predictive_model() is not None:
+        print("✅ Predictive model loaded")
+    init_adverse_impact_tracker()
+    print("✅ Adverse impact tracker initialized")
+    decision_writer = None
+    if DECISION_WRITER_ENABLED or CAPABILITY_ASSESSMENTS_ENABLED:
+        decision_writer = DecisionWriter()
+        await decision_writer.start()
+        print("✅ Decision writer started")
+    app.state.orchestrator = SwarmOrchestrator(decision_writer=decision_writer)
+    print("✅ Swarm orchestrator initialized")
 
     yield
 
     # Shutdown
     print("👋 Shutting down HoneyBee AI Service...")
+    await app.state.orchestrator.aclose()
+    if decision_writer is not None:
+        await decision_writer.stop()
+    await close_llm_client()
+    await close_llm_cache()
+    await close_resume_fetcher()
+    await close_github_fetcher()
+    await close_linkedin_store()
+    await close_vector_index()
+    await close_adverse_impact_tracker()
+    await close_skill_matcher()
+    await close_db()
+    mark_process_dead(os.getpid())
 
 
 # Initialize FastAPI app
@@ -56,9 +116,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-request stage tracing
+app.add_middleware(TracingMiddleware)
+
 # Include routers
 app.include_router(health.router, prefix="/api/v1", tags=["health"])
 app.include_router(evaluate.router, prefix="/api/v1", tags=["evaluation"])
+app.include_router(rankings.router, prefix="/api/v1", tags=["rankings"])
+app.include_router(analytics.router, prefix="/api/v1", tags=["analytics"])
 
 
 @app.get("/")
@@ -73,6 +138,13 @@ async def root():
     }
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus metrics, aggregated across workers"""
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
+
+
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request, exc):
     """Custom HTTP exception handler"""
@@ -0,0 +1,180 @@
+"""
+Metrics - Prometheus counters and histograms for the swarm
+
+Recording a sample is an in-process increment, cheap enough for every
+agent run and LLM call. GET /metrics exposes them in Prometheus text format.
+
+With several uvicorn workers, set PROMETHEUS_MULTIPROC_DIR to an empty
+directory shared by the workers (before they start). Each worker then
+writes its samples to memory-mapped files in that directory and /metrics
+aggregates all of them, whichever worker serves the scrape.
+"""
+
+from typing import Any, Dict, Tuple
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+MULTIPROCESS = bool(os.getenv("PROMETHEUS_MULTIPROC_DIR"))
+
+# Shared bucket layouts
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 15, 20, 25, 30, 60)
+SCORE_BUCKETS = (0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0)
+TOKEN_BUCKETS = (50, 100, 250, 500, 1000, 1500, 2000, 3000, 4000, 6000, 8000, 16000)
+
+AGENT_RUNS = Counter(
+    "honeybee_agent_runs_total",
+    "Agent votes by outcome (ok, timeout, error, reused)",
+    ["agent", "outcome"],
+)
+AGENT_LATENCY = Histogram(
+    "honeybee_agent_latency_seconds",
+    "Time for an agent to produce its vote",
+    ["agent"],
+    buckets=LATENCY_BUCKETS,
+)
+LLM_LATENCY = Histogram(
+    "honeybee_llm_request_latency_seconds",
+    "LLM API call latency (cache misses only)",
+    ["agent", "model"],
+    buckets=LATENCY_BUCKETS,
+)
+LLM_TOKENS = Counter(
+    "honeybee_llm_tokens_total",
+    "LLM tokens used, by kind (prompt, completion)",
+    ["agent", "model", "kind"],
+)
+LLM_PROMPT_TOKENS = Histogram(
+    "honeybee_llm_prompt_tokens",
+    "Prompt size of each LLM call, as reported by the API",
+    ["agent"],
+    buckets=TOKEN_BUCKETS,
+)
+LLM_COMPLETION_TOKENS = Histogram(
+    "honeybee_llm_completion_tokens",
+    "Completion size of each LLM call, as reported by the API",
+    ["agent"],
+    buckets=TOKEN_BUCKETS,
+)
+LLM_CACHE_LOOKUPS = Counter(
+    "honeybee_llm_cache_lookups_total",
+    "LLM response cache lookups by result (memory_hit, persistent_hit, miss)",
+    ["result"],
+)
+EVALUATIONS_IN_FLIGHT = Gauge(
+    "honeybee_evaluations_in_flight",
+    "Swarm evaluations currently running",
+    multiprocess_mode="livesum",
+)
+EVALUATION_LATENCY = Histogram(
+    "honeybee_evaluation_latency_seconds",
+    "End-to-end swarm evaluation time",
+    buckets=LATENCY_BUCKETS,
+)
+OVERALL_CONFIDENCE = Histogram(
+    "honeybee_overall_confidence",
+    "Consensus overall confidence of completed evaluations",
+    buckets=SCORE_BUCKETS,
+)
+CONSENSUS_AGREEMENT = Histogram(
+    "honeybee_consensus_agreement",
+    "Agreement between agent votes in completed evaluations",
+    buckets=SCORE_BUCKETS,
+)
+BIAS_FLAGS = Counter(
+    "honeybee_bias_flags_total",
+    "Bias flags raised, by protected-characteristic category",
+    ["category"],
+)
+
+
+def agent_label(agent_name: str) -> str:
+    """Label value for an agent ("Resume Agent" becomes resume_agent)"""
+    return agent_name.lower().replace(" ", "_")
+
+
+def record_evaluation(result: Dict[str, Any]):
+    """Record a completed evaluation result"""
+    EVALUATION_LATENCY.observe(result["processing_time_ms"] / 1000)
+    OVERALL_CONFIDENCE.observe(result["overall_confidence"])
+    agreement = result["consensus_details"].get("agreement_score")
+    if agreement is not None:
+        CONSENSUS_AGREEMENT.observe(agreement)
+    for flag in result.get("bias_flags") or []:
+        BIAS_FLAGS.labels(category=flag.get("category", "unknown")).inc()
+
+
+def _registry() -> CollectorRegistry:
+    if not MULTIPROCESS:
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """Prometheus exposition of all workers' metrics, and its content type"""
+    return generate_latest(_registry()), CONTENT_TYPE_LATEST
+
+
+def snapshot() -> Dict[str, Any]:
+    """Headline numbers for /agents/status, aggregated across workers"""
+    totals: Dict[str, float] = {}
+    for metric in _registry().collect():
+        for sample in metric.samples:
+            key = sample.name
+            if sample.name == "honeybee_agent_runs_total":
+                key = f"{sample.name}:{sample.labels['outcome']}"
+            elif sample.name == "honeybee_llm_cache_lookups_total":
+                key = f"{sample.name}:{sample.labels['result']}"
+            elif sample.name == "honeybee_llm_tokens_total":
+                key = f"{sample.name}:{sample.labels['kind']}"
+            totals[key] = totals.get(key, 0.0) + sample.value
+
+    evaluations = int(totals.get("honeybee_evaluation_latency_seconds_count", 0))
+    cache_lookups = sum(
+        value
+        for key, value in totals.items()
+        if key.startswith("honeybee_llm_cache_lookups_total:")
+    )
+    cache_hits = cache_lookups - totals.get(
+        "honeybee_llm_cache_lookups_total:miss", 0
+    )
+
+    def average(name: str) -> float:
+        count = totals.get(f"{name}_count", 0)
+        return round(totals.get(f"{name}_sum", 0) / count, 4) if count else 0.0
+
+    return {
+        "total_evaluations": evaluations,
+        "evaluations_in_flight": int(totals.get("honeybee_evaluations_in_flight", 0)),
+        "average_confidence": average("honeybee_overall_confidence"),
+        "average_agreement": average("honeybee_consensus_agreement"),
+        "average_evaluation_seconds": average("honeybee_evaluation_latency_seconds"),
+        "bias_flags_detected": int(totals.get("honeybee_bias_flags_total", 0)),
+        "agent_timeouts": int(totals.get("honeybee_agent_runs_total:timeout", 0)),
+        "agent_errors": int(totals.get("honeybee_agent_runs_total:error", 0)),
+        "llm_calls": int(totals.get("honeybee_llm_request_latency_seconds_count", 0)),
+        "llm_prompt_tokens": int(totals.get("honeybee_llm_tokens_total:prompt", 0)),
+        "llm_completion_tokens": int(
+            totals.get("honeybee_llm_tokens_total:completion", 0)
+        ),
+        "llm_cache_hit_rate": (
+            round(cache_hits / cache_lookups, 4) if cache_lookups else 0.0
+        ),
+    }
+
+
+def mark_process_dead(pid: int):
+    """Drop a stopped worker's live gauges (multiprocess mode only)"""
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(pid)
@@ -0,0 +1 @@
+"""Vector models used to pre-screen and score candidates"""
@@ -0,0 +1,146 @@
+"""
+Feature Vectors - Hashed skill/term vectors for candidates and jobs
+
+Candidates and job openings are mapped into the same fixed-size space with
+the hashing trick, so no vocabulary has to be stored or kept in sync:
+- Skills (canonicalized through the skill matcher) carry most weight
+- Other terms from free text add a weaker signal
+
+Vectors are L2-normalized, so a dot product is the cosine similarity.
+"""
+
+from collections import Counter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+import hashlib
+import math
+import os
+import re
+
+import numpy as np
+
+from app.agents.skill_matcher import get_skill_matcher, normalize_term
+
+VECTOR_DIM = int(os.getenv("VECTOR_DIM", "1024"))
+
+SKILL_WEIGHT = 1.0
+REQUIRED_SKILL_WEIGHT = 2.0
+TERM_WEIGHT = 0.25
+
+# Proficiency 0-3 (beginner-expert) scales an assessed skill's weight
+PROFICIENCY_WEIGHTS = (0.5, 1.0, 1.5, 2.0)
+
+TERM_PATTERN = re.compile(r"[a-z][a-z0-9+#.]{2,}")
+
+
+def hash_features(features: Dict[str, float], dim: int = VECTOR_DIM) -> np.ndarray:
+    """Signed feature hashing into an L2-normalized float32 vector"""
+    vector = np.zeros(dim, dtype=np.float32)
+    for feature, weight in features.items():
+        digest = int.from_bytes(
+            hashlib.blake2b(feature.encode(), digest_size=8).digest(), "little"
+        )
+        sign = -1.0 if digest >> 63 else 1.0
+        vector[digest % dim] += sign * weight
+    norm = np.linalg.norm(vector)
+    if norm > 0:
+        vector /= norm
+    return vector
+
+
+def _strings(value: Any) -> Iterator[str]:
+    """Every string in a JSON value, skipping URLs"""
+    if isinstance(value, str):
+        if not value.startswith(("http://", "https://")):
+            yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _strings(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _strings(item)
+
+
+def _text_features(features: Dict[str, float], texts: Iterable[str]):
+    """Add skill mentions and weaker term features from free text"""
+    texts = [text for text in texts if text]
+    matcher = get_skill_matcher()
+    for name, count in matcher.find(*texts).items():
+        key = f"skill:{normalize_term(name)}"
+        features[key] = features.get(key, 0.0) + SKILL_WEIGHT * (1 + math.log(count))
+    terms = Counter(
+        term for text in texts for term in TERM_PATTERN.findall(text.lower())
+    )
+    for term, count in terms.items():
+        features[f"term:{term}"] = TERM_WEIGHT * (1 + math.log(count))
+
+
+def _skill_key(name: str) -> str:
+    """Feature key for a skill name, resolving aliases to the canonical name"""
+    matched = get_skill_matcher().skills_matched(name)
+    return f"skill:{normalize_term(matched[0] if matched else name)}"
+
+
+def candidate_vector(
+    resume_data: Optional[Dict[str, Any]],
+    assessments: Iterable[Tuple[str, Optional[int], Optional[float]]] = (),
+    dim: int = VECTOR_DIM,
+) -> np.ndarray:
+    """
+    Vector for a candidate
+
+    Args:
+        resume_data: Candidate.resume_data JSONB
+        assessments: (skill name, proficiency, confidence_score) rows from
+            CapabilityAssessment
+    """
+    features: Dict[str, float] = {}
+    _text_features(features, _strings(resume_data or {}))
+    for name, proficiency, confidence in assessments:
+        level = min(max(proficiency or 0, 0), len(PROFICIENCY_WEIGHTS) - 1)
+        weight = PROFICIENCY_WEIGHTS[level] * float(
+            confidence if confidence is not None else 0.5
+        )
+        key = _skill_key(name)
+        features[key] = features.get(key, 0.0) + SKILL_WEIGHT * weight
+    return hash_features(features, dim)
+
+
+def required_skill_names(required_skills: Any) -> List[str]:
+    """
+    Skill names from JobOpening.required_skills
+
+    Accepts a list of names / {"name": ...} objects or a {name: level}
+    mapping; blank and non-string entries are skipped.
+    """
+    if isinstance(required_skills, dict):
+        names = list(required_skills)
+    else:
+        names = [
+            item.get("name") if isinstance(item, dict) else item
+            for item in required_skills or []
+        ]
+    return [name.strip() for name in names if isinstance(name, str) and name.strip()]
+
+
+def job_vector(
+    required_skills: Any,
+    description: Optional[str] = None,
+    title: Optional[str] = None,
+    dim: int = VECTOR_DIM,
+) -> np.ndarray:
+    """
+    Vector for a job opening
+
+    Args:
+        required_skills: JobOpening.required_skills JSONB, either a list of
+            names / {"name": ...} objects or a {name: level} mapping
+        description: Job description text
+        title: Job title
+    """
+    features: Dict[str, float] = {}
+    _text_features(features, [title or "", description or ""])
+
+    for name in required_skill_names(required_skills):
+        key = _skill_key(name)
+        features[key] = features.get(key, 0.0) + REQUIRED_SKILL_WEIGHT
+    return hash_features(features, dim)
@@ -0,0 +1,148 @@
+"""
+Predictive Model - Memory-mapped logistic regression over fit features
+
+Predicts the probability that a candidate is hired for a job opening from
+the interaction of their vectors (see app.ml.features): the elementwise
+product of candidate and job vectors plus their cosine similarity. Weights
+are trained offline by app.ml.train_predictive and saved as:
+
+    PREDICTIVE_MODEL_DIR/
+        weights.npy     float32 coefficients, loaded with mmap_mode="r"
+        model.json      intercept, dim, training summary
+
+Every uvicorn worker maps the same weights file, so they share one copy
+through the page cache. Scoring a batch is one matrix-vector product.
+"""
+
+from typing import Any, Dict, Optional
+import json
+import logging
+import os
+import tempfile
+
+import numpy as np
+
+from app.agents.llm_cache import LRUCache
+from app.db.database import ReadOnlySessionLocal
+from app.db.models import JobOpening
+from app.ml.features import job_vector
+
+logger = logging.getLogger(__name__)
+
+PREDICTIVE_MODEL_DIR = os.getenv("PREDICTIVE_MODEL_DIR") or os.path.join(
+    tempfile.gettempdir(), "honeybee-predictive"
+)
+JOB_VECTOR_CACHE_SIZE = int(os.getenv("JOB_VECTOR_CACHE_SIZE", "1000"))
+JOB_VECTOR_TTL_SECONDS = float(os.getenv("JOB_VECTOR_TTL_SECONDS", "300"))
+
+# Bump when the feature layout or training objective changes
+MODEL_VERSION = 1
+
+
+def interaction_features(
+    candidate_vectors: np.ndarray, job_vectors: np.ndarray
+) -> np.ndarray:
+    """
+    Model inputs for candidate/job pairs
+
+    Args:
+        candidate_vectors: n x dim candidate vectors
+        job_vectors: n x dim (or 1 x dim, broadcast) job vectors
+
+    Returns:
+        n x (dim + 1) matrix: elementwise products, then cosine similarity
+    """
+    products = candidate_vectors * job_vectors
+    cosine = products.sum(axis=1, keepdims=True)
+    return np.hstack([products, cosine]).astype(np.float32)
+
+
+class PredictiveModel:
+    """
+    Trained hire-probability model
+
+    Usage:
+        model = get_predictive_model()  # None until a model is trained
+        model.predict(interaction_features(candidates, job[None, :]))
+    """
+
+    def __init__(self, directory: str = PREDICTIVE_MODEL_DIR):
+        with open(os.path.join(directory, "model.json")) as handle:
+            self.meta: Dict[str, Any] = json.load(handle)
+        self.weights = np.load(os.path.join(directory, "weights.npy"), mmap_mode="r")
+        self.intercept = float(self.meta["intercept"])
+        self.dim = int(self.meta["dim"])
+        if self.weights.shape != (self.dim + 1,):
+            raise ValueError(
+                f"Model weights have shape {self.weights.shape}, "
+                f"expected ({self.dim + 1},)"
+            )
+
+    @property
+    def identity(self) -> Dict[str, Any]:
+        """Which trained model this is; changes with every retrain"""
+        return {
+            "trained_at": self.meta.get("trained_at"),
+            "version": self.meta.get("version"),
+        }
+
+    @property
+    def confidence(self) -> float:
+        """How far to trust predictions, from holdout AUC (0.5 = chance)"""
+        auc = self.meta.get("holdout_auc") or 0.5
+        return float(min(max((auc - 0.5) * 2, 0.1), 0.9))
+
+    def predict(self, features: np.ndarray) -> np.ndarray:
+        """Hire probability for each row of an interaction feature matrix"""
+        logits = features @ self.weights + self.intercept
+        return 1.0 / (1.0 + np.exp(-np.clip(logits, -30, 30)))
+
+
+def save_model(
+    directory: str, weights: np.ndarray, intercept: float, meta: Dict[str, Any]
+):
+    """Write a model atomically so workers never map a partial file"""
+    os.makedirs(directory, exist_ok=True)
+    weights_tmp = os.path.join(directory, "weights.tmp.npy")
+    np.save(weights_tmp, weights.astype(np.float32))
+    meta_tmp = os.path.join(directory, "model.json.tmp")
+    with open(meta_tmp, "w") as handle:
+        json.dump({**meta, "intercept": float(intercept)}, handle, indent=2)
+    os.replace(weights_tmp, os.path.join(directory, "weights.npy"))
+    os.replace(meta_tmp, os.path.join(directory, "model.json"))
+
+
+_model: Optional[PredictiveModel] = None
+_job_vectors = LRUCache(JOB_VECTOR_CACHE_SIZE, JOB_VECTOR_TTL_SECONDS)
+
+
+def init_predictive_model() -> Optional[PredictiveModel]:
+    """Load the trained model once per process (None if not trained yet)"""
+    global _model
+    if _model is None:
+        try:
+            _model = PredictiveModel()
+        except FileNotFoundError:
+            logger.info("No predictive model in %s", PREDICTIVE_MODEL_DIR)
+        except (ValueError, KeyError) as exc:
+            logger.warning("Predictive model could not be loaded: %s", exc)
+    return _model
+
+
+def get_predictive_model() -> Optional[PredictiveModel]:
+    """Get the loaded model, loading it outside the app lifespan"""
+    return _model or init_predictive_model()
+
+
+async def get_job_vector(job_opening_id: int) -> Optional[np.ndarray]:
+    """Vector for a job opening, cached briefly (None if it does not exist)"""
+    vector = _job_vectors.get(job_opening_id)
+    if vector is not None:
+        return vector
+    async with ReadOnlySessionLocal() as session:
+        job = await session.get(JobOpening, job_opening_id)
+    if job is None:
+        return None
+    vector = job_vector(job.required_skills, job.description, job.title)
+    _job_vectors.set(job_opening_id, vector)
+    return vector
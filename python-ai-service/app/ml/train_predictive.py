@@ -0,0 +1,218 @@
+"""
+Train Predictive Model - Offline training for PredictiveAgent
+
+Builds a feature matrix from historical swarm decisions and fits a
+class-balanced, L2-regularized logistic regression in numpy:
+- Samples: each evaluated (candidate, job opening) pair
+- Features: interaction of candidate and job vectors (app.ml.predictive)
+- Label: the candidate later became an Employee of the same company
+  (matched by email), the only hiring outcome the schema records
+
+Usage:
+    python -m app.ml.train_predictive [--output DIR] [--epochs 300]
+
+The model is written atomically to PREDICTIVE_MODEL_DIR; running workers
+pick it up on restart.
+"""
+
+from datetime import datetime
+from typing import Dict, Tuple
+import argparse
+import asyncio
+
+import numpy as np
+from sqlalchemy import and_, exists, func, select
+
+from app.agents.skill_matcher import get_skill_matcher
+from app.db.database import ReadOnlySessionLocal, close_db
+from app.db.models import Candidate, Employee, JobOpening, SwarmDecision
+from app.ml.features import VECTOR_DIM, job_vector
+from app.ml.predictive import (
+    MODEL_VERSION,
+    PREDICTIVE_MODEL_DIR,
+    interaction_features,
+    save_model,
+)
+from app.ml.vector_index import VectorIndex
+
+
+async def load_samples() -> Tuple[np.ndarray, np.ndarray]:
+    """Feature matrix and hire labels for every evaluated pair"""
+    first_evaluated = func.min(SwarmDecision.evaluated_at).label("first_evaluated")
+    pairs = (
+        select(
+            SwarmDecision.candidate_id,
+            SwarmDecision.job_opening_id,
+            Candidate.company_id,
+            Candidate.email,
+            first_evaluated,
+        )
+        .join(Candidate, Candidate.id == SwarmDecision.candidate_id)
+        .where(SwarmDecision.job_opening_id.isnot(None))
+        .group_by(
+            SwarmDecision.candidate_id,
+            SwarmDecision.job_opening_id,
+            Candidate.company_id,
+            Candidate.email,
+        )
+        .subquery()
+    )
+    hired = exists().where(
+        and_(
+            Employee.company_id == pairs.c.company_id,
+            func.lower(Employee.email) == func.lower(pairs.c.email),
+            Employee.created_at >= pairs.c.first_evaluated,
+        )
+    )
+
+    async with ReadOnlySessionLocal() as session:
+        rows = (
+            await session.execute(
+                select(
+                    pairs.c.candidate_id, pairs.c.job_opening_id, hired.label("hired")
+                )
+            )
+        ).all()
+        job_ids = sorted({row.job_opening_id for row in rows})
+        jobs = (
+            await session.execute(
+                select(
+                    JobOpening.id,
+                    JobOpening.required_skills,
+                    JobOpening.description,
+                    JobOpening.title,
+                ).where(JobOpening.id.in_(job_ids))
+            )
+        ).all()
+
+    if not rows:
+        return np.zeros((0, VECTOR_DIM + 1), dtype=np.float32), np.zeros(0)
+
+    # Vectors come from the same index the service scores against
+    await get_skill_matcher().refresh()
+    index = VectorIndex()
+    await index.refresh()
+    candidate_vectors = await index.candidate_vectors(
+        [row.candidate_id for row in rows]
+    )
+    job_vectors: Dict[int, np.ndarray] = {
+        job.id: job_vector(job.required_skills, job.description, job.title)
+        for job in jobs
+    }
+    zeros = np.zeros(VECTOR_DIM, dtype=np.float32)
+    pair_job_vectors = np.stack(
+        [job_vectors.get(row.job_opening_id, zeros) for row in rows]
+    )
+
+    features = interaction_features(candidate_vectors, pair_job_vectors)
+    labels = np.array([1.0 if row.hired else 0.0 for row in rows])
+    return features, labels
+
+
+def fit_logistic_regression(
+    features: np.ndarray,
+    labels: np.ndarray,
+    epochs: int = 300,
+    learning_rate: float = 0.5,
+    l2: float = 1e-3,
+) -> Tuple[np.ndarray, float]:
+    """Full-batch gradient descent with class-balanced sample weights"""
+    positives = labels.sum()
+    negatives = len(labels) - positives
+    sample_weights = np.where(
+        labels == 1,
+        len(labels) / (2 * max(positives, 1)),
+        len(labels) / (2 * max(negatives, 1)),
+    )
+
+    weights = np.zeros(features.shape[1])
+    intercept = 0.0
+    for _ in range(epochs):
+        logits = features @ weights + intercept
+        predictions = 1.0 / (1.0 + np.exp(-np.clip(logits, -30, 30)))
+        error = (predictions - labels) * sample_weights
+        weights -= learning_rate * (features.T @ error / len(labels) + l2 * weights)
+        intercept -= learning_rate * error.mean()
+    return weights, intercept
+
+
+def roc_auc(labels: np.ndarray, scores: np.ndarray) -> float:
+    """Area under the ROC curve via the rank-sum statistic"""
+    positives = labels == 1
+    n_positive, n_negative = positives.sum(), (~positives).sum()
+    if n_positive == 0 or n_negative == 0:
+        return 0.5
+    ranks = np.empty(len(scores))
+    ranks[np.argsort(scores)] = np.arange(1, len(scores) + 1)
+    return float(
+        (ranks[positives].sum() - n_positive * (n_positive + 1) / 2)
+        / (n_positive * n_negative)
+    )
+
+
+async def train(args: argparse.Namespace):
+    features, labels = await load_samples()
+    positives = int(labels.sum())
+    print(f"Loaded {len(labels)} evaluated pairs ({positives} hires)")
+    if len(labels) < args.min_samples or positives == 0:
+        print("Not enough labelled history to train; model not written")
+        return
+
+    order = np.random.default_rng(args.seed).permutation(len(labels))
+    holdout_size = int(len(labels) * args.holdout)
+    holdout, train_rows = order[:holdout_size], order[holdout_size:]
+
+    weights, intercept = fit_logistic_regression(
+        features[train_rows],
+        labels[train_rows],
+        epochs=args.epochs,
+        learning_rate=args.learning_rate,
+        l2=args.l2,
+    )
+    holdout_auc = (
+        roc_auc(labels[holdout], features[holdout] @ weights + intercept)
+        if holdout_size
+        else None
+    )
+    print(f"Holdout AUC: {holdout_auc}")
+
+    save_model(
+        args.output,
+        weights,
+        intercept,
+        {
+            "dim": VECTOR_DIM,
+            "version": MODEL_VERSION,
+            "trained_at": datetime.utcnow().isoformat(),
+            "samples": len(labels),
+            "positives": positives,
+            "holdout_auc": holdout_auc,
+            "epochs": args.epochs,
+            "l2": args.l2,
+        },
+    )
+    print(f"Model written to {args.output}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the PredictiveAgent model")
+    parser.add_argument("--output", default=PREDICTIVE_MODEL_DIR)
+    parser.add_argument("--epochs", type=int, default=300)
+    parser.add_argument("--learning-rate", type=float, default=0.5)
+    parser.add_argument("--l2", type=float, default=1e-3)
+    parser.add_argument("--holdout", type=float, default=0.2)
+    parser.add_argument("--min-samples", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    async def run():
+        try:
+            await train(args)
+        finally:
+            await close_db()
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
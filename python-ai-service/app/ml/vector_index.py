@@ -0,0 +1,535 @@
+"""
+Vector Index - Memory-mapped candidate vectors for similarity pre-screening
+
+Candidate vectors (see app.ml.features) are stored as one float32 matrix in
+a memory-mapped file, with parallel arrays of candidate and company IDs:
+
+    VECTOR_INDEX_DIR/
+        vectors.f32     capacity x VECTOR_DIM
+        ids.i64         candidate IDs
+        companies.i64   company IDs
+        meta.json       count, capacity, dim, refresh watermark
+
+Scoring every candidate for a job is a single matrix-vector product, and
+the file is shared by all workers through the page cache. A background
+refresh upserts candidates whose row or capability assessments changed
+since the last watermark, re-reading an overlap window so rows committed
+late with an older updated_at are not missed, and drops candidates that no
+longer exist. Writers serialize on a file lock, and only one
+worker refreshes at a time; readers remap when meta.json changes.
+
+Within a process, writes run in a worker thread while queries run on the
+event loop, so the in-memory arrays and row map are guarded by a thread
+lock held only while they are read or mutated.
+"""
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+import asyncio
+import fcntl
+import json
+import logging
+import os
+import tempfile
+import threading
+
+import numpy as np
+from sqlalchemy import select, union_all
+
+from app.db.database import ReadOnlySessionLocal
+from app.db.models import Candidate, CapabilityAssessment, Skill
+from app.ml.features import VECTOR_DIM, candidate_vector
+
+logger = logging.getLogger(__name__)
+
+VECTOR_INDEX_DIR = os.getenv("VECTOR_INDEX_DIR") or os.path.join(
+    tempfile.gettempdir(), "honeybee-vectors"
+)
+VECTOR_INDEX_REFRESH_SECONDS = float(os.getenv("VECTOR_INDEX_REFRESH_SECONDS", "60"))
+VECTOR_INDEX_INITIAL_CAPACITY = int(
+    os.getenv("VECTOR_INDEX_INITIAL_CAPACITY", "4096")
+)
+# Changes re-read before the watermark on each refresh; upserts are
+# idempotent, so this only costs re-vectorizing recently changed candidates
+VECTOR_INDEX_REFRESH_OVERLAP_SECONDS = float(
+    os.getenv("VECTOR_INDEX_REFRESH_OVERLAP_SECONDS", "300")
+)
+
+# Candidates vectorized per database round trip during a refresh
+REFRESH_CHUNK_SIZE = 1000
+
+
+class VectorIndex:
+    """
+    Memory-mapped index of candidate vectors
+
+    Usage:
+        index = get_vector_index()
+        index.upsert([(candidate_id, company_id, vector)])
+        index.similar(job_vector(...), company_id=1, limit=20)
+    """
+
+    def __init__(
+        self,
+        directory: str = VECTOR_INDEX_DIR,
+        dim: int = VECTOR_DIM,
+        initial_capacity: int = VECTOR_INDEX_INITIAL_CAPACITY,
+        session_factory: Callable = ReadOnlySessionLocal,
+        refresh_seconds: float = VECTOR_INDEX_REFRESH_SECONDS,
+        refresh_overlap_seconds: float = VECTOR_INDEX_REFRESH_OVERLAP_SECONDS,
+    ):
+        self.directory = directory
+        self.dim = dim
+        self.initial_capacity = initial_capacity
+        self.session_factory = session_factory
+        self.refresh_seconds = refresh_seconds
+        self.refresh_overlap = timedelta(seconds=refresh_overlap_seconds)
+        os.makedirs(directory, exist_ok=True)
+
+        self._meta_path = os.path.join(directory, "meta.json")
+        self._meta_version: Optional[int] = None
+        self.count = 0
+        self.capacity = 0
+        self.watermark: Optional[datetime] = None
+        self._vectors: Optional[np.memmap] = None
+        self._ids: Optional[np.memmap] = None
+        self._companies: Optional[np.memmap] = None
+        self._rows: Dict[int, int] = {}
+        self._state_lock = threading.RLock()
+        self._task: Optional[asyncio.Task] = None
+
+        with self._lock():
+            self._load_meta()
+            if self._vectors is None:
+                self._allocate(initial_capacity, copy_rows=0)
+                self._write_meta()
+
+    # --- Storage ---
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    @contextmanager
+    def _lock(self, name: str = "lock", blocking: bool = True):
+        """Exclusive file lock shared by every worker; yields False if busy"""
+        with open(self._path(name), "w") as handle:
+            flags = fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB)
+            try:
+                fcntl.flock(handle, flags)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def _load_meta(self):
+        """(Re)map the arrays if meta.json changed since the last load"""
+        with self._state_lock:
+            self._load_meta_locked()
+
+    def _load_meta_locked(self):
+        try:
+            version = os.stat(self._meta_path).st_mtime_ns
+        except FileNotFoundError:
+            return
+        if version == self._meta_version:
+            return
+        with open(self._meta_path) as handle:
+            meta = json.load(handle)
+        if meta["dim"] != self.dim:
+            # VECTOR_DIM changed; the stored vectors are unusable
+            logger.warning("Vector index dimension changed, rebuilding")
+            return
+
+        self.capacity = meta["capacity"]
+        self.count = meta["count"]
+        self.watermark = (
+            datetime.fromisoformat(meta["watermark"]) if meta["watermark"] else None
+        )
+        self._vectors = np.memmap(
+            self._path("vectors.f32"),
+            dtype=np.float32,
+            mode="r+",
+            shape=(self.capacity, self.dim),
+        )
+        self._ids = np.memmap(
+            self._path("ids.i64"), dtype=np.int64, mode="r+", shape=(self.capacity,)
+        )
+        self._companies = np.memmap(
+            self._path("companies.i64"),
+            dtype=np.int64,
+            mode="r+",
+            shape=(self.capacity,),
+        )
+        self._rows = {
+            int(candidate_id): row
+            for row, candidate_id in enumerate(self._ids[: self.count])
+        }
+        self._meta_version = version
+
+    def _allocate(self, capacity: int, copy_rows: int):
+        """Create arrays with a new capacity, keeping the first copy_rows rows"""
+        arrays = (
+            ("vectors.f32", np.float32, (capacity, self.dim), self._vectors),
+            ("ids.i64", np.int64, (capacity,), self._ids),
+            ("companies.i64", np.int64, (capacity,), self._companies),
+        )
+        mapped = []
+        for name, dtype, shape, current in arrays:
+            tmp_path = self._path(f"{name}.tmp")
+            array = np.memmap(tmp_path, dtype=dtype, mode="w+", shape=shape)
+            if copy_rows:
+                array[:copy_rows] = current[:copy_rows]
+            array.flush()
+            os.replace(tmp_path, self._path(name))
+            mapped.append(array)
+        with self._state_lock:
+            self._vectors, self._ids, self._companies = mapped
+            self.capacity = capacity
+
+    def _write_meta(self):
+        meta = {
+            "dim": self.dim,
+            "capacity": self.capacity,
+            "count": self.count,
+            "watermark": self.watermark.isoformat() if self.watermark else None,
+        }
+        tmp_path = f"{self._meta_path}.tmp"
+        with open(tmp_path, "w") as handle:
+            json.dump(meta, handle)
+        os.replace(tmp_path, self._meta_path)
+        self._meta_version = os.stat(self._meta_path).st_mtime_ns
+
+    # --- Writes ---
+
+    def upsert(
+        self,
+        items: Sequence[Tuple[int, int, np.ndarray]],
+        watermark: Optional[datetime] = None,
+    ):
+        """
+        Insert or replace candidate vectors
+
+        Args:
+            items: (candidate_id, company_id, vector) tuples
+            watermark: Refresh watermark to record with the write
+        """
+        with self._lock():
+            self._load_meta()
+            new_ids = {item[0] for item in items if item[0] not in self._rows}
+            needed = self.count + len(new_ids)
+            if needed > self.capacity:
+                self._allocate(max(needed, self.capacity * 2), copy_rows=self.count)
+
+            with self._state_lock:
+                for candidate_id, company_id, vector in items:
+                    row = self._rows.get(candidate_id)
+                    if row is None:
+                        row = self.count
+                        self._rows[candidate_id] = row
+                        self._ids[row] = candidate_id
+                        self.count += 1
+                    self._companies[row] = company_id
+                    self._vectors[row] = vector
+                if watermark is not None:
+                    self.watermark = watermark
+
+            for array in (self._vectors, self._ids, self._companies):
+                array.flush()
+            self._write_meta()
+
+    def remove(self, candidate_ids: Iterable[int]) -> int:
+        """
+        Drop candidates from the index
+
+        Each removed row is filled by moving the last row into it, so the
+        indexed rows stay contiguous.
+
+        Returns:
+            Number of candidates removed
+        """
+        with self._lock():
+            self._load_meta()
+            removed = 0
+            with self._state_lock:
+                for candidate_id in candidate_ids:
+                    row = self._rows.pop(candidate_id, None)
+                    if row is None:
+                        continue
+                    last = self.count - 1
+                    if row != last:
+                        moved_id = int(self._ids[last])
+                        self._ids[row] = moved_id
+                        self._companies[row] = self._companies[last]
+                        self._vectors[row] = self._vectors[last]
+                        self._rows[moved_id] = row
+                    self.count = last
+                    removed += 1
+            if not removed:
+                return 0
+
+            for array in (self._vectors, self._ids, self._companies):
+                array.flush()
+            self._write_meta()
+            return removed
+
+    # --- Queries ---
+
+    def _scores(self, query: np.ndarray) -> np.ndarray:
+        """Scores of every indexed row; callers hold _state_lock"""
+        self._load_meta_locked()
+        return self._vectors[: self.count] @ query.astype(np.float32)
+
+    def similar(
+        self,
+        query: np.ndarray,
+        company_id: Optional[int] = None,
+        limit: int = 20,
+    ) -> List[Dict[str, float]]:
+        """Most similar candidates to a job vector, best first"""
+        with self._state_lock:
+            scores = self._scores(query)
+            if company_id is not None:
+                scores = np.where(
+                    self._companies[: self.count] == company_id, scores, -np.inf
+                )
+            ids = np.array(self._ids[: self.count])
+        limit = min(limit, int(np.isfinite(scores).sum()))
+        if limit <= 0:
+            return []
+        top = np.argpartition(-scores, limit - 1)[:limit]
+        top = top[np.argsort(-scores[top])]
+        return [
+            {"candidate_id": int(ids[row]), "fit_score": float(scores[row])}
+            for row in top
+        ]
+
+    def fit_scores(
+        self, query: np.ndarray, candidate_ids: Iterable[int]
+    ) -> Dict[int, Optional[float]]:
+        """Cosine fit of specific candidates to a job vector (None if not indexed)"""
+        with self._state_lock:
+            scores = self._scores(query)
+            return {
+                candidate_id: (
+                    float(scores[self._rows[candidate_id]])
+                    if candidate_id in self._rows
+                    else None
+                )
+                for candidate_id in candidate_ids
+            }
+
+    async def candidate_vectors(self, candidate_ids: Sequence[int]) -> np.ndarray:
+        """
+        Vectors for candidates, in order (len(candidate_ids) x dim)
+
+        Candidates not yet indexed are vectorized and upserted on the spot;
+        rows for unknown candidates are zero.
+        """
+        with self._state_lock:
+            self._load_meta_locked()
+            missing = [
+                candidate_id
+                for candidate_id in candidate_ids
+                if candidate_id not in self._rows
+            ]
+        vectors = {}
+        if missing:
+            items = await self._vectorize(missing)
+            if items:
+                await asyncio.to_thread(self.upsert, items)
+            vectors = {candidate_id: vector for candidate_id, _, vector in items}
+
+        matrix = np.zeros((len(candidate_ids), self.dim), dtype=np.float32)
+        with self._state_lock:
+            for position, candidate_id in enumerate(candidate_ids):
+                row = self._rows.get(candidate_id)
+                if row is not None:
+                    matrix[position] = self._vectors[row]
+                elif candidate_id in vectors:
+                    matrix[position] = vectors[candidate_id]
+        return matrix
+
+    # --- Refresh ---
+
+    async def refresh(self) -> int:
+        """
+        Upsert candidates changed since the last watermark, drop deleted ones
+
+        Holds the refresh lock throughout, so only one worker refreshes at a
+        time; skipped if another worker is already refreshing.
+
+        Returns:
+            Number of candidates upserted or removed
+        """
+        with self._lock("refresh.lock", blocking=False) as acquired:
+            if not acquired:
+                return 0
+            return await self._refresh()
+
+    async def _refresh(self) -> int:
+        with self._lock():
+            self._load_meta()
+            since = self.watermark
+
+        candidate_changes = select(
+            Candidate.id.label("candidate_id"), Candidate.updated_at
+        )
+        assessment_changes = select(
+            CapabilityAssessment.person_id.label("candidate_id"),
+            CapabilityAssessment.updated_at,
+        ).where(CapabilityAssessment.person_type == "Candidate")
+        if since is not None:
+            # Rows can commit after a later watermark was recorded, carrying
+            # an updated_at at or before it; re-read an overlap window
+            window_start = since - self.refresh_overlap
+            candidate_changes = candidate_changes.where(
+                Candidate.updated_at >= window_start
+            )
+            assessment_changes = assessment_changes.where(
+                CapabilityAssessment.updated_at >= window_start
+            )
+
+        async with self.session_factory() as session:
+            changes = (
+                await session.execute(union_all(candidate_changes, assessment_changes))
+            ).all()
+            live_ids = set((await session.execute(select(Candidate.id))).scalars())
+
+        with self._state_lock:
+            deleted = [
+                candidate_id
+                for candidate_id in self._rows
+                if candidate_id not in live_ids
+            ]
+        removed = await asyncio.to_thread(self.remove, deleted) if deleted else 0
+        if not changes:
+            return removed
+
+        candidate_ids = sorted(
+            {row.candidate_id for row in changes if row.candidate_id in live_ids}
+        )
+        timestamps = [row.updated_at for row in changes if row.updated_at]
+        if since is not None:
+            timestamps.append(since)
+        watermark = max(timestamps) if timestamps else None
+        for start in range(0, len(candidate_ids), REFRESH_CHUNK_SIZE):
+            chunk = candidate_ids[start : start + REFRESH_CHUNK_SIZE]
+            items = await self._vectorize(chunk)
+            last_chunk = start + REFRESH_CHUNK_SIZE >= len(candidate_ids)
+            await asyncio.to_thread(
+                self.upsert, items, watermark if last_chunk else None
+            )
+        return len(candidate_ids) + removed
+
+    async def _vectorize(
+        self, candidate_ids: List[int]
+    ) -> List[Tuple[int, int, np.ndarray]]:
+        async with self.session_factory() as session:
+            candidates = (
+                await session.execute(
+                    select(
+                        Candidate.id, Candidate.company_id, Candidate.resume_data
+                    ).where(Candidate.id.in_(candidate_ids))
+                )
+            ).all()
+            assessments = (
+                await session.execute(
+                    select(
+                        CapabilityAssessment.person_id,
+                        Skill.name,
+                        CapabilityAssessment.proficiency,
+                        CapabilityAssessment.confidence_score,
+                    )
+                    .join(Skill, Skill.id == CapabilityAssessment.skill_id)
+                    .where(
+                        CapabilityAssessment.person_type == "Candidate",
+                        CapabilityAssessment.person_id.in_(candidate_ids),
+                    )
+                )
+            ).all()
+
+        by_candidate: Dict[int, list] = {}
+        for person_id, name, proficiency, confidence in assessments:
+            by_candidate.setdefault(person_id, []).append(
+                (name, proficiency, confidence)
+            )
+
+        def build():
+            return [
+                (
+                    candidate.id,
+                    candidate.company_id,
+                    candidate_vector(
+                        candidate.resume_data,
+                        by_candidate.get(candidate.id, ()),
+                        self.dim,
+                    ),
+                )
+                for candidate in candidates
+            ]
+
+        return await asyncio.to_thread(build)
+
+    async def start(self):
+        """Bring the index up to date, then keep refreshing in the background"""
+        try:
+            await self.refresh()
+        except Exception as exc:
+            logger.warning("Vector index could not be refreshed: %s", exc)
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.refresh_seconds)
+            try:
+                await self.refresh()
+            except Exception as exc:
+                logger.warning("Vector index refresh failed: %s", exc)
+
+    def stats(self) -> Dict[str, object]:
+        with self._state_lock:
+            self._load_meta_locked()
+            return {
+                "candidates": self.count,
+                "capacity": self.capacity,
+                "dim": self.dim,
+                "watermark": self.watermark.isoformat() if self.watermark else None,
+            }
+
+
+_index: Optional[VectorIndex] = None
+
+
+def init_vector_index() -> VectorIndex:
+    """Open the shared vector index (idempotent)"""
+    global _index
+    if _index is None:
+        _index = VectorIndex()
+    return _index
+
+
+def get_vector_index() -> VectorIndex:
+    """Get the shared vector index, opening it outside the app lifespan"""
+    return _index or init_vector_index()
+
+
+async def close_vector_index():
+    """Stop the background refresh"""
+    global _index
+    if _index is not None:
+        await _index.stop()
+        _index = None
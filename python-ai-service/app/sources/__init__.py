@@ -0,0 +1 @@
+"""External data sources used by agents"""
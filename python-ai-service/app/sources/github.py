@@ -0,0 +1,309 @@
+"""
+GitHub Source - ETag-aware, rate-limit-aware GitHub API fetcher
+
+Requests go through one pooled HTTP client with bounded concurrency.
+Responses are kept in a local cache keyed by URL and revalidated with
+If-None-Match, so repeat evaluations of active developers mostly get
+304s, which GitHub does not count against the rate limit. A scheduler
+follows the X-RateLimit-* headers and holds requests back when the
+remaining quota runs low.
+
+GITHUB_API_URL can point at a local stand-in server for testing.
+"""
+
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlparse
+import asyncio
+import os
+import time
+
+import httpx
+
+from app.agents.llm_cache import LRUCache
+
+GITHUB_API_URL = os.getenv("GITHUB_API_URL", "https://api.github.com")
+GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
+GITHUB_MAX_CONCURRENCY = int(os.getenv("GITHUB_MAX_CONCURRENCY", "8"))
+GITHUB_ETAG_CACHE_SIZE = int(os.getenv("GITHUB_ETAG_CACHE_SIZE", "5000"))
+GITHUB_TIMEOUT_SECONDS = float(os.getenv("GITHUB_TIMEOUT_SECONDS", "10"))
+
+# Requests held back from the quota for other callers
+GITHUB_RATE_LIMIT_RESERVE = int(os.getenv("GITHUB_RATE_LIMIT_RESERVE", "50"))
+
+# Longest a request will wait for the quota to reset before failing
+GITHUB_MAX_RATE_LIMIT_WAIT_SECONDS = float(
+    os.getenv("GITHUB_MAX_RATE_LIMIT_WAIT_SECONDS", "5")
+)
+
+# Repositories pushed within this window count as recently active
+RECENT_ACTIVITY_DAYS = 180
+
+
+class GitHubFetchError(Exception):
+    """GitHub data could not be fetched"""
+
+
+class GitHubNotFoundError(GitHubFetchError):
+    """GitHub user does not exist"""
+
+
+class GitHubRateLimitError(GitHubFetchError):
+    """Rate limit exhausted for longer than we are willing to wait"""
+
+
+def parse_username(github_url: str) -> Optional[str]:
+    """
+    Extract the username from a GitHub profile URL
+
+    Accepts "https://github.com/user", "github.com/user/" or a bare "user".
+    """
+    value = github_url.strip()
+    if "://" not in value and "/" in value:
+        value = f"https://{value}"
+    if "://" in value:
+        parts = [part for part in urlparse(value).path.split("/") if part]
+        return parts[0] if parts else None
+    return value or None
+
+
+class RateLimitScheduler:
+    """Follows GitHub rate-limit headers and delays requests near the limit"""
+
+    def __init__(
+        self,
+        reserve: int = GITHUB_RATE_LIMIT_RESERVE,
+        max_wait_seconds: float = GITHUB_MAX_RATE_LIMIT_WAIT_SECONDS,
+    ):
+        self.reserve = reserve
+        self.max_wait_seconds = max_wait_seconds
+        self.remaining: Optional[int] = None
+        self.reset_at = 0.0
+
+    def update(self, headers: httpx.Headers):
+        """Record quota from a response's X-RateLimit-* headers"""
+        remaining = headers.get("x-ratelimit-remaining")
+        reset = headers.get("x-ratelimit-reset")
+        if remaining is not None:
+            self.remaining = int(remaining)
+        if reset is not None:
+            self.reset_at = float(reset)
+        retry_after = headers.get("retry-after")
+        if retry_after is not None:
+            self.remaining = 0
+            self.reset_at = max(self.reset_at, time.time() + float(retry_after))
+
+    async def wait(self):
+        """
+        Wait until a request may be sent
+
+        Raises:
+            GitHubRateLimitError: If the quota resets too far in the future
+        """
+        if self.remaining is None or self.remaining > self.reserve:
+            return
+        delay = self.reset_at - time.time()
+        if delay <= 0:
+            self.remaining = None
+            return
+        if delay > self.max_wait_seconds:
+            raise GitHubRateLimitError(
+                f"GitHub rate limit exhausted; resets in {delay:.0f}s"
+            )
+        await asyncio.sleep(delay)
+
+
+class GitHubFetcher:
+    """
+    Fetches and normalizes GitHub profile data
+
+    One fetcher (HTTP pool, ETag cache, rate-limit state) is shared by the
+    process.
+    """
+
+    def __init__(
+        self,
+        base_url: str = GITHUB_API_URL,
+        token: Optional[str] = GITHUB_TOKEN,
+        max_concurrency: int = GITHUB_MAX_CONCURRENCY,
+        cache_size: int = GITHUB_ETAG_CACHE_SIZE,
+    ):
+        headers = {
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+        }
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        self._http = httpx.AsyncClient(
+            base_url=base_url,
+            headers=headers,
+            timeout=httpx.Timeout(GITHUB_TIMEOUT_SECONDS),
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_concurrency,
+            ),
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        # ETags never expire on their own; the server decides freshness
+        self._etags = LRUCache(cache_size, ttl_seconds=float("inf"))
+        self.scheduler = RateLimitScheduler()
+
+        self.requests = 0
+        self.not_modified = 0
+
+    async def fetch_profile(self, github_url: str) -> Dict[str, Any]:
+        """
+        Fetch a user's profile, repositories and recent activity
+
+        Raises:
+            GitHubNotFoundError: If the user does not exist
+            GitHubFetchError: If GitHub cannot be reached or refuses
+        """
+        username = parse_username(github_url)
+        if not username:
+            raise GitHubNotFoundError(f"No GitHub username in {github_url}")
+
+        user, repos, events = await asyncio.gather(
+            self._get_json(f"/users/{username}"),
+            self._get_json(
+                f"/users/{username}/repos",
+                {"per_page": 100, "sort": "pushed", "type": "owner"},
+            ),
+            self._get_json(f"/users/{username}/events/public", {"per_page": 100}),
+        )
+        return normalize_profile(user, repos, events)
+
+    async def _get_json(self, path: str, params: Optional[Dict[str, Any]] = None):
+        """GET a resource, revalidating any cached copy with its ETag"""
+        key = f"{path}?{sorted((params or {}).items())}"
+        cached: Optional[Tuple[str, Any]] = self._etags.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else {}
+
+        async with self._semaphore:
+            await self.scheduler.wait()
+            try:
+                response = await self._http.get(path, params=params, headers=headers)
+            except httpx.HTTPError as exc:
+                raise GitHubFetchError(f"GitHub request failed: {exc}") from exc
+        self.requests += 1
+        self.scheduler.update(response.headers)
+
+        if response.status_code == 304 and cached:
+            self.not_modified += 1
+            return cached[1]
+        if response.status_code == 404:
+            raise GitHubNotFoundError(f"GitHub resource not found: {path}")
+        if response.status_code in (403, 429) and self.scheduler.remaining == 0:
+            raise GitHubRateLimitError("GitHub rate limit exhausted")
+        if response.is_error:
+            raise GitHubFetchError(
+                f"GitHub returned {response.status_code} for {path}"
+            )
+
+        data = response.json()
+        etag = response.headers.get("etag")
+        if etag:
+            self._etags.set(key, (etag, data))
+        return data
+
+    def stats(self) -> Dict[str, Any]:
+        """Request, revalidation and quota counters"""
+        return {
+            "requests": self.requests,
+            "not_modified": self.not_modified,
+            "cached_resources": len(self._etags),
+            "rate_limit_remaining": self.scheduler.remaining,
+        }
+
+    async def aclose(self):
+        await self._http.aclose()
+
+
+def normalize_profile(
+    user: Dict[str, Any], repos: list, events: list
+) -> Dict[str, Any]:
+    """
+    Reduce raw GitHub API payloads to the metadata the agent uses
+
+    The display name, location and company are dropped. The bio is kept
+    for skill matching only; the agent leaves it out of the prompt.
+    """
+    now = datetime.now(timezone.utc)
+    recent_cutoff = now - timedelta(days=RECENT_ACTIVITY_DAYS)
+
+    original_repos = [repo for repo in repos if not repo.get("fork")]
+    languages = Counter(
+        repo["language"] for repo in original_repos if repo.get("language")
+    )
+    topics = Counter(
+        topic for repo in original_repos for topic in repo.get("topics") or []
+    )
+    recently_active = [
+        repo
+        for repo in original_repos
+        if repo.get("pushed_at") and _parse_time(repo["pushed_at"]) >= recent_cutoff
+    ]
+    created_at = user.get("created_at")
+    account_age_years = (
+        round((now - _parse_time(created_at)).days / 365.25, 1) if created_at else None
+    )
+
+    return {
+        "username": user.get("login"),
+        "bio": user.get("bio"),
+        "public_repos": user.get("public_repos", len(repos)),
+        "followers": user.get("followers", 0),
+        "account_age_years": account_age_years,
+        "original_repos": len(original_repos),
+        "forked_repos": len(repos) - len(original_repos),
+        "total_stars": sum(repo.get("stargazers_count", 0) for repo in original_repos),
+        "recently_active_repos": len(recently_active),
+        "languages": dict(languages.most_common(10)),
+        "topics": [topic for topic, _ in topics.most_common(15)],
+        "top_repos": [
+            {
+                "name": repo.get("name"),
+                "description": repo.get("description"),
+                "language": repo.get("language"),
+                "stars": repo.get("stargazers_count", 0),
+            }
+            for repo in sorted(
+                original_repos,
+                key=lambda repo: repo.get("stargazers_count", 0),
+                reverse=True,
+            )[:5]
+        ],
+        "recent_events": len(events),
+        "recent_push_events": sum(
+            1 for event in events if event.get("type") == "PushEvent"
+        ),
+    }
+
+
+def _parse_time(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+_fetcher: Optional[GitHubFetcher] = None
+
+
+def init_github_fetcher() -> GitHubFetcher:
+    """Create the shared GitHub fetcher (idempotent)"""
+    global _fetcher
+    if _fetcher is None:
+        _fetcher = GitHubFetcher()
+    return _fetcher
+
+
+def get_github_fetcher() -> GitHubFetcher:
+    """Get the shared GitHub fetcher, creating it outside the app lifespan"""
+    return _fetcher or init_github_fetcher()
+
+
+async def close_github_fetcher():
+    """Close the HTTP pool"""
+    global _fetcher
+    if _fetcher is not None:
+        await _fetcher.aclose()
+        _fetcher = None
@@ -0,0 +1,295 @@
+"""
+LinkedIn Source - Cached, deduplicated profile enrichment
+
+The same LinkedIn profiles are evaluated against many job openings, so
+enriched profiles are stored by normalized URL with a TTL:
+- Memory: per-worker LRU
+- Redis (optional): shared across workers and restarts
+
+Concurrent fetches of one profile are coalesced within a worker, and a
+short Redis lock keeps other workers from fetching it at the same time.
+The store keeps only a compact structured profile, which is all the
+agent's LLM step sees.
+
+Profiles come from an enrichment provider at LINKEDIN_ENRICHMENT_URL,
+called as GET <url>?url=<profile url> and returning Proxycurl-style JSON.
+"""
+
+from datetime import date
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+import asyncio
+import json
+import logging
+import os
+
+import httpx
+
+from app.agents.llm_cache import LRUCache
+from app.agents.singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+LINKEDIN_ENRICHMENT_URL = os.getenv("LINKEDIN_ENRICHMENT_URL")
+LINKEDIN_ENRICHMENT_API_KEY = os.getenv("LINKEDIN_ENRICHMENT_API_KEY")
+LINKEDIN_PROFILE_TTL_SECONDS = float(
+    os.getenv("LINKEDIN_PROFILE_TTL_SECONDS", str(7 * 24 * 3600))
+)
+LINKEDIN_PROFILE_CACHE_SIZE = int(os.getenv("LINKEDIN_PROFILE_CACHE_SIZE", "5000"))
+LINKEDIN_PROFILE_REDIS_URL = os.getenv("LINKEDIN_PROFILE_REDIS_URL")
+LINKEDIN_TIMEOUT_SECONDS = float(os.getenv("LINKEDIN_TIMEOUT_SECONDS", "10"))
+
+# How long a worker waits for another worker's in-flight fetch
+LOCK_TTL_SECONDS = 30
+LOCK_WAIT_SECONDS = 10
+LOCK_POLL_SECONDS = 0.25
+
+# Caps on what is kept from a raw profile
+MAX_POSITIONS = 8
+MAX_SKILLS = 30
+MAX_SUMMARY_CHARS = 600
+
+
+class LinkedInFetchError(Exception):
+    """LinkedIn profile could not be enriched"""
+
+
+def normalize_linkedin_url(url: str) -> Optional[str]:
+    """
+    Canonical key for a LinkedIn profile URL
+
+    "https://www.linkedin.com/in/Jane-Doe/?trk=x" and
+    "uk.linkedin.com/in/jane-doe" both become "linkedin.com/in/jane-doe".
+    """
+    value = url.strip()
+    if "://" not in value:
+        value = f"https://{value}"
+    parsed = urlparse(value)
+    if not parsed.netloc.lower().endswith("linkedin.com"):
+        return None
+    parts = [part for part in parsed.path.lower().split("/") if part]
+    if len(parts) < 2 or parts[0] not in ("in", "pub"):
+        return None
+    return f"linkedin.com/{parts[0]}/{parts[1]}"
+
+
+def compact_profile(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Reduce a raw enrichment payload to what the agent needs
+
+    Names, photos, locations and dates that reveal age (e.g. graduation
+    years) are dropped, which also keeps prompts small.
+    """
+    today = date.today()
+    positions = []
+    total_months = 0
+    for experience in (raw.get("experiences") or [])[:MAX_POSITIONS]:
+        start = experience.get("starts_at") or {}
+        end = experience.get("ends_at") or {}
+        months = None
+        if start.get("year"):
+            end_year = end.get("year") or today.year
+            end_month = end.get("month") or (today.month if not end else 12)
+            months = max(
+                (end_year - start["year"]) * 12 + end_month - (start.get("month") or 1),
+                0,
+            )
+            total_months += months
+        positions.append(
+            {
+                "title": experience.get("title"),
+                "company": experience.get("company"),
+                "years": round(months / 12, 1) if months is not None else None,
+                "current": not end,
+                "description": (experience.get("description") or "")[:300],
+            }
+        )
+
+    return {
+        "headline": raw.get("headline"),
+        "summary": (raw.get("summary") or "")[:MAX_SUMMARY_CHARS],
+        "years_experience": round(total_months / 12, 1),
+        "positions": positions,
+        "skills": list(raw.get("skills") or [])[:MAX_SKILLS],
+        "education": [
+            {
+                "degree": education.get("degree_name"),
+                "field": education.get("field_of_study"),
+            }
+            for education in raw.get("education") or []
+        ],
+        "certifications": [
+            certification.get("name")
+            for certification in raw.get("certifications") or []
+        ],
+        "recommendations": len(raw.get("recommendations") or []),
+    }
+
+
+class LinkedInProfileStore:
+    """
+    Shared store of enriched LinkedIn profiles
+
+    One store (HTTP pool, memory tier, Redis connection) is shared by the
+    process.
+    """
+
+    def __init__(
+        self,
+        enrichment_url: Optional[str] = LINKEDIN_ENRICHMENT_URL,
+        api_key: Optional[str] = LINKEDIN_ENRICHMENT_API_KEY,
+        ttl_seconds: float = LINKEDIN_PROFILE_TTL_SECONDS,
+        cache_size: int = LINKEDIN_PROFILE_CACHE_SIZE,
+        redis_url: Optional[str] = LINKEDIN_PROFILE_REDIS_URL,
+        key_prefix: str = "honeybee:linkedin:",
+    ):
+        self.enrichment_url = enrichment_url
+        self.ttl_seconds = ttl_seconds
+        self.key_prefix = key_prefix
+        headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+        self._http = httpx.AsyncClient(
+            headers=headers, timeout=httpx.Timeout(LINKEDIN_TIMEOUT_SECONDS)
+        )
+        self.memory = LRUCache(cache_size, ttl_seconds)
+        self.redis = None
+        if redis_url:
+            import redis.asyncio as aioredis
+
+            self.redis = aioredis.from_url(redis_url, decode_responses=True)
+        self._fetches = SingleFlight()
+
+        self.memory_hits = 0
+        self.shared_hits = 0
+        self.fetches = 0
+
+    async def get_profile(self, linkedin_url: str) -> Dict[str, Any]:
+        """
+        Compact profile for a LinkedIn URL, fetching it if not stored
+
+        Raises:
+            LinkedInFetchError: If the URL is invalid or enrichment fails
+        """
+        key = normalize_linkedin_url(linkedin_url)
+        if key is None:
+            raise LinkedInFetchError(f"Not a LinkedIn profile URL: {linkedin_url}")
+
+        profile = self.memory.get(key)
+        if profile is not None:
+            self.memory_hits += 1
+            return profile
+        return await self._fetches.do(key, lambda: self._load(key))
+
+    async def _load(self, key: str) -> Dict[str, Any]:
+        """Read through the shared tier, fetching under a cross-worker lock"""
+        profile = await self._shared_get(key)
+        if profile is not None:
+            self.shared_hits += 1
+        else:
+            profile = await self._fetch_once_across_workers(key)
+        self.memory.set(key, profile)
+        return profile
+
+    async def _fetch_once_across_workers(self, key: str) -> Dict[str, Any]:
+        if self.redis is None:
+            return await self._fetch(key)
+
+        lock_key = f"{self.key_prefix}lock:{key}"
+        try:
+            acquired = await self.redis.set(lock_key, "1", nx=True, ex=LOCK_TTL_SECONDS)
+        except Exception as exc:
+            logger.warning("LinkedIn profile store unavailable: %s", exc)
+            return await self._fetch(key)
+
+        if not acquired:
+            # Another worker is fetching this profile; wait for its result
+            waited = 0.0
+            while waited < LOCK_WAIT_SECONDS:
+                await asyncio.sleep(LOCK_POLL_SECONDS)
+                waited += LOCK_POLL_SECONDS
+                profile = await self._shared_get(key)
+                if profile is not None:
+                    self.shared_hits += 1
+                    return profile
+            return await self._fetch(key)
+
+        try:
+            return await self._fetch(key)
+        finally:
+            await self.redis.delete(lock_key)
+
+    async def _fetch(self, key: str) -> Dict[str, Any]:
+        """Call the enrichment provider and store the compact profile"""
+        if not self.enrichment_url:
+            raise LinkedInFetchError("LINKEDIN_ENRICHMENT_URL is not configured")
+        try:
+            response = await self._http.get(
+                self.enrichment_url, params={"url": f"https://www.{key}"}
+            )
+            response.raise_for_status()
+            raw = response.json()
+        except (httpx.HTTPError, ValueError) as exc:
+            raise LinkedInFetchError(f"LinkedIn enrichment failed: {exc}") from exc
+
+        self.fetches += 1
+        profile = compact_profile(raw)
+        await self._shared_set(key, profile)
+        return profile
+
+    async def _shared_get(self, key: str) -> Optional[Dict[str, Any]]:
+        if self.redis is None:
+            return None
+        try:
+            value = await self.redis.get(self.key_prefix + key)
+        except Exception as exc:
+            logger.warning("LinkedIn profile store unavailable: %s", exc)
+            return None
+        return json.loads(value) if value is not None else None
+
+    async def _shared_set(self, key: str, profile: Dict[str, Any]):
+        if self.redis is None:
+            return
+        try:
+            await self.redis.set(
+                self.key_prefix + key, json.dumps(profile), ex=int(self.ttl_seconds)
+            )
+        except Exception as exc:
+            logger.warning("LinkedIn profile store unavailable: %s", exc)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit and fetch counters"""
+        return {
+            "memory_hits": self.memory_hits,
+            "shared_hits": self.shared_hits,
+            "fetches": self.fetches,
+            "coalesced": self._fetches.coalesced,
+            "memory_entries": len(self.memory),
+        }
+
+    async def aclose(self):
+        await self._http.aclose()
+        if self.redis is not None:
+            await self.redis.aclose()
+
+
+_store: Optional[LinkedInProfileStore] = None
+
+
+def init_linkedin_store() -> LinkedInProfileStore:
+    """Create the shared LinkedIn profile store (idempotent)"""
+    global _store
+    if _store is None:
+        _store = LinkedInProfileStore()
+    return _store
+
+
+def get_linkedin_store() -> LinkedInProfileStore:
+    """Get the shared profile store, creating it outside the app lifespan"""
+    return _store or init_linkedin_store()
+
+
+async def close_linkedin_store():
+    """Close the HTTP pool and Redis connection"""
+    global _store
+    if _store is not None:
+        await _store.aclose()
+        _store = None
@@ -0,0 +1,229 @@
+"""
+Resume Source - Streaming resume download and text extraction
+
+Resumes are streamed to disk under a size cap while being hashed, so
+memory stays bounded for large files. PDF/DOCX text extraction is
+CPU-bound and runs in a process pool, off the event loop. Extracted text
+is cached on disk by content hash, so a file is parsed only once across
+candidates and restarts.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+import asyncio
+import hashlib
+import os
+import tempfile
+
+import httpx
+
+from app.agents.singleflight import SingleFlight
+
+RESUME_MAX_BYTES = int(os.getenv("RESUME_MAX_BYTES", str(10 * 1024 * 1024)))
+RESUME_FETCH_TIMEOUT_SECONDS = float(os.getenv("RESUME_FETCH_TIMEOUT_SECONDS", "10"))
+RESUME_CACHE_DIR = os.getenv("RESUME_CACHE_DIR") or os.path.join(
+    tempfile.gettempdir(), "honeybee-resumes"
+)
+RESUME_PARSER_WORKERS = int(
+    os.getenv("RESUME_PARSER_WORKERS", str(os.cpu_count() or 2))
+)
+
+CHUNK_SIZE = 64 * 1024
+
+
+class ResumeFetchError(Exception):
+    """Resume could not be downloaded or parsed"""
+
+
+class ResumeTooLargeError(ResumeFetchError):
+    """Resume exceeds RESUME_MAX_BYTES"""
+
+
+@dataclass
+class ParsedResume:
+    """Extracted resume text and where it came from"""
+
+    text: str
+    format: str
+    content_hash: str
+    size_bytes: int
+    cached: bool
+
+
+def detect_format(head: bytes) -> str:
+    """Detect resume format from the first bytes of the file"""
+    if head.startswith(b"%PDF"):
+        return "pdf"
+    if head.startswith(b"PK\x03\x04"):
+        return "docx"
+    return "txt"
+
+
+def extract_text(path: str, fmt: str) -> str:
+    """
+    Extract plain text from a resume file
+
+    Runs in a worker process; imports stay local so the parsers are only
+    loaded where they are used.
+    """
+    if fmt == "pdf":
+        from pypdf import PdfReader
+
+        reader = PdfReader(path)
+        return "\n".join(page.extract_text() or "" for page in reader.pages)
+    if fmt == "docx":
+        import docx
+
+        document = docx.Document(path)
+        return "\n".join(paragraph.text for paragraph in document.paragraphs)
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        return f.read()
+
+
+class ResumeFetcher:
+    """
+    Downloads resumes and extracts their text
+
+    One fetcher (HTTP pool + process pool) is shared by the process.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = RESUME_CACHE_DIR,
+        max_bytes: int = RESUME_MAX_BYTES,
+        workers: int = RESUME_PARSER_WORKERS,
+        timeout_seconds: float = RESUME_FETCH_TIMEOUT_SECONDS,
+    ):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+
+        self._http = httpx.AsyncClient(
+            timeout=httpx.Timeout(timeout_seconds),
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=10),
+        )
+        self._pool = ProcessPoolExecutor(max_workers=workers)
+        # Concurrent parses of the same file share one extraction
+        self._parses = SingleFlight()
+
+    async def fetch(self, url: str) -> ParsedResume:
+        """
+        Download a resume and return its text
+
+        Raises:
+            ResumeTooLargeError: If the file exceeds max_bytes
+            ResumeFetchError: If the download or extraction fails
+        """
+        path, content_hash, size_bytes, fmt = await self._download(url)
+        cache_path = os.path.join(self.cache_dir, f"{content_hash}.txt")
+        cached = os.path.exists(cache_path)
+        # The shared extraction outlives a cancelled caller, so whichever
+        # download it reads is handed over to it and deleted when it ends
+        handed_over = False
+
+        def extract():
+            nonlocal handed_over
+            handed_over = True
+            return self._extract(path, fmt, cache_path)
+
+        try:
+            if cached:
+                with open(cache_path, "r", encoding="utf-8") as f:
+                    text = f.read()
+            else:
+                text = await self._parses.do(content_hash, extract)
+        finally:
+            if not handed_over:
+                os.unlink(path)
+
+        return ParsedResume(
+            text=text,
+            format=fmt,
+            content_hash=content_hash,
+            size_bytes=size_bytes,
+            cached=cached,
+        )
+
+    async def _download(self, url: str):
+        """Stream a resume to a temp file, hashing it on the way"""
+        digest = hashlib.sha256()
+        size_bytes = 0
+        head = b""
+        fd, path = tempfile.mkstemp(dir=self.cache_dir, suffix=".download")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                async with self._http.stream("GET", url) as response:
+                    response.raise_for_status()
+                    declared = int(response.headers.get("content-length") or 0)
+                    if declared > self.max_bytes:
+                        raise ResumeTooLargeError(f"Resume is {declared} bytes")
+                    async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                        size_bytes += len(chunk)
+                        if size_bytes > self.max_bytes:
+                            raise ResumeTooLargeError(
+                                f"Resume exceeds {self.max_bytes} bytes"
+                            )
+                        if len(head) < 8:
+                            head += chunk[:8]
+                        digest.update(chunk)
+                        f.write(chunk)
+        except httpx.HTTPError as exc:
+            os.unlink(path)
+            raise ResumeFetchError(f"Could not download resume: {exc}") from exc
+        except BaseException:
+            os.unlink(path)
+            raise
+
+        return path, digest.hexdigest(), size_bytes, detect_format(head)
+
+    async def _extract(self, path: str, fmt: str, cache_path: str) -> str:
+        """
+        Extract text in the process pool and cache it by content hash
+
+        Takes ownership of the downloaded file at path and deletes it once
+        extraction finishes.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            text = await loop.run_in_executor(self._pool, extract_text, path, fmt)
+        except Exception as exc:
+            raise ResumeFetchError(f"Could not parse {fmt} resume: {exc}") from exc
+        finally:
+            os.unlink(path)
+
+        # Write-then-rename so other workers never read a partial file
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, cache_path)
+        return text
+
+    async def aclose(self):
+        await self._http.aclose()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+_fetcher: Optional[ResumeFetcher] = None
+
+
+def init_resume_fetcher() -> ResumeFetcher:
+    """Create the shared resume fetcher (idempotent)"""
+    global _fetcher
+    if _fetcher is None:
+        _fetcher = ResumeFetcher()
+    return _fetcher
+
+
+def get_resume_fetcher() -> ResumeFetcher:
+    """Get the shared resume fetcher, creating it outside the app lifespan"""
+    return _fetcher or init_resume_fetcher()
+
+
+async def close_resume_fetcher():
+    """Close the HTTP and process pools"""
+    global _fetcher
+    if _fetcher is not None:
+        await _fetcher.aclose()
+        _fetcher = None
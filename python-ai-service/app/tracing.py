@@ -0,0 +1,140 @@
+"""
+Tracing - Lightweight per-request stage spans
+
+Each HTTP request gets a Trace in a context variable. Code on the hot path
+wraps its stages in span("name"); tasks the request starts inherit the
+context, so concurrent agents record into the same trace. Outside a
+request (no trace) span() does nothing.
+
+Each evaluation records into its own child trace (see child_trace), so
+a batch of candidates or a coalesced evaluation reports only its own
+spans as "timings". Child spans are also merged, prefixed with the
+child's label, into the request trace, and requests slower than
+TRACE_SLOW_REQUEST_MS are logged with every span, sampled at
+TRACE_SLOW_SAMPLE_RATE.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+import json
+import logging
+import os
+import random
+import time
+
+logger = logging.getLogger(__name__)
+
+TRACING_ENABLED = os.getenv("TRACING_ENABLED", "true").lower() == "true"
+TRACE_SLOW_REQUEST_MS = float(os.getenv("TRACE_SLOW_REQUEST_MS", "5000"))
+TRACE_SLOW_SAMPLE_RATE = float(os.getenv("TRACE_SLOW_SAMPLE_RATE", "1.0"))
+
+
+class Trace:
+    """Spans recorded during one request (or part of one), relative to its start"""
+
+    def __init__(self, label: Optional[str] = None, parent: Optional["Trace"] = None):
+        self.started = time.perf_counter()
+        self.label = label
+        self.parent = parent
+        self.spans: List[Dict[str, Any]] = []
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+    def breakdown(self) -> Dict[str, Any]:
+        """Spans ordered by start time, plus time elapsed so far"""
+        return {
+            "total_ms": round(self.elapsed_ms(), 2),
+            "spans": sorted(self.spans, key=lambda span: span["start_ms"]),
+        }
+
+
+_current: ContextVar[Optional[Trace]] = ContextVar("trace", default=None)
+
+
+def current_trace() -> Optional[Trace]:
+    return _current.get()
+
+
+def record_span(name: str, started: float, ended: Optional[float] = None):
+    """Record a stage already timed with time.perf_counter()"""
+    trace = _current.get()
+    ended = time.perf_counter() if ended is None else ended
+    # Into the current trace and, prefixed with each child's label, its parents
+    while trace is not None:
+        trace.spans.append(
+            {
+                "name": name,
+                "start_ms": round((started - trace.started) * 1000, 2),
+                "duration_ms": round((ended - started) * 1000, 2),
+            }
+        )
+        if trace.label:
+            name = f"{trace.label}/{name}"
+        trace = trace.parent
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """Time a stage of the current request (no-op without a trace)"""
+    if _current.get() is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_span(name, started)
+
+
+@contextmanager
+def child_trace(label: str) -> Iterator[Optional[Trace]]:
+    """
+    Record a unit of work (e.g. one evaluation) in its own trace
+
+    Yields the child trace, or None outside a request. Restores the
+    enclosing trace without a context token, so it is safe around yields
+    in async generators.
+    """
+    parent = _current.get()
+    if parent is None:
+        yield None
+        return
+    trace = Trace(label, parent)
+    _current.set(trace)
+    try:
+        yield trace
+    finally:
+        _current.set(parent)
+
+
+class TracingMiddleware:
+    """ASGI middleware that traces each HTTP request, streaming included"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not TRACING_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        trace = Trace()
+        token = _current.set(trace)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current.reset(token)
+            total_ms = trace.elapsed_ms()
+            if (
+                total_ms >= TRACE_SLOW_REQUEST_MS
+                and random.random() < TRACE_SLOW_SAMPLE_RATE
+            ):
+                logger.warning(
+                    "Slow request %s %s took %.0fms: %s",
+                    scope["method"],
+                    scope["path"],
+                    total_ms,
+                    json.dumps(trace.breakdown()["spans"]),
+                )
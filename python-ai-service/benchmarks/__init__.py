@@ -0,0 +1,3 @@
+"""
+Benchmarks - Offline load tests against stub LLM and data sources
+"""
@@ -0,0 +1,112 @@
+"""
+Benchmark Compare - Diff two benchmark result files
+
+Matches results by (workload, concurrency) and prints the change in
+throughput, latency percentiles and peak memory, flagging regressions
+beyond --threshold (default 10%).
+
+Usage:
+    python -m benchmarks.compare BASELINE.json CURRENT.json [--threshold 0.1]
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+import argparse
+import json
+import sys
+
+# metric path -> True when higher is better
+METRICS: List[Tuple[str, bool]] = [
+    ("throughput_eps", True),
+    ("latency_ms.p50", False),
+    ("latency_ms.p95", False),
+    ("latency_ms.p99", False),
+    ("peak_rss_mb", False),
+    ("errors", False),
+]
+
+
+def _value(result: Dict[str, Any], path: str) -> Optional[float]:
+    value: Any = result
+    for key in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def compare(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = 0.1
+) -> List[Dict[str, Any]]:
+    """
+    Per-metric changes between two reports
+
+    Returns:
+        One row per (workload, concurrency, metric) present in both, with
+        the relative change and whether it is a regression
+    """
+    previous = {
+        (result["workload"], result["concurrency"]): result
+        for result in baseline["results"]
+    }
+    rows = []
+    for result in current["results"]:
+        key = (result["workload"], result["concurrency"])
+        if key not in previous:
+            continue
+        for metric, higher_is_better in METRICS:
+            before = _value(previous[key], metric)
+            after = _value(result, metric)
+            if before is None or after is None:
+                continue
+            change = (after - before) / before if before else (1.0 if after else 0.0)
+            worse = -change if higher_is_better else change
+            rows.append(
+                {
+                    "workload": key[0],
+                    "concurrency": key[1],
+                    "metric": metric,
+                    "before": before,
+                    "after": after,
+                    "change": change,
+                    "regression": worse > threshold,
+                }
+            )
+    return rows
+
+
+def print_comparison(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = 0.1
+) -> bool:
+    """Print a comparison table; returns True if anything regressed"""
+    print(
+        f"Baseline {(baseline['git']['commit'] or 'unknown')[:10]} "
+        f"vs {(current['git']['commit'] or 'unknown')[:10]}"
+    )
+    regressed = False
+    for row in compare(baseline, current, threshold):
+        marker = "  REGRESSION" if row["regression"] else ""
+        regressed = regressed or row["regression"]
+        print(
+            f"{row['workload']:>8} c={row['concurrency']:<4} {row['metric']:<16} "
+            f"{row['before']:>10} -> {row['after']:>10} "
+            f"({row['change']:+.1%}){marker}"
+        )
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare two benchmark runs")
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args()
+
+    with open(args.baseline) as handle:
+        baseline = json.load(handle)
+    with open(args.current) as handle:
+        current = json.load(handle)
+    sys.exit(1 if print_comparison(baseline, current, args.threshold) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Benchmark Fixtures - Company, job opening and candidates to evaluate
+
+Swarm decisions reference real candidate and job opening rows, so the
+benchmark seeds its own tenant (ats_provider="benchmark") in the benchmark
+database. Seeding is idempotent: rows are looked up by external_id and only
+missing candidates are inserted, so repeated runs evaluate the same ids.
+The tenant's swarm decisions and capability assessments from earlier runs
+are deleted, so every run starts from the same state.
+"""
+
+from typing import Any, Dict, List
+import asyncio
+
+from sqlalchemy import delete, select
+
+BENCHMARK_PROVIDER = "benchmark"
+
+REQUIRED_SKILLS = ["Python", "PostgreSQL", "Kubernetes", "AWS", "Redis"]
+
+JOB_DESCRIPTION = """About us
+We are a fast-growing company building hiring tools.
+
+Responsibilities
+- Design and operate backend services in Python
+- Own PostgreSQL schemas and query performance
+- Run services on Kubernetes in AWS
+
+Benefits
+Competitive salary, remote-friendly, learning budget.
+
+Equal opportunity employer. We do not discriminate on any protected basis.
+"""
+
+
+async def seed(candidate_count: int) -> Dict[str, Any]:
+    """
+    Ensure the benchmark tenant exists with at least candidate_count
+    candidates, and clear its results from earlier runs
+
+    Returns:
+        {"company_id": ..., "job_opening_id": ..., "candidate_ids": [...],
+        "decisions_deleted": ...}
+    """
+    # Imported here so DATABASE_URL can be set before the engine is created
+    from app.db.database import AsyncSessionLocal
+    from app.db.models import (
+        Candidate,
+        CapabilityAssessment,
+        Company,
+        JobOpening,
+        SwarmDecision,
+    )
+
+    async with AsyncSessionLocal() as session:
+        company = (
+            await session.execute(
+                select(Company).where(Company.ats_provider == BENCHMARK_PROVIDER)
+            )
+        ).scalar_one_or_none()
+        if company is None:
+            company = Company(name="Benchmark Co", ats_provider=BENCHMARK_PROVIDER)
+            session.add(company)
+            await session.flush()
+
+        job = (
+            await session.execute(
+                select(JobOpening).where(
+                    JobOpening.company_id == company.id,
+                    JobOpening.external_id == "benchmark-job",
+                )
+            )
+        ).scalar_one_or_none()
+        if job is None:
+            job = JobOpening(
+                company_id=company.id,
+                title="Senior Backend Engineer",
+                description=JOB_DESCRIPTION,
+                required_skills=REQUIRED_SKILLS,
+                status=1,
+                external_id="benchmark-job",
+                ats_provider=BENCHMARK_PROVIDER,
+            )
+            session.add(job)
+            await session.flush()
+
+        existing = {
+            external_id: candidate_id
+            for candidate_id, external_id in (
+                await session.execute(
+                    select(Candidate.id, Candidate.external_id).where(
+                        Candidate.company_id == company.id
+                    )
+                )
+            ).all()
+        }
+        missing: List[Any] = []
+        for index in range(candidate_count):
+            external_id = f"benchmark-{index}"
+            if external_id not in existing:
+                candidate = Candidate(
+                    company_id=company.id,
+                    name=f"Benchmark Candidate {index}",
+                    email=f"benchmark-{index}@example.com",
+                    resume_data={},
+                    linkedin_url=f"https://www.linkedin.com/in/benchmark-{index}",
+                    github_url=f"https://github.com/benchmark-{index}",
+                    external_id=external_id,
+                    ats_provider=BENCHMARK_PROVIDER,
+                )
+                session.add(candidate)
+                missing.append((external_id, candidate))
+        await session.flush()
+        for external_id, candidate in missing:
+            existing[external_id] = candidate.id
+
+        tenant_candidates = select(Candidate.id).where(
+            Candidate.company_id == company.id
+        )
+        deleted = await session.execute(
+            delete(SwarmDecision).where(
+                SwarmDecision.candidate_id.in_(tenant_candidates)
+            )
+        )
+        await session.execute(
+            delete(CapabilityAssessment).where(
+                CapabilityAssessment.person_type == "Candidate",
+                CapabilityAssessment.person_id.in_(tenant_candidates),
+            )
+        )
+        await session.commit()
+
+        return {
+            "company_id": company.id,
+            "job_opening_id": job.id,
+            "candidate_ids": [
+                existing[f"benchmark-{index}"] for index in range(candidate_count)
+            ],
+            "decisions_deleted": deleted.rowcount,
+        }
+
+
+def seed_sync(candidate_count: int) -> Dict[str, Any]:
+    """Seed from synchronous code and dispose the engine afterwards"""
+    from app.db.database import close_db
+
+    async def run():
+        try:
+            return await seed(candidate_count)
+        finally:
+            await close_db()
+
+    return asyncio.run(run())
@@ -0,0 +1,538 @@
+"""
+Benchmark Runner - Load-test the service against local stubs
+
+Starts the stub server (benchmarks.stub_server) and the FastAPI app under
+uvicorn, seeds benchmark candidates, then drives each workload at each
+concurrency level:
+- evaluate: one POST /api/v1/evaluate per candidate
+- batch: POST /api/v1/evaluate/batch with --batch-size candidates each
+
+For every (workload, concurrency) it reports throughput, p50/p95/p99
+latency, errors, LLM calls per evaluation and the app's peak resident
+memory, and writes all results to benchmarks/results/<time>-<commit>.json
+for comparison with benchmarks.compare.
+
+The app talks to a real PostgreSQL, since the read and persist paths are
+part of what is measured; everything else is stubbed. The database must be
+given explicitly (--database-url or BENCHMARK_DATABASE_URL, never the app's
+DATABASE_URL), because each run deletes the benchmark tenant's decisions.
+
+Usage:
+    export BENCHMARK_DATABASE_URL=postgresql://localhost/honeybee_benchmark
+    python -m benchmarks.run --concurrency 1,8,32 --requests 200
+    python -m benchmarks.run --llm-latency lognormal:1500:0.6 --workers 2
+    python -m benchmarks.run --compare benchmarks/results/<baseline>.json
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+import argparse
+import asyncio
+import json
+import os
+import platform
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import httpx
+import numpy as np
+
+from benchmarks.compare import print_comparison
+from benchmarks.stub_server import parse_latency
+
+SERVICE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(SERVICE_DIR, "benchmarks", "results")
+API_KEY = "benchmark-key"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _git(*args: str) -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", *args],
+            cwd=SERVICE_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _process_tree(pid: int) -> List[int]:
+    """pid and all its descendants (uvicorn workers, resume parsers)"""
+    pids = [pid]
+    for current in pids:
+        try:
+            with open(f"/proc/{current}/task/{current}/children") as handle:
+                pids.extend(int(child) for child in handle.read().split())
+        except OSError:
+            continue
+    return pids
+
+
+def _rss_bytes(pids: List[int]) -> int:
+    total = 0
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/status") as handle:
+                for line in handle:
+                    if line.startswith("VmRSS:"):
+                        total += int(line.split()[1]) * 1024
+                        break
+        except OSError:
+            continue
+    return total
+
+
+class MemorySampler:
+    """Samples the resident memory of a process tree in a background thread"""
+
+    def __init__(self, pid: int, interval: float = 0.2):
+        self.pid = pid
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def current(self) -> int:
+        return _rss_bytes(_process_tree(self.pid))
+
+    def __enter__(self) -> "MemorySampler":
+        self.peak = self.current()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, self.current())
+
+
+class Service:
+    """A uvicorn subprocess with its log file"""
+
+    def __init__(self, name: str, app: str, port: int, env: Dict[str, str], workers=1):
+        self.name = name
+        self.port = port
+        self.url = f"http://127.0.0.1:{port}"
+        self.log_path = os.path.join(
+            tempfile.gettempdir(), f"honeybee-bench-{name}.log"
+        )
+        self._log = open(self.log_path, "w")
+        self.process = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "uvicorn",
+                app,
+                "--host",
+                "127.0.0.1",
+                "--port",
+                str(port),
+                "--workers",
+                str(workers),
+                "--log-level",
+                "warning",
+            ],
+            cwd=SERVICE_DIR,
+            env={**os.environ, **env},
+            stdout=self._log,
+            stderr=subprocess.STDOUT,
+        )
+
+    def wait_ready(self, path: str, timeout: float = 60):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(
+                    f"{self.name} exited with {self.process.returncode}; "
+                    f"see {self.log_path}"
+                )
+            try:
+                if httpx.get(self.url + path, timeout=1).status_code < 500:
+                    return
+            except httpx.TransportError:
+                pass
+            time.sleep(0.2)
+        raise RuntimeError(
+            f"{self.name} did not start in {timeout}s; see {self.log_path}"
+        )
+
+    def stop(self):
+        if self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        self._log.close()
+
+
+def _evaluation(
+    stub_url: str, candidate_id: int, index: int, job_opening_id: int, rerun: bool
+) -> Dict[str, Any]:
+    return {
+        "candidate_id": candidate_id,
+        "resume_url": f"{stub_url}/resumes/benchmark-{index}.txt",
+        "linkedin_url": f"https://www.linkedin.com/in/benchmark-{index}",
+        "github_url": f"https://github.com/benchmark-{index}",
+        "job_opening_id": job_opening_id,
+        "rerun_all_agents": rerun,
+    }
+
+
+async def _drive(
+    client: httpx.AsyncClient,
+    workload: str,
+    payloads: List[Dict[str, Any]],
+    concurrency: int,
+) -> Tuple[List[float], int, int]:
+    """
+    Send payloads with at most `concurrency` in flight
+
+    Returns:
+        Per-request latencies (seconds), evaluations completed, errors
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    for payload in payloads:
+        queue.put_nowait(payload)
+    latencies: List[float] = []
+    completed = 0
+    errors = 0
+
+    async def worker():
+        nonlocal completed, errors
+        while not queue.empty():
+            payload = queue.get_nowait()
+            started = time.perf_counter()
+            try:
+                if workload == "evaluate":
+                    response = await client.post("/api/v1/evaluate", json=payload)
+                    if response.status_code == 200:
+                        completed += 1
+                    else:
+                        errors += 1
+                else:
+                    async with client.stream(
+                        "POST", "/api/v1/evaluate/batch", json=payload
+                    ) as response:
+                        if response.status_code != 200:
+                            errors += len(payload["evaluations"])
+                        else:
+                            async for line in response.aiter_lines():
+                                if not line.strip():
+                                    continue
+                                if "error" in json.loads(line):
+                                    errors += 1
+                                else:
+                                    completed += 1
+            except httpx.HTTPError:
+                errors += (
+                    1 if workload == "evaluate" else len(payload["evaluations"])
+                )
+            latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, completed, errors
+
+
+def _payloads(
+    workload: str,
+    count: int,
+    batch_size: int,
+    fixtures: Dict[str, Any],
+    stub_url: str,
+    offset: int,
+    rerun: bool,
+) -> List[Dict[str, Any]]:
+    candidate_ids = fixtures["candidate_ids"]
+    evaluations = [
+        _evaluation(
+            stub_url,
+            candidate_ids[(offset + index) % len(candidate_ids)],
+            (offset + index) % len(candidate_ids),
+            fixtures["job_opening_id"],
+            rerun,
+        )
+        for index in range(count)
+    ]
+    if workload == "evaluate":
+        return evaluations
+    return [
+        {"evaluations": evaluations[start : start + batch_size]}
+        for start in range(0, len(evaluations), batch_size)
+    ]
+
+
+def _summarize(latencies: List[float]) -> Dict[str, float]:
+    if not latencies:
+        return {}
+    values = np.array(latencies) * 1000
+    return {
+        "p50": round(float(np.percentile(values, 50)), 1),
+        "p95": round(float(np.percentile(values, 95)), 1),
+        "p99": round(float(np.percentile(values, 99)), 1),
+        "mean": round(float(values.mean()), 1),
+        "max": round(float(values.max()), 1),
+    }
+
+
+async def run_workloads(
+    args: argparse.Namespace, app: Service, stub: Service, fixtures: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    results = []
+    offset = 0
+    headers = {"Authorization": f"Bearer {API_KEY}"}
+    limits = httpx.Limits(max_connections=max(args.concurrency) * 2)
+    async with httpx.AsyncClient(
+        base_url=app.url, headers=headers, limits=limits, timeout=args.timeout
+    ) as client:
+        if args.warmup:
+            await _drive(
+                client,
+                "evaluate",
+                _payloads(
+                    "evaluate", args.warmup, 1, fixtures, stub.url, offset, True
+                ),
+                min(args.warmup, 4),
+            )
+            offset += args.warmup
+
+        for workload in args.workloads:
+            for concurrency in args.concurrency:
+                payloads = _payloads(
+                    workload,
+                    args.requests,
+                    args.batch_size,
+                    fixtures,
+                    stub.url,
+                    offset,
+                    not args.reuse_votes,
+                )
+                offset += args.requests
+                llm_before = httpx.get(f"{stub.url}/health").json()["counters"]
+
+                sampler = MemorySampler(app.process.pid)
+                with sampler:
+                    started = time.perf_counter()
+                    latencies, completed, errors = await _drive(
+                        client, workload, payloads, concurrency
+                    )
+                    elapsed = time.perf_counter() - started
+
+                llm_after = httpx.get(f"{stub.url}/health").json()["counters"]
+                llm_calls = llm_after["llm_requests"] - llm_before["llm_requests"]
+                result = {
+                    "workload": workload,
+                    "concurrency": concurrency,
+                    "requests": len(payloads),
+                    "evaluations": completed,
+                    "errors": errors,
+                    "elapsed_seconds": round(elapsed, 2),
+                    "throughput_eps": round(completed / elapsed, 2) if elapsed else 0,
+                    "latency_ms": _summarize(latencies),
+                    "llm_calls_per_evaluation": (
+                        round(llm_calls / completed, 2) if completed else None
+                    ),
+                    "peak_rss_mb": round(sampler.peak / 2**20, 1),
+                    "end_rss_mb": round(sampler.current() / 2**20, 1),
+                }
+                results.append(result)
+                _print_result(result)
+    return results
+
+
+def _print_result(result: Dict[str, Any]):
+    latency = result["latency_ms"]
+    print(
+        f"{result['workload']:>8} c={result['concurrency']:<4} "
+        f"{result['throughput_eps']:>8.2f} eval/s  "
+        f"p50={latency.get('p50', 0):>8.1f}ms  "
+        f"p95={latency.get('p95', 0):>8.1f}ms  "
+        f"p99={latency.get('p99', 0):>8.1f}ms  "
+        f"errors={result['errors']:<4} peak_rss={result['peak_rss_mb']}MB"
+    )
+
+
+def _app_env(args: argparse.Namespace, stub_url: str, scratch: str) -> Dict[str, str]:
+    env = {
+        "ENV": "benchmark",
+        "DATABASE_URL": args.database_url,
+        # Never read from a replica of the app's real database
+        "DATABASE_REPLICA_URL": "",
+        "AI_SERVICE_API_KEY": API_KEY,
+        "OPENAI_API_KEY": "stub",
+        "OPENAI_BASE_URL": f"{stub_url}/v1",
+        "GITHUB_API_URL": f"{stub_url}/github",
+        "LINKEDIN_ENRICHMENT_URL": f"{stub_url}/linkedin",
+        "LLM_HTTP2": "false",
+        "DECISION_WRITER_ENABLED": "false" if args.no_writer else "true",
+        "RESUME_CACHE_DIR": os.path.join(scratch, "resumes"),
+        "VECTOR_INDEX_DIR": os.path.join(scratch, "vectors"),
+        "PREDICTIVE_MODEL_DIR": os.path.join(scratch, "predictive"),
+        "TRACE_SLOW_REQUEST_MS": "600000",
+    }
+    if not args.llm_cache:
+        # Negative max temperature: no call is cacheable
+        env["LLM_CACHE_MAX_TEMPERATURE"] = "-1"
+    if args.workers > 1:
+        metrics_dir = os.path.join(scratch, "prometheus")
+        os.makedirs(metrics_dir, exist_ok=True)
+        env["PROMETHEUS_MULTIPROC_DIR"] = metrics_dir
+    for name in (
+        "LLM_CACHE_REDIS_URL",
+        "LINKEDIN_PROFILE_REDIS_URL",
+        "ADVERSE_IMPACT_REDIS_URL",
+    ):
+        env[name] = os.environ.get(name, "") if args.redis else ""
+    return env
+
+
+def save_results(report: Dict[str, Any], output_dir: str) -> str:
+    os.makedirs(output_dir, exist_ok=True)
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    commit = report["git"]["commit"] or "unknown"
+    path = os.path.join(output_dir, f"{stamp}-{commit[:10]}.json")
+    with open(path, "w") as handle:
+        json.dump(report, handle, indent=2)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the HoneyBee AI service")
+    parser.add_argument(
+        "--database-url",
+        default=os.getenv("BENCHMARK_DATABASE_URL"),
+        help="Database to benchmark against (default: BENCHMARK_DATABASE_URL)",
+    )
+    parser.add_argument("--workloads", default="evaluate,batch")
+    parser.add_argument("--concurrency", default="1,8,32")
+    parser.add_argument(
+        "--requests", type=int, default=200, help="Evaluations per concurrency level"
+    )
+    parser.add_argument("--batch-size", type=int, default=25)
+    parser.add_argument("--candidates", type=int, default=500)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--timeout", type=float, default=120)
+    parser.add_argument("--llm-latency", default="lognormal:800:0.4")
+    parser.add_argument("--source-latency", default="fixed:50")
+    parser.add_argument("--llm-error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--llm-cache", action="store_true", help="Leave the LLM response cache on"
+    )
+    parser.add_argument(
+        "--reuse-votes",
+        action="store_true",
+        help="Allow reuse of stored votes instead of rerunning every agent",
+    )
+    parser.add_argument(
+        "--redis", action="store_true", help="Keep the Redis URLs from the environment"
+    )
+    parser.add_argument(
+        "--no-writer", action="store_true", help="Persist inline, not batched"
+    )
+    parser.add_argument("--output", default=RESULTS_DIR)
+    parser.add_argument("--compare", help="Baseline results file to compare against")
+    args = parser.parse_args()
+    if not args.database_url:
+        parser.error(
+            "--database-url or BENCHMARK_DATABASE_URL is required; the benchmark "
+            "writes to and clears its tenant in that database"
+        )
+    args.workloads = [name.strip() for name in args.workloads.split(",")]
+    args.concurrency = [int(value) for value in args.concurrency.split(",")]
+    for name in args.workloads:
+        if name not in ("evaluate", "batch"):
+            parser.error(f"Unknown workload: {name}")
+    for spec in (args.llm_latency, args.source_latency):
+        try:
+            parse_latency(spec)
+        except ValueError as exc:
+            parser.error(str(exc))
+
+    os.environ["DATABASE_URL"] = args.database_url
+    from benchmarks.fixtures import seed_sync
+
+    fixtures = seed_sync(args.candidates)
+    print(
+        f"Seeded {len(fixtures['candidate_ids'])} candidates "
+        f"for job opening {fixtures['job_opening_id']} "
+        f"(cleared {fixtures['decisions_deleted']} earlier decisions)"
+    )
+
+    scratch = tempfile.mkdtemp(prefix="honeybee-bench-")
+    stub = Service(
+        "stub",
+        "benchmarks.stub_server:app",
+        _free_port(),
+        {
+            "STUB_LLM_LATENCY": args.llm_latency,
+            "STUB_SOURCE_LATENCY": args.source_latency,
+            "STUB_LLM_ERROR_RATE": str(args.llm_error_rate),
+            "STUB_SEED": str(args.seed),
+        },
+    )
+    app = None
+    try:
+        stub.wait_ready("/health")
+        app = Service(
+            "app",
+            "app.main:app",
+            _free_port(),
+            _app_env(args, stub.url, scratch),
+            workers=args.workers,
+        )
+        app.wait_ready("/api/v1/health")
+        startup_rss = _rss_bytes(_process_tree(app.process.pid))
+        results = asyncio.run(run_workloads(args, app, stub, fixtures))
+    finally:
+        if app is not None:
+            app.stop()
+        stub.stop()
+
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git": {
+            "commit": _git("rev-parse", "HEAD"),
+            "dirty": bool(_git("status", "--porcelain", "--", ".")),
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+        },
+        "config": {
+            key: value
+            for key, value in vars(args).items()
+            if key not in ("database_url", "output", "compare")
+        },
+        "startup_rss_mb": round(startup_rss / 2**20, 1),
+        "results": results,
+    }
+    path = save_results(report, args.output)
+    print(f"Results written to {path}")
+
+    if args.compare:
+        with open(args.compare) as handle:
+            print_comparison(json.load(handle), report)
+
+
+if __name__ == "__main__":
+    main()
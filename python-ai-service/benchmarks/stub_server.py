@@ -0,0 +1,303 @@
+"""
+Stub Server - Local stand-ins for the LLM and candidate data sources
+
+One FastAPI app serves everything the swarm calls out to, so benchmarks
+run offline and repeatably:
+- POST /v1/chat/completions    OpenAI-compatible chat completions
+- GET  /github/users/...       GitHub REST API (user, repos, public events)
+- GET  /linkedin?url=...       Proxycurl-style LinkedIn enrichment
+- GET  /resumes/{name}.txt     Plain-text resumes
+
+Responses are derived from a hash of the request, so the same candidate
+always gets the same data and vote. Latency is sampled per request from
+a distribution spec (see parse_latency), configured through environment
+variables because the server runs under uvicorn in its own process:
+
+    STUB_LLM_LATENCY      LLM latency spec (default lognormal:800:0.4)
+    STUB_SOURCE_LATENCY   GitHub/LinkedIn/resume latency (default fixed:50)
+    STUB_LLM_ERROR_RATE   Fraction of LLM calls answered with HTTP 500
+    STUB_SEED             Seed for latency and error sampling
+
+Usage:
+    uvicorn benchmarks.stub_server:app --port 9100
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+import asyncio
+import hashlib
+import json
+import os
+import random
+import time
+
+from fastapi import FastAPI, Header, Request, Response
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+LANGUAGES = ["Python", "Ruby", "Go", "TypeScript", "Rust", "Java", "C++", "Elixir"]
+SKILLS = [
+    "Python",
+    "Ruby on Rails",
+    "PostgreSQL",
+    "React",
+    "Kubernetes",
+    "AWS",
+    "Docker",
+    "GraphQL",
+    "Redis",
+    "Machine Learning",
+    "Terraform",
+    "TypeScript",
+]
+TITLES = [
+    "Software Engineer",
+    "Senior Software Engineer",
+    "Backend Developer",
+    "Platform Engineer",
+    "Data Engineer",
+    "Staff Engineer",
+]
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries"]
+
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    """
+    Build a latency sampler (seconds) from a spec string
+
+    Specs, in milliseconds:
+        fixed:<ms>
+        uniform:<low_ms>:<high_ms>
+        normal:<mean_ms>:<stddev_ms>
+        lognormal:<median_ms>:<sigma>     long right tail, like real LLM APIs
+        exponential:<mean_ms>
+
+    Raises:
+        ValueError: unknown distribution or wrong number of parameters
+    """
+    kind, _, rest = spec.partition(":")
+    params = [float(value) for value in rest.split(":")] if rest else []
+    expected = {"fixed": 1, "uniform": 2, "normal": 2, "lognormal": 2, "exponential": 1}
+    if kind not in expected:
+        raise ValueError(f"Unknown latency distribution: {kind}")
+    if len(params) != expected[kind]:
+        raise ValueError(
+            f"{kind} latency takes {expected[kind]} parameter(s), got {spec!r}"
+        )
+
+    if kind == "fixed":
+        return lambda rng: params[0] / 1000
+    if kind == "uniform":
+        return lambda rng: rng.uniform(params[0], params[1]) / 1000
+    if kind == "normal":
+        return lambda rng: max(rng.gauss(params[0], params[1]), 0.0) / 1000
+    if kind == "lognormal":
+        median_ms, sigma = params
+        return lambda rng: median_ms * rng.lognormvariate(0.0, sigma) / 1000
+    return lambda rng: rng.expovariate(1000 / params[0])
+
+
+LLM_LATENCY_SPEC = os.getenv("STUB_LLM_LATENCY", "lognormal:800:0.4")
+SOURCE_LATENCY_SPEC = os.getenv("STUB_SOURCE_LATENCY", "fixed:50")
+LLM_ERROR_RATE = float(os.getenv("STUB_LLM_ERROR_RATE", "0"))
+
+_rng = random.Random(int(os.getenv("STUB_SEED", "0")))
+_llm_latency = parse_latency(LLM_LATENCY_SPEC)
+_source_latency = parse_latency(SOURCE_LATENCY_SPEC)
+
+app = FastAPI(title="HoneyBee Benchmark Stubs")
+
+counters: Dict[str, int] = {
+    "llm_requests": 0,
+    "llm_errors": 0,
+    "github_requests": 0,
+    "linkedin_requests": 0,
+    "resume_requests": 0,
+}
+
+
+def _digest(value: str) -> int:
+    digest = hashlib.blake2b(value.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def _pick(seed: int, items: List[str], count: int) -> List[str]:
+    rng = random.Random(seed)
+    return rng.sample(items, min(count, len(items)))
+
+
+def _estimate_tokens(text: str) -> int:
+    return max(len(text) // 4, 1)
+
+
+@app.get("/health")
+async def health():
+    return {"status": "ok", "counters": counters}
+
+
+@app.post("/v1/chat/completions")
+async def chat_completions(request: Request):
+    """OpenAI-compatible completion returning a vote JSON object"""
+    counters["llm_requests"] += 1
+    body = await request.json()
+    prompt = "\n".join(
+        str(message.get("content") or "") for message in body.get("messages", [])
+    )
+    await asyncio.sleep(_llm_latency(_rng))
+
+    if LLM_ERROR_RATE and _rng.random() < LLM_ERROR_RATE:
+        counters["llm_errors"] += 1
+        return JSONResponse(
+            status_code=500,
+            content={"error": {"message": "stub error", "type": "server_error"}},
+        )
+
+    seed = _digest(prompt)
+    vote = {
+        "score": round(0.3 + (seed % 600) / 1000, 3),
+        "confidence": round(0.6 + (seed >> 10) % 350 / 1000, 3),
+        "reasoning": (
+            "Stub evaluation: relevant experience and skills for the role, "
+            "with solid project history."
+        ),
+    }
+    content = json.dumps(vote)
+    prompt_tokens = _estimate_tokens(prompt)
+    completion_tokens = _estimate_tokens(content)
+    return {
+        "id": f"chatcmpl-stub-{seed:x}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model", "stub"),
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        },
+    }
+
+
+def _github_response(
+    payload: Any, if_none_match: Optional[str], response: Response
+) -> Any:
+    etag = '"' + hashlib.md5(json.dumps(payload).encode()).hexdigest() + '"'
+    headers = {
+        "ETag": etag,
+        "X-RateLimit-Limit": "5000",
+        "X-RateLimit-Remaining": "4999",
+        "X-RateLimit-Reset": str(int(time.time()) + 3600),
+    }
+    if if_none_match == etag:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return payload
+
+
+@app.get("/github/users/{username}")
+async def github_user(
+    username: str, response: Response, if_none_match: Optional[str] = Header(None)
+):
+    counters["github_requests"] += 1
+    await asyncio.sleep(_source_latency(_rng))
+    seed = _digest(username)
+    user = {
+        "login": username,
+        "name": None,
+        "bio": "Engineer who enjoys distributed systems and developer tooling.",
+        "public_repos": 5 + seed % 40,
+        "followers": seed % 500,
+        "created_at": f"{2010 + seed % 12}-0{1 + seed % 9}-15T00:00:00Z",
+    }
+    return _github_response(user, if_none_match, response)
+
+
+@app.get("/github/users/{username}/repos")
+async def github_repos(
+    username: str, response: Response, if_none_match: Optional[str] = Header(None)
+):
+    counters["github_requests"] += 1
+    await asyncio.sleep(_source_latency(_rng))
+    seed = _digest(username)
+    repos = [
+        {
+            "name": f"project-{index}",
+            "description": f"A {language} project",
+            "language": language,
+            "fork": index % 4 == 3,
+            "stargazers_count": (seed >> index) % 200,
+            "topics": [language.lower(), "tooling"],
+            "pushed_at": f"2026-0{1 + (seed + index) % 9}-01T00:00:00Z",
+        }
+        for index, language in enumerate(_pick(seed, LANGUAGES, 3) * 4)
+    ]
+    return _github_response(repos, if_none_match, response)
+
+
+@app.get("/github/users/{username}/events/public")
+async def github_events(
+    username: str, response: Response, if_none_match: Optional[str] = Header(None)
+):
+    counters["github_requests"] += 1
+    await asyncio.sleep(_source_latency(_rng))
+    seed = _digest(username)
+    events = [
+        {"type": "PushEvent" if index % 3 else "PullRequestEvent", "id": str(index)}
+        for index in range(seed % 60)
+    ]
+    return _github_response(events, if_none_match, response)
+
+
+@app.get("/linkedin")
+async def linkedin_profile(url: str):
+    """Proxycurl-style person profile"""
+    counters["linkedin_requests"] += 1
+    await asyncio.sleep(_source_latency(_rng))
+    seed = _digest(url)
+    experiences = [
+        {
+            "title": TITLES[(seed + index) % len(TITLES)],
+            "company": COMPANIES[(seed >> index) % len(COMPANIES)],
+            "starts_at": {"year": 2024 - 3 * (index + 1), "month": 1 + index},
+            "ends_at": None if index == 0 else {"year": 2024 - 3 * index, "month": 6},
+            "description": "Built and operated backend services at scale.",
+        }
+        for index in range(1 + seed % 4)
+    ]
+    return {
+        "full_name": "Stub Candidate",
+        "headline": TITLES[seed % len(TITLES)],
+        "summary": "Backend engineer focused on reliable, well-tested systems.",
+        "experiences": experiences,
+        "skills": _pick(seed, SKILLS, 6),
+        "education": [
+            {"degree_name": "BSc", "field_of_study": "Computer Science"},
+        ],
+        "certifications": [{"name": "AWS Certified Developer"}] if seed % 2 else [],
+        "recommendations": ["Great teammate."] * (seed % 3),
+    }
+
+
+@app.get("/resumes/{name}.txt")
+async def resume(name: str):
+    counters["resume_requests"] += 1
+    await asyncio.sleep(_source_latency(_rng))
+    seed = _digest(name)
+    skills = ", ".join(_pick(seed, SKILLS, 6))
+    positions = "\n\n".join(
+        f"{TITLES[(seed + index) % len(TITLES)]}, "
+        f"{COMPANIES[(seed >> index) % len(COMPANIES)]}\n"
+        f"- Designed and shipped services handling millions of requests\n"
+        f"- Led migrations, on-call and code review for a team of {3 + index}"
+        for index in range(1 + seed % 4)
+    )
+    text = (
+        f"SUMMARY\nBackend engineer with {2 + seed % 12} years of experience.\n\n"
+        f"SKILLS\n{skills}\n\nEXPERIENCE\n{positions}\n\n"
+        "EDUCATION\nBSc Computer Science\n"
+    )
+    return PlainTextResponse(text)
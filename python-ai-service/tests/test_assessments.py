@@ -0,0 +1,99 @@
+"""
+Tests for capability assessments built from orchestrator results
+"""
+
+from app.agents.base_agent import AgentVote
+from app.agents.orchestrator import SwarmOrchestrator
+from app.db.assessments import assessments_from_result, merge_assessments
+
+SKILL_IDS = {"Python": 1, "PostgreSQL": 2, "Kubernetes": 3, "Go": 4}
+
+
+def _stub_agent(agent, vote: AgentVote):
+    async def evaluate(*args, **kwargs):
+        return vote
+
+    agent.evaluate = evaluate
+
+
+async def _evaluate(skills_by_agent):
+    orchestrator = SwarmOrchestrator()
+    agents = {
+        "resume": orchestrator.resume_agent,
+        "github": orchestrator.github_agent,
+        "linkedin": orchestrator.linkedin_agent,
+    }
+    for key, agent in agents.items():
+        _stub_agent(
+            agent,
+            AgentVote(
+                score=0.8,
+                confidence=0.5,
+                reasoning="stub",
+                metadata={"skills_matched": skills_by_agent.get(key, [])},
+            ),
+        )
+    _stub_agent(
+        orchestrator.predictive_agent,
+        AgentVote(score=0.7, confidence=0.4, reasoning="stub"),
+    )
+    _stub_agent(
+        orchestrator.bias_agent,
+        AgentVote(
+            score=0.95, confidence=0.9, reasoning="stub", metadata={"bias_flags": []}
+        ),
+    )
+    return await orchestrator.evaluate_candidate(
+        candidate_id=42, resume_url="https://example.com/cv.pdf", job_opening_id=None
+    )
+
+
+async def test_assessments_from_orchestrator_result():
+    result = await _evaluate(
+        {
+            "resume": ["Python", "PostgreSQL", "Go"],
+            "github": ["Python", "Go"],
+            "linkedin": ["Python", "Kubernetes"],
+        }
+    )
+
+    rows = {
+        row["skill_id"]: row for row in assessments_from_result(result, SKILL_IDS.get)
+    }
+
+    assert set(rows) == {1, 2, 3, 4}
+    python = rows[1]
+    assert python["person_type"] == "Candidate"
+    assert python["person_id"] == 42
+    assert python["proficiency"] == 2
+    assert python["verified_by"] == "ai_agent"
+    assert python["evidence"]["sources"] == ["github", "linkedin", "resume"]
+    # noisy-or of three 0.5 confidences
+    assert python["confidence_score"] == 0.875
+
+    assert rows[2]["verified_by"] == "resume"
+    assert rows[2]["proficiency"] == 0
+    assert rows[2]["confidence_score"] == 0.5
+    assert rows[3]["verified_by"] == "linkedin"
+    assert rows[4]["evidence"]["sources"] == ["github", "resume"]
+    assert rows[4]["proficiency"] == 1
+
+
+async def test_unknown_skills_and_missing_votes_are_skipped():
+    result = await _evaluate({"resume": ["Python", "COBOL"]})
+
+    rows = assessments_from_result(result, SKILL_IDS.get)
+
+    assert [row["skill_id"] for row in rows] == [1]
+
+
+def test_merge_assessments_keeps_latest_per_skill():
+    rows = [
+        {"person_type": "Candidate", "person_id": 1, "skill_id": 2, "n": 1},
+        {"person_type": "Candidate", "person_id": 1, "skill_id": 1, "n": 2},
+        {"person_type": "Candidate", "person_id": 1, "skill_id": 2, "n": 3},
+    ]
+
+    merged = merge_assessments(rows)
+
+    assert [(row["skill_id"], row["n"]) for row in merged] == [(1, 2), (2, 3)]
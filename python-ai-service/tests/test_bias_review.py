@@ -0,0 +1,92 @@
+"""
+Tests for how bias scan flags are reported around the LLM bias review
+"""
+
+import asyncio
+
+from app.agents.base_agent import AgentVote
+from app.agents.orchestrator import SwarmOrchestrator
+
+BIASED_REASONING = "Strong Python background, but his race may affect team fit."
+
+
+def _stub_evaluate(agent, evaluate):
+    agent.evaluate = evaluate
+
+
+def _orchestrator(**kwargs) -> SwarmOrchestrator:
+    orchestrator = SwarmOrchestrator(**kwargs)
+
+    async def vote(*args, **kwargs):
+        return AgentVote(score=0.8, confidence=0.6, reasoning=BIASED_REASONING)
+
+    for agent in (
+        orchestrator.resume_agent,
+        orchestrator.github_agent,
+        orchestrator.linkedin_agent,
+        orchestrator.predictive_agent,
+    ):
+        _stub_evaluate(agent, vote)
+    return orchestrator
+
+
+async def test_timed_out_review_reports_scan_flags_as_unreviewed():
+    orchestrator = _orchestrator(deadline_seconds=0.3, bias_reserve_seconds=0.2)
+
+    async def hang(*args, **kwargs):
+        await asyncio.sleep(5)
+
+    _stub_evaluate(orchestrator.bias_agent, hang)
+
+    result = await orchestrator.evaluate_candidate(candidate_id=7)
+
+    assert "bias_detection_agent" in result["timed_out_agents"]
+    assert result["bias_flags"] == []
+    categories = {flag["category"] for flag in result["unreviewed_bias_flags"]}
+    assert categories == {"race_ethnicity"}
+    bias_metadata = result["agent_votes"]["bias_detection_agent"]["metadata"]
+    assert bias_metadata["unreviewed_bias_flags"] == result["unreviewed_bias_flags"]
+
+
+async def test_failed_review_reports_scan_flags_as_unreviewed():
+    orchestrator = _orchestrator()
+
+    async def fail(*args, **kwargs):
+        raise RuntimeError("LLM unavailable")
+
+    _stub_evaluate(orchestrator.bias_agent, fail)
+
+    result = await orchestrator.evaluate_candidate(candidate_id=7)
+
+    assert result["bias_flags"] == []
+    assert result["unreviewed_bias_flags"]
+
+
+async def test_completed_review_confirms_flags():
+    orchestrator = _orchestrator()
+
+    async def biased_review(prompt, temperature=0.3):
+        return '{"score": 0.2, "confidence": 0.9, "reasoning": "biased"}', {}
+
+    orchestrator.bias_agent.call_llm_with_usage = biased_review
+
+    result = await orchestrator.evaluate_candidate(candidate_id=7)
+
+    assert {flag["category"] for flag in result["bias_flags"]} == {"race_ethnicity"}
+    assert result["unreviewed_bias_flags"] == []
+
+
+async def test_completed_review_dismisses_incidental_flags():
+    orchestrator = _orchestrator()
+
+    async def clean_review(prompt, temperature=0.3):
+        return '{"score": 0.95, "confidence": 0.9, "reasoning": "incidental"}', {}
+
+    orchestrator.bias_agent.call_llm_with_usage = clean_review
+
+    result = await orchestrator.evaluate_candidate(candidate_id=7)
+
+    assert result["bias_flags"] == []
+    assert result["unreviewed_bias_flags"] == []
+    bias_metadata = result["agent_votes"]["bias_detection_agent"]["metadata"]
+    assert bias_metadata["dismissed_flags"]
@@ -0,0 +1,118 @@
+"""
+Tests for batch consensus matching per-candidate consensus
+"""
+
+import numpy as np
+import pytest
+
+from app.agents.base_agent import AgentVote
+from app.agents.consensus import ConsensusBuilder, votes_to_arrays
+
+AGENTS = ["github", "linkedin", "predictive", "resume"]
+
+# One agent_name -> vote dict per candidate; some agents skipped some candidates
+SLATE = [
+    {
+        "github": {"score": 0.9, "confidence": 0.8},
+        "linkedin": {"score": 0.75, "confidence": 0.6},
+        "predictive": {"score": 0.7, "confidence": 0.5},
+        "resume": {"score": 0.85, "confidence": 0.9},
+    },
+    {
+        "github": {"score": 0.4, "confidence": 0.7},
+        "linkedin": {"score": 0.8, "confidence": 0.3},
+        "resume": {"score": 0.65, "confidence": 0.8},
+    },
+    {
+        "predictive": {"score": 0.2, "confidence": 0.9},
+        "resume": {"score": 0.95, "confidence": 0.0},
+    },
+    {
+        "github": {"score": 0.7, "confidence": 0.0},
+        "linkedin": {"score": 0.69, "confidence": 0.0},
+    },
+    {},
+]
+
+
+def _agent_votes(votes):
+    return {
+        name: AgentVote(reasoning="", **vote) for name, vote in votes.items()
+    }
+
+
+def _row(batch, row):
+    return {
+        key: value[row] if isinstance(value, np.ndarray) else value
+        for key, value in batch.items()
+    }
+
+
+@pytest.mark.parametrize("mechanism", ["weighted_average", "majority", "unanimous"])
+def test_batch_matches_scalar_consensus(mechanism):
+    builder = ConsensusBuilder(mechanism)
+    scores, confidences, mask, _ = votes_to_arrays(SLATE, AGENTS)
+
+    batch = builder.build_batch_consensus(scores, confidences, mask)
+
+    for row, votes in enumerate(SLATE):
+        scalar = builder.build_consensus(_agent_votes(votes))
+        for key, value in scalar.items():
+            assert _row(batch, row)[key] == pytest.approx(value), key
+
+
+@pytest.mark.parametrize("votes", SLATE)
+def test_batch_ranked_choice_of_one_matches_scalar(votes):
+    builder = ConsensusBuilder("ranked_choice")
+    scores, confidences, mask, _ = votes_to_arrays([votes], AGENTS)
+
+    batch = builder.build_batch_consensus(scores, confidences, mask)
+
+    assert _row(batch, 0) == pytest.approx(builder.build_consensus(_agent_votes(votes)))
+
+
+def test_ranked_choice_borda_points():
+    builder = ConsensusBuilder("ranked_choice")
+    scores = np.array([[0.9, 0.2], [0.5, 0.8], [0.1, 0.5]])
+    confidences = np.array([[1.0, 0.5], [1.0, 0.5], [1.0, 0.5]])
+
+    result = builder.build_batch_consensus(scores, confidences)
+
+    # Agent 0 ranks 0, 1, 2; agent 1 ranks 1, 2, 0 at half the weight
+    assert result["overall_score"] == pytest.approx([2 / 3, 2 / 3, 1 / 6], abs=1e-4)
+    assert result["rank"].tolist() == [1, 2, 3]
+
+
+def test_ranked_choice_ties_keep_slate_order():
+    builder = ConsensusBuilder("ranked_choice")
+    scores = np.full((3, 2), 0.8)
+    confidences = np.full((3, 2), 0.6)
+
+    result = builder.build_batch_consensus(scores, confidences)
+
+    assert result["overall_score"].tolist() == [1.0, 0.5, 0.0]
+    assert result["rank"].tolist() == [1, 2, 3]
+
+
+def test_ranked_choice_ignores_zero_confidence_agents():
+    builder = ConsensusBuilder("ranked_choice")
+    # Agent 1 prefers candidate 1 but has no confidence in either ranking
+    scores = np.array([[0.9, 0.1], [0.3, 0.9]])
+    confidences = np.array([[0.7, 0.0], [0.7, 0.0]])
+
+    result = builder.build_batch_consensus(scores, confidences)
+
+    assert result["overall_score"].tolist() == [1.0, 0.0]
+    assert result["rank"].tolist() == [1, 2]
+
+
+def test_ranked_choice_ranks_zero_confidence_candidates_last():
+    builder = ConsensusBuilder("ranked_choice")
+    scores = np.array([[0.95, 0.9], [0.4, 0.3], [0.6, 0.5]])
+    confidences = np.array([[0.0, 0.0], [0.5, 0.5], [0.5, 0.5]])
+
+    result = builder.build_batch_consensus(scores, confidences)
+
+    assert result["overall_score"].tolist() == [0.0, 0.0, 0.5]
+    assert result["rank"].tolist() == [2, 3, 1]
+    assert result["agents_total"].tolist() == [2, 2, 2]
@@ -0,0 +1,95 @@
+"""
+Tests for the decision writer's swarm_decisions and capability_assessments writes
+"""
+
+from datetime import datetime
+
+from app.db.writer import DecisionWriter
+
+SKILL_IDS = {"Python": 1, "PostgreSQL": 2}
+
+
+class FakeSession:
+    """Records the tables written by each statement"""
+
+    def __init__(self, log):
+        self.log = log
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def execute(self, statement):
+        values = statement._multi_values[0]
+        self.log.append((statement.table.name, [dict(row) for row in values]))
+
+    def begin_nested(self):
+        return self
+
+    async def commit(self):
+        self.log.append(("commit", None))
+
+
+def _result(candidate_id: int):
+    vote = {
+        "score": 0.8,
+        "confidence": 0.5,
+        "reasoning": "stub",
+        "metadata": {"skills_matched": ["Python", "PostgreSQL"]},
+        "fingerprint": "f",
+    }
+    return {
+        "candidate_id": candidate_id,
+        "job_opening_id": 3,
+        "agent_votes": {
+            "resume_agent": vote,
+            "github_agent": {**vote, "metadata": {"skills_matched": ["Python"]}},
+            "linkedin_agent": {**vote, "metadata": {}},
+        },
+        "consensus_details": {},
+        "overall_confidence": 0.75,
+        "bias_flags": [],
+        "evaluated_at": datetime(2026, 1, 1),
+    }
+
+
+async def _write(**kwargs):
+    log = []
+    writer = DecisionWriter(
+        session_factory=lambda: FakeSession(log), skill_id=SKILL_IDS.get, **kwargs
+    )
+    await writer.start()
+    await writer.submit(_result(10))
+    await writer.submit(_result(11))
+    await writer.stop()
+    return writer, log
+
+
+async def test_writer_upserts_assessments_without_decisions():
+    writer, log = await _write(write_decisions=False, write_assessments=True)
+
+    tables = [table for table, _ in log]
+    assert tables == ["capability_assessments", "commit"]
+    rows = {(row["person_id"], row["skill_id"]): row for row in log[0][1]}
+    assert set(rows) == {(10, 1), (10, 2), (11, 1), (11, 2)}
+    assert rows[(10, 1)]["verified_by"] == "ai_agent"
+    assert rows[(10, 2)]["verified_by"] == "resume"
+    assert writer.stats()["assessments_written"] == 4
+    assert writer.stats()["rows_written"] == 0
+
+
+async def test_writer_batches_decisions_with_assessments():
+    writer, log = await _write(write_decisions=True, write_assessments=True)
+
+    tables = [table for table, _ in log]
+    assert tables == ["swarm_decisions", "capability_assessments", "commit"]
+    assert [row["candidate_id"] for row in log[0][1]] == [10, 11]
+    assert writer.stats()["rows_written"] == 2
+
+
+async def test_writer_skips_assessments_when_disabled():
+    writer, log = await _write(write_decisions=True, write_assessments=False)
+
+    assert [table for table, _ in log] == ["swarm_decisions", "commit"]
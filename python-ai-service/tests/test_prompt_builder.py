@@ -0,0 +1,193 @@
+"""
+Tests for token-budgeted prompt building and the job context cache
+"""
+
+from types import SimpleNamespace
+
+from app.agents import prompt_builder
+from app.agents.prompt_builder import (
+    Section,
+    SkillRelevance,
+    build_prompt,
+    count_tokens,
+    fit_sections,
+    get_job_context,
+)
+
+REQUIRED_SKILLS = ["Python", "Kubernetes"]
+
+ROLE = "Role: Backend Engineer\nRequired skills: Python, Kubernetes"
+EXPERIENCE = (
+    "Experience\n"
+    "Built Python services on Kubernetes for payments.\n"
+    "Migrated batch jobs from cron to Kubernetes operators.\n"
+    "Mentored two engineers in Python testing practices."
+)
+VOLUNTEER = (
+    "Volunteer\n"
+    "Organised the neighbourhood gardening club and its annual plant sale "
+    "for local families.\n"
+    "Ran the weekend bake stall raising money for the village hall roof "
+    "repairs."
+)
+
+TEMPLATE = "Evaluate the candidate.\n\nJOB:\n{job}\n\nCANDIDATE ({name}):\n{candidate}"
+
+
+def _sections():
+    return [
+        Section("volunteer", VOLUNTEER),
+        Section("experience", EXPERIENCE),
+        Section("role", ROLE, required=True),
+    ]
+
+
+def _cost(chosen):
+    return sum(count_tokens(text) + 2 for text in chosen.values())
+
+
+def test_fit_sections_keeps_required_then_most_relevant_sections():
+    budget = count_tokens(ROLE) + count_tokens(EXPERIENCE) + 4 + 5
+
+    chosen, trimmed = fit_sections(
+        _sections(), budget, SkillRelevance(REQUIRED_SKILLS)
+    )
+
+    assert sorted(chosen) == [1, 2]
+    assert chosen[1] == EXPERIENCE
+    assert trimmed == 0
+    assert _cost(chosen) <= budget
+
+
+def test_fit_sections_trims_leftover_budget_to_the_most_relevant_lines():
+    budget = count_tokens(ROLE) + 2 + 30
+
+    chosen, trimmed = fit_sections(
+        _sections(), budget, SkillRelevance(REQUIRED_SKILLS)
+    )
+
+    assert sorted(chosen) == [1, 2]
+    assert trimmed == 1
+    assert chosen[1].splitlines()[:2] == [
+        "Experience",
+        "Built Python services on Kubernetes for payments.",
+    ]
+    assert chosen[1] != EXPERIENCE
+    assert _cost(chosen) <= budget
+
+
+def test_fit_sections_trims_a_required_section_over_budget():
+    chosen, trimmed = fit_sections(
+        [Section("role", ROLE + "\n" + EXPERIENCE, required=True)],
+        30,
+        SkillRelevance(REQUIRED_SKILLS),
+    )
+
+    assert list(chosen) == [0]
+    assert trimmed == 1
+    assert chosen[0].startswith("Role: Backend Engineer")
+    assert _cost(chosen) <= 30
+
+
+def test_fit_sections_skips_sections_under_the_minimum_size():
+    budget = count_tokens(ROLE) + 2 + prompt_builder.MIN_SECTION_TOKENS - 1
+
+    chosen, trimmed = fit_sections(
+        _sections(), budget, SkillRelevance(REQUIRED_SKILLS)
+    )
+
+    assert list(chosen) == [2]
+    assert trimmed == 0
+
+
+def test_build_prompt_emits_kept_sections_in_document_order():
+    prompt = build_prompt(
+        TEMPLATE,
+        2000,
+        {"job": [Section("role", ROLE, required=True)], "candidate": _sections()[:2]},
+        required_skills=REQUIRED_SKILLS,
+        name="Ada",
+    )
+
+    # Experience ranks above volunteering but still follows it
+    assert prompt.text.index("gardening") < prompt.text.index("Built Python")
+    assert prompt.text.index("JOB:\nRole: Backend Engineer") < prompt.text.index(
+        "CANDIDATE (Ada):\nVolunteer"
+    )
+    assert prompt.sections_kept == 3
+    assert prompt.sections_dropped == 0
+    assert prompt.tokens == count_tokens(prompt.text)
+
+
+def test_build_prompt_drops_the_least_relevant_section_to_fit_the_budget():
+    fixed = count_tokens(TEMPLATE.format(job="", candidate="", name="Ada"))
+    budget = fixed + count_tokens(ROLE) + count_tokens(EXPERIENCE) + 4
+
+    prompt = build_prompt(
+        TEMPLATE,
+        budget,
+        {"job": [Section("role", ROLE, required=True)], "candidate": _sections()[:2]},
+        required_skills=REQUIRED_SKILLS,
+        name="Ada",
+    )
+
+    assert "gardening" not in prompt.text
+    assert EXPERIENCE in prompt.text
+    assert prompt.sections_kept == 2
+    assert prompt.sections_dropped == 1
+    assert prompt.tokens <= budget
+
+
+class FakeJobs:
+    """Read-only session factory counting JobOpening lookups"""
+
+    def __init__(self, jobs):
+        self.jobs = jobs
+        self.lookups = 0
+
+    def __call__(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def get(self, model, job_opening_id):
+        self.lookups += 1
+        return self.jobs.get(job_opening_id)
+
+
+def _install_jobs(monkeypatch, jobs):
+    session_factory = FakeJobs(jobs)
+    monkeypatch.setattr(prompt_builder, "ReadOnlySessionLocal", session_factory)
+    prompt_builder._job_contexts.clear()
+    return session_factory
+
+
+async def test_get_job_context_caches_missing_job_openings(monkeypatch):
+    jobs = _install_jobs(monkeypatch, {})
+
+    assert await get_job_context(404) is None
+    assert await get_job_context(404) is None
+
+    assert jobs.lookups == 1
+
+
+async def test_get_job_context_retries_missing_job_openings_after_ttl(monkeypatch):
+    jobs = _install_jobs(monkeypatch, {})
+    monkeypatch.setattr(prompt_builder, "JOB_CONTEXT_MISSING_TTL_SECONDS", 0.0)
+
+    assert await get_job_context(7) is None
+    jobs.jobs[7] = SimpleNamespace(
+        title="Backend Engineer",
+        required_skills=["Python"],
+        description="",
+    )
+    context = await get_job_context(7)
+
+    assert context.title == "Backend Engineer"
+    assert jobs.lookups == 2
+    assert await get_job_context(7) is context
+    assert jobs.lookups == 2
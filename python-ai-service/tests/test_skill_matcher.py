@@ -0,0 +1,134 @@
+"""
+Tests for skill matching and incremental taxonomy refresh
+"""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from app.agents.skill_matcher import Automaton, SkillMatcher
+
+T0 = datetime(2026, 1, 1, 12, 0, 0)
+
+
+def _automaton(*skills):
+    terms = []
+    for name, *aliases in skills:
+        terms.extend((term, name) for term in (name, *aliases))
+    return Automaton(terms)
+
+
+def test_overlapping_skills_resolve_to_longest_leftmost_match():
+    automaton = _automaton(("React",), ("React Native",), ("Native Apps",))
+
+    counts = automaton.find("Shipped React Native apps and a React dashboard")
+
+    assert counts == {"React Native": 1, "React": 1}
+
+
+def test_prefix_skills_match_only_whole_terms():
+    automaton = _automaton(("Java",), ("JavaScript",), ("C",), ("C++",))
+
+    assert automaton.find("JavaScript and Java") == {"JavaScript": 1, "Java": 1}
+    assert automaton.find("Wrote C++ and some C") == {"C++": 1, "C": 1}
+
+
+def test_skills_match_only_on_word_boundaries():
+    automaton = _automaton(("Go",), ("Node.js",), ("SQL",))
+
+    assert automaton.find("Good at golf, no MySQL") == {}
+    assert automaton.find("Go services, Node.js APIs (SQL).") == {
+        "Go": 1,
+        "Node.js": 1,
+        "SQL": 1,
+    }
+
+
+def test_matching_folds_case_and_whitespace():
+    automaton = _automaton(("Go", "Golang"), ("Machine Learning", "ML"))
+
+    counts = automaton.find("GOLANG, go and machine\n  LEARNING; ml")
+
+    assert counts == {"Go": 2, "Machine Learning": 2}
+
+
+class FakeSkills:
+    """Session factory over in-memory skills rows, applying the updated_at filter"""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def __call__(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, query):
+        clause = query.whereclause
+        rows = [
+            row
+            for row in self.rows
+            if clause is None or clause.operator(row.updated_at, clause.right.value)
+        ]
+        return SimpleNamespace(all=lambda: rows)
+
+    async def scalar(self, query):
+        return len(self.rows)
+
+
+def _skill(skill_id, name, updated_at, aliases=()):
+    return SimpleNamespace(
+        id=skill_id,
+        name=name,
+        metadata_={"aliases": list(aliases)},
+        updated_at=updated_at,
+    )
+
+
+async def test_refresh_picks_up_rows_committed_at_the_last_timestamp():
+    skills = FakeSkills([_skill(1, "Python", T0), _skill(2, "Go", T0)])
+    matcher = SkillMatcher(session_factory=skills)
+    assert await matcher.refresh()
+
+    # Committed after the last refresh, but stamped with the same updated_at;
+    # the row count is unchanged, so only the updated_at filter can see it
+    skills.rows[1] = _skill(2, "Go", T0, aliases=["Golang"])
+    assert await matcher.refresh()
+
+    assert matcher.skills_matched("Python and Golang") == ["Go", "Python"]
+    assert matcher.skill_id("Go") == 2
+
+
+async def test_refresh_picks_up_late_rows_within_the_overlap_window():
+    skills = FakeSkills([_skill(1, "Python", T0), _skill(2, "Go", T0)])
+    matcher = SkillMatcher(session_factory=skills, refresh_overlap_seconds=60)
+    await matcher.refresh()
+
+    skills.rows[1] = _skill(2, "Go", T0 - timedelta(seconds=30), aliases=["Golang"])
+    assert await matcher.refresh()
+
+    assert matcher.find("Golang") == {"Go": 1}
+
+
+async def test_refresh_skips_rebuild_when_overlap_rows_are_unchanged():
+    skills = FakeSkills([_skill(1, "Python", T0), _skill(2, "Go", T0)])
+    matcher = SkillMatcher(session_factory=skills)
+    await matcher.refresh()
+
+    assert not await matcher.refresh()
+    assert matcher.rebuilds == 1
+
+
+async def test_refresh_reloads_after_deletions():
+    skills = FakeSkills([_skill(1, "Python", T0), _skill(2, "Go", T0)])
+    matcher = SkillMatcher(session_factory=skills)
+    await matcher.refresh()
+
+    del skills.rows[1]
+    assert await matcher.refresh()
+
+    assert matcher.find("Python and Go") == {"Python": 1}
+    assert matcher.stats()["skills"] == 1